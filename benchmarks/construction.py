@@ -0,0 +1,59 @@
+"""Compare building ParametrizedJobDetails by model_dump round-trip vs by reference.
+
+Usage: python -m benchmarks.construction [--dids N] [--inputs N] [--sections N]
+"""
+
+import argparse
+import tempfile
+from pathlib import Path
+
+from pydantic import BaseModel
+
+from benchmarks.synthetic import best_of, make_tree
+from oceanprotocol_job_details import ParametrizedJobDetails, load_job_details
+
+
+class Parameters(BaseModel):
+    example: str
+    isTrue: bool
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--dids", type=int, default=100)
+    parser.add_argument("--inputs", type=int, default=10)
+    parser.add_argument("--sections", type=int, default=20)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        config = make_tree(Path(tmp), args.dids, args.sections, args.inputs)
+        job_details = load_job_details(Parameters, config)
+        parameters = Parameters(example="data", isTrue=True)
+
+        # Eagerly validated DDOs, as they were before being read lazily
+        eager = job_details.model_copy(
+            update={"metadata": {did: ddo for did, ddo in job_details.metadata.items()}}
+        )
+
+        round_trip = best_of(
+            lambda: ParametrizedJobDetails(
+                input_parameters=parameters,
+                **eager.model_dump(exclude={"input_type"}),
+            )
+        )
+        by_reference = best_of(
+            lambda: ParametrizedJobDetails.model_construct(
+                input_parameters=parameters,
+                **eager.shared_fields(),
+            )
+        )
+
+    print(f"{'model_dump round-trip':<25} {round_trip * 1000:10.3f} ms")
+    print(
+        f"{'by reference':<25} {by_reference * 1000:10.3f} ms "
+        f"({round_trip / by_reference:.0f}x)"
+    )
+
+
+if __name__ == "__main__":
+    main()
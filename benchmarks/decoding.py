@@ -0,0 +1,77 @@
+"""Compare the text and bytes paths reading a large algoCustomData.json.
+
+The text path is the former read_text().strip() before validating, the bytes
+path validates the file contents as read. Peak memory is measured with
+tracemalloc.
+
+Usage: python -m benchmarks.decoding [--grid N]
+"""
+
+import argparse
+import tempfile
+import tracemalloc
+from pathlib import Path
+from typing import Callable, List
+
+import orjson
+from pydantic import BaseModel
+
+from benchmarks.synthetic import best_of
+from oceanprotocol_job_details.domain import Paths
+from oceanprotocol_job_details.ocean import read_input_parameters
+
+
+class GridParameters(BaseModel):
+    name: str
+    learning_rates: List[float]
+    layers: List[List[int]]
+
+
+def peak_memory(fn: Callable[[], object]) -> int:
+    tracemalloc.start()
+    try:
+        fn()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--grid", type=int, default=200_000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        paths = Paths(Path(tmp))
+        paths.algorithm_custom_parameters.parent.mkdir(parents=True)
+        data = {
+            "name": "grid",
+            "learning_rates": [i / args.grid for i in range(args.grid)],
+            "layers": [[i % 512, 64, 8] for i in range(args.grid)],
+        }
+        paths.algorithm_custom_parameters.write_bytes(
+            b"\n" + orjson.dumps(data) + b"\n"
+        )
+        size = paths.algorithm_custom_parameters.stat().st_size
+        print(f"algoCustomData.json size: {size / 1024 / 1024:.1f} MiB\n")
+
+        def text() -> GridParameters:
+            raw = paths.algorithm_custom_parameters.read_text().strip()
+            return GridParameters.model_validate_json(raw)
+
+        scenarios = {
+            "text": text,
+            "bytes": lambda: read_input_parameters(paths, GridParameters),
+            "bytes strict": lambda: read_input_parameters(paths, GridParameters, True),
+        }
+
+        for name, fn in scenarios.items():
+            took = best_of(fn)
+            peak = peak_memory(fn)
+            print(
+                f"{name:<14} {took * 1000:8.2f} ms {peak / 1024 / 1024:8.1f} MiB peak"
+            )
+
+
+if __name__ == "__main__":
+    main()
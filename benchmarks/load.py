@@ -0,0 +1,160 @@
+"""Time and peak memory of the load helpers across synthetic job sizes.
+
+Usage:
+    python -m benchmarks.load [--quick] [--save | --compare] [--tolerance 0.25]
+
+--save stores the results as the baseline in benchmarks/baselines/load.json,
+--compare fails (exit code 1) when a result is worse than the baseline by more
+than the tolerance. Timings depend on the machine, so save the baseline on the
+same machine the comparisons run on.
+"""
+
+import argparse
+import asyncio
+import sys
+import tempfile
+import tracemalloc
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Dict, List
+
+import orjson
+from pydantic import BaseModel
+
+from benchmarks.synthetic import best_of, make_tree
+from oceanprotocol_job_details import (
+    aload_parametrized_job_details,
+    load_empty_job_details,
+    load_job_details,
+    load_parametrized_job_details,
+)
+
+BASELINE = Path(__file__).parent / "baselines" / "load.json"
+
+
+class Parameters(BaseModel):
+    example: str
+    isTrue: bool
+
+
+@dataclass(frozen=True)
+class Scenario:
+    name: str
+    dids: int
+    sections: int = 1
+    inputs: int = 1
+    quick: bool = False
+
+
+SCENARIOS = [
+    Scenario("1-did", 1, quick=True),
+    Scenario("100-dids", 100, inputs=4, quick=True),
+    Scenario("1000-dids", 1000),
+    Scenario("10-dids-1mb-ddos", 10, sections=180),
+    Scenario("1-did-5mb-ddo", 1, sections=900),
+    Scenario("1-did-5000-inputs", 1, inputs=5000),
+]
+
+
+def _load_all_ddos(config: Dict[str, Any]) -> None:
+    job_details = load_job_details(Parameters, config)
+    for did in job_details.metadata:
+        job_details.metadata[did]
+
+
+FUNCTIONS: Dict[str, Callable[[Dict[str, Any]], object]] = {
+    "load_job_details": lambda config: load_job_details(Parameters, config),
+    "load_job_details+ddos": _load_all_ddos,
+    "load_parametrized_job_details": lambda config: load_parametrized_job_details(
+        Parameters, config
+    ),
+    "aload_parametrized_job_details": lambda config: asyncio.run(
+        aload_parametrized_job_details(Parameters, config)
+    ),
+    "load_empty_job_details": load_empty_job_details,
+}
+
+
+def peak_memory(fn: Callable[[], object]) -> int:
+    tracemalloc.start()
+    try:
+        fn()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def run(quick: bool) -> Dict[str, Dict[str, float]]:
+    results: Dict[str, Dict[str, float]] = {}
+
+    for scenario in SCENARIOS:
+        if quick and not scenario.quick:
+            continue
+
+        with tempfile.TemporaryDirectory() as tmp:
+            config = make_tree(
+                Path(tmp), scenario.dids, scenario.sections, scenario.inputs
+            )
+            for name, fn in FUNCTIONS.items():
+                key = f"{scenario.name}/{name}"
+                results[key] = {
+                    "seconds": best_of(lambda: fn(config), repeat=3),
+                    "peak_bytes": peak_memory(lambda: fn(config)),
+                }
+                print(
+                    f"{key:<60} {results[key]['seconds'] * 1000:10.2f} ms "
+                    f"{results[key]['peak_bytes'] / 1024:10.0f} KiB"
+                )
+
+    return results
+
+
+def compare(
+    results: Dict[str, Dict[str, float]],
+    baseline: Dict[str, Dict[str, float]],
+    tolerance: float,
+) -> List[str]:
+    regressions = []
+    for key, result in results.items():
+        for metric, value in result.items():
+            expected = baseline.get(key, {}).get(metric)
+            if expected and value > expected * (1 + tolerance):
+                regressions.append(
+                    f"{key} {metric}: {value:.6g} > {expected:.6g} "
+                    f"(+{(value / expected - 1) * 100:.0f}%)"
+                )
+    return regressions
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description=__doc__,
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    parser.add_argument("--quick", action="store_true", help="small scenarios only")
+    mode = parser.add_mutually_exclusive_group()
+    mode.add_argument("--save", action="store_true", help="save as the baseline")
+    mode.add_argument("--compare", action="store_true", help="compare to baseline")
+    parser.add_argument("--tolerance", type=float, default=0.25)
+    parser.add_argument("--baseline", type=Path, default=BASELINE)
+    args = parser.parse_args()
+
+    results = run(args.quick)
+
+    if args.save:
+        args.baseline.write_bytes(
+            orjson.dumps(results, option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS)
+        )
+    elif args.compare:
+        regressions = compare(
+            results, orjson.loads(args.baseline.read_bytes()), args.tolerance
+        )
+        for regression in regressions:
+            print(f"REGRESSION {regression}", file=sys.stderr)
+        return 1 if regressions else 0
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
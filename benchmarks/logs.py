@@ -0,0 +1,84 @@
+"""Measure the time spent in the logging calls of a hot loop.
+
+Compares a synchronous logging.FileHandler with the queued JSON lines logging,
+which formats and writes the records in a background thread.
+
+Usage: python -m benchmarks.logs [--records N]
+"""
+
+import argparse
+import logging
+import tempfile
+import time
+from pathlib import Path
+from typing import Callable
+
+from oceanprotocol_job_details.logs import close_json_logging, json_logging
+
+
+def log_loop(logger: logging.Logger, records: int) -> float:
+    start = time.perf_counter()
+    for i in range(records):
+        logger.info("processed row %d", i, extra={"did": "did:op:0"})
+    return time.perf_counter() - start
+
+
+def measure(
+    setup: Callable[[logging.Logger], Callable[[], None]], records: int
+) -> float:
+    logger = logging.getLogger("benchmarks.logs")
+    logger.setLevel(logging.INFO)
+    logger.propagate = False
+    teardown = setup(logger)
+    try:
+        return log_loop(logger, records)
+    finally:
+        teardown()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--records", type=int, default=100_000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        logs = Path(tmp)
+
+        def file_handler(logger: logging.Logger) -> Callable[[], None]:
+            handler = logging.FileHandler(logs / "job.log")
+            handler.setFormatter(
+                logging.Formatter("%(asctime)s %(levelname)s %(message)s")
+            )
+            logger.addHandler(handler)
+
+            def teardown() -> None:
+                logger.removeHandler(handler)
+                handler.close()
+
+            return teardown
+
+        def queued(policy: str) -> Callable[[logging.Logger], Callable[[], None]]:
+            def setup(logger: logging.Logger) -> Callable[[], None]:
+                json_logging(
+                    logger,
+                    logs / f"{policy}.jsonl",
+                    queue_size=args.records,
+                    policy=policy,  # type: ignore[arg-type]
+                )
+                return close_json_logging
+
+            return setup
+
+        timings = {
+            "FileHandler": measure(file_handler, args.records),
+            "JSON lines, queued": measure(queued("block"), args.records),
+        }
+
+    print(f"{args.records} records, time spent in the logging calls")
+    baseline = timings["FileHandler"]
+    for name, seconds in timings.items():
+        print(f"{name:<28} {seconds:8.3f} s  ({baseline / seconds:.2f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+"""Measure writing a gzip compressed result while computing the next records.
+
+Compares writing each record straight to a gzip file with the buffered
+OutputWriter, inline and with the compression in its background thread. The
+computation is simulated with hashing, which releases the GIL like NumPy does.
+
+Usage: python -m benchmarks.outputs [--records N] [--record-bytes B]
+"""
+
+import argparse
+import gzip
+import hashlib
+import tempfile
+from pathlib import Path
+from typing import Callable
+
+from benchmarks.synthetic import best_of
+from oceanprotocol_job_details.outputs import OutputWriter
+
+
+def compute(i: int, record_bytes: int) -> bytes:
+    digest = hashlib.sha256(i.to_bytes(8, "little") * (record_bytes // 8)).hexdigest()
+    return (digest * (record_bytes // len(digest) + 1))[:record_bytes].encode()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--records", type=int, default=2_000)
+    parser.add_argument("--record-bytes", type=int, default=16 * 1024)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "results.gz"
+
+        def direct() -> None:
+            with gzip.open(path, "wb") as f:
+                for i in range(args.records):
+                    f.write(compute(i, args.record_bytes))
+
+        def writer(background: bool) -> Callable[[], None]:
+            def run() -> None:
+                with OutputWriter(path, "gzip", background=background) as f:
+                    for i in range(args.records):
+                        f.write(compute(i, args.record_bytes))
+
+            return run
+
+        compute_only = best_of(
+            lambda: [compute(i, args.record_bytes) for i in range(args.records)],
+            repeat=3,
+        )
+        timings = {
+            "gzip.open": best_of(direct, repeat=3),
+            "OutputWriter inline": best_of(writer(False), repeat=3),
+            "OutputWriter background": best_of(writer(True), repeat=3),
+        }
+
+    mib = args.records * args.record_bytes / 1024 / 1024
+    print(f"{args.records} records, {mib:.0f} MiB, compute alone {compute_only:.3f} s")
+    baseline = timings["gzip.open"]
+    for name, seconds in timings.items():
+        print(f"{name:<28} {seconds:8.3f} s  ({baseline / seconds:.2f}x)")
+
+
+if __name__ == "__main__":
+    main()
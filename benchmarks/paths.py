@@ -0,0 +1,85 @@
+"""Measure the memory held by the input index of a DID with many input files.
+
+Compares the compact index (names sharing their directory Path) with the
+former representation (a full Path per file, listed twice), and the access of
+derived Paths attributes with building them on each access.
+
+Usage: python -m benchmarks.paths [--files N]
+"""
+
+import argparse
+import gc
+import os
+import tempfile
+import tracemalloc
+from pathlib import Path
+from typing import Callable, List, NamedTuple, Tuple
+
+from benchmarks.synthetic import best_of
+from oceanprotocol_job_details.domain import Paths
+from oceanprotocol_job_details.scan import index_inputs
+
+
+class LegacyInputFile(NamedTuple):
+    path: Path
+    size: int
+    mtime_ns: int
+    order: int | None
+
+
+def legacy_index(directory: Path) -> Tuple[List[Path], Tuple[LegacyInputFile, ...]]:
+    with os.scandir(directory) as it:
+        index = []
+        for entry in it:
+            stat = entry.stat()
+            order = int(entry.name) if entry.name.isdecimal() else None
+            path = Path(entry.path)
+            index.append(LegacyInputFile(path, stat.st_size, stat.st_mtime_ns, order))
+    return [file.path for file in index], tuple(index)
+
+
+def retained(build: Callable[[], object]) -> int:
+    """Bytes still allocated by build() while its result is alive"""
+
+    gc.collect()
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        result = build()
+        after = tracemalloc.get_traced_memory()[0]
+        del result
+        return after - before
+    finally:
+        tracemalloc.stop()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--files", type=int, default=100_000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        paths = Paths(Path(tmp))
+        directory = paths.inputs / "did"
+        directory.mkdir(parents=True)
+        for i in range(args.files):
+            (directory / str(i)).touch()
+
+        compact = retained(lambda: index_inputs(directory))
+        legacy = retained(lambda: legacy_index(directory))
+
+    mib = 1024 * 1024
+    print(f"{args.files} input files")
+    print(f"{'compact index':<28} {compact / mib:8.1f} MiB")
+    print(f"{'Path per file':<28} {legacy / mib:8.1f} MiB  ({legacy / compact:.1f}x)")
+
+    cached = best_of(lambda: paths.algorithm_custom_parameters, number=100_000)
+    built = best_of(
+        lambda: paths.base_dir / "inputs" / "algoCustomData.json", number=100_000
+    )
+    print(f"\n{'cached derived path':<28} {cached * 1e9:8.1f} ns")
+    print(f"{'built on each access':<28} {built * 1e9:8.1f} ns")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+"""Compare serial and process pool validation of every DDO of a job.
+
+The scenarios run from the smallest to the largest job, and the first one where
+the process pool is faster is reported as the crossover. The first process pool
+load of each run starts the workers, reported apart.
+
+Usage: python -m benchmarks.process [--workers N]
+"""
+
+import argparse
+import os
+import tempfile
+from pathlib import Path
+
+from benchmarks.synthetic import best_of, make_tree
+from oceanprotocol_job_details.executors import process_pool
+from oceanprotocol_job_details.helpers import load_job_details
+
+# DIDs and sections of each DDO, by growing total DDO contents
+SCENARIOS = [
+    (8, 1),
+    (64, 1),
+    (8, 100),
+    (256, 10),
+    (64, 100),
+    (16, 1000),
+    (64, 1000),
+    (256, 1000),
+]
+
+
+def load_all(config: dict, fields: list[str] | None) -> None:
+    job_details = load_job_details(None, config, ddo_fields=fields)
+    for did in job_details.metadata:
+        job_details.metadata[did]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--workers", type=int, default=os.cpu_count())
+    parser.add_argument("--fields", nargs="*", default=None)
+    args = parser.parse_args()
+
+    start = best_of(lambda: process_pool(args.workers).submit(int).result(), 1)
+    print(f"workers: {args.workers}, pool start: {start * 1000:.2f} ms\n")
+    print(f"{'dids':>6} {'sections':>9} {'serial':>12} {'process':>12}")
+
+    crossover = None
+    for dids, sections in SCENARIOS:
+        with tempfile.TemporaryDirectory() as tmp:
+            config = make_tree(Path(tmp), dids=dids, sections=sections)
+            pooled = {**config, "ddo_executor": "process", "ddo_workers": args.workers}
+
+            serial = best_of(lambda: load_all(config, args.fields), repeat=3)
+            process = best_of(lambda: load_all(pooled, args.fields), repeat=3)
+
+        print(
+            f"{dids:>6} {sections:>9} {serial * 1000:>9.2f} ms {process * 1000:>9.2f} ms"
+            f"  ({serial / process:.1f}x)"
+        )
+        if crossover is None and process < serial:
+            crossover = (dids, sections)
+
+    if crossover is None:
+        print(
+            f"\nThe process pool did not win in any scenario with {args.workers} workers"
+        )
+    else:
+        dids, sections = crossover
+        print(
+            f"\nThe process pool wins from {dids} DIDs of {sections} sections, "
+            f"with {args.workers} workers"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,38 @@
+"""Compare full and projected validation of a large DDO.
+
+Usage: python -m benchmarks.projection [--sections N]
+"""
+
+import argparse
+
+from benchmarks.synthetic import best_of, make_ddo_bytes
+from oceanprotocol_job_details.domain import DDO
+from oceanprotocol_job_details.domain.projection import projection
+
+FIELD_SETS = [
+    ["metadata.name"],
+    ["metadata.name", "services.files"],
+    ["metadata", "services"],
+]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sections", type=int, default=2000)
+    parser.add_argument("--number", type=int, default=5)
+    args = parser.parse_args()
+
+    raw = make_ddo_bytes(sections=args.sections)
+    print(f"DDO size: {len(raw) / 1024:.0f} KiB")
+
+    full = best_of(lambda: DDO.model_validate_json(raw), number=args.number)
+    print(f"{'full':<40} {full * 1000:8.2f} ms")
+
+    for fields in FIELD_SETS:
+        model = projection(DDO, fields)
+        took = best_of(lambda: model.model_validate_json(raw), number=args.number)
+        print(f"{', '.join(fields):<40} {took * 1000:8.2f} ms  ({full / took:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+"""Synthetic Ocean Protocol data shared by the benchmarks."""
+
+import copy
+import timeit
+from pathlib import Path
+from typing import Any, Callable, Dict
+
+import orjson
+
+TEMPLATE = (
+    Path(__file__).parent.parent
+    / "_data"
+    / "ddos"
+    / "17feb697190d9f5912e064307006c06019c766d35e4e3f239ebb69fb71096e42"
+)
+
+
+def make_ddo(did: str = "did:op:0", sections: int = 1) -> Dict[str, Any]:
+    """Build a DDO from the fixture, repeating the list sections to grow it."""
+
+    ddo = orjson.loads(TEMPLATE.read_bytes())
+    ddo["id"] = did
+    for key in ("services", "datatokens"):
+        ddo[key] = [copy.deepcopy(ddo[key][0]) for _ in range(sections)]
+    for key in ("allow", "deny"):
+        ddo["credentials"][key] = [
+            {"type": "address", "values": [f"0x{i:040x}" for i in range(16)]}
+            for _ in range(sections)
+        ]
+    return ddo
+
+
+def make_ddo_bytes(did: str = "did:op:0", sections: int = 1) -> bytes:
+    return orjson.dumps(make_ddo(did, sections))
+
+
+def best_of(fn: Callable[[], object], repeat: int = 5, number: int = 1) -> float:
+    """Best wall time in seconds of a single fn() call."""
+
+    return min(timeit.repeat(fn, repeat=repeat, number=number)) / number
+
+
+def make_tree(
+    root: Path,
+    dids: int = 1,
+    sections: int = 1,
+    inputs: int = 1,
+    input_size: int = 1024,
+) -> Dict[str, Any]:
+    """Write a synthetic /data tree and return the config to load it."""
+
+    names = [f"{i:064x}" for i in range(dids)]
+    (root / "ddos").mkdir(parents=True)
+    (root / "outputs").mkdir()
+    (root / "logs").mkdir()
+
+    for did in names:
+        (root / "ddos" / did).write_bytes(make_ddo_bytes(f"did:op:{did}", sections))
+        input_dir = root / "inputs" / did
+        input_dir.mkdir(parents=True)
+        for i in range(inputs):
+            (input_dir / str(i)).write_bytes(b"x" * input_size)
+
+    (root / "inputs" / "algoCustomData.json").write_bytes(
+        orjson.dumps({"example": "data", "isTrue": True})
+    )
+    return {
+        "base_dir": str(root),
+        "dids": orjson.dumps(names).decode(),
+        "transformation_did": "benchmark",
+    }
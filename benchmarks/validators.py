@@ -0,0 +1,90 @@
+"""Measure the validation of algoCustomData.json repeated in one process.
+
+Compares the model's own model_validate_json with the cached, prebuilt
+TypeAdapter, on every parse and on the first parse of a model deferring its
+schema build (defer_build), when the job details loader already warmed it up.
+
+Usage: python -m benchmarks.validators [--fields N] [--parses N]
+"""
+
+import argparse
+import time
+from typing import Dict, Optional
+
+import orjson
+from pydantic import BaseModel, ConfigDict, create_model
+
+from benchmarks.synthetic import best_of
+from oceanprotocol_job_details.validators import input_validator, warm_up
+
+
+class Layer(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    name: str
+    units: int
+    options: Dict[str, float] = {}
+
+
+def make_parameters(index: int, fields: int) -> type[BaseModel]:
+    return create_model(  # type: ignore[call-overload, no-any-return]
+        f"Parameters{index}",
+        __config__=ConfigDict(defer_build=True),
+        **{f"layer{i}": (Optional[Layer], None) for i in range(fields)},
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--fields", type=int, default=50)
+    parser.add_argument("--parses", type=int, default=10_000)
+    args = parser.parse_args()
+
+    raw = orjson.dumps(
+        {f"layer{i}": {"name": str(i), "units": i} for i in range(args.fields)}
+    )
+
+    def first_parse(warmed: bool, repeat: int = 20) -> float:
+        timings = []
+        for index in range(repeat):
+            model = make_parameters(index + (repeat if warmed else 0), args.fields)
+            if warmed:
+                warm_up(model)
+                start = time.perf_counter()
+                input_validator(model).validate_json(raw)
+            else:
+                start = time.perf_counter()
+                model.model_validate_json(raw)
+            timings.append(time.perf_counter() - start)
+        return min(timings)
+
+    model = make_parameters(-1, args.fields)
+    adapter = input_validator(model)
+    every = {
+        "model_validate_json": best_of(
+            lambda: model.model_validate_json(raw), number=args.parses
+        ),
+        "cached TypeAdapter": best_of(
+            lambda: adapter.validate_json(raw), number=args.parses
+        ),
+    }
+    first = {
+        "model_validate_json": first_parse(warmed=False),
+        "cached TypeAdapter": first_parse(warmed=True),
+    }
+
+    print(f"{args.fields} nested fields, {len(raw)} bytes")
+    for title, timings, unit, scale in (
+        ("each parse", every, "us", 1e6),
+        ("first parse", first, "ms", 1e3),
+    ):
+        baseline = timings["model_validate_json"]
+        print(f"\n{title}")
+        for name, seconds in timings.items():
+            print(
+                f"{name:<28} {seconds * scale:8.2f} {unit}  ({baseline / seconds:.2f}x)"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,14 +1,39 @@
-from .executors import run_in_executor
-from .helpers import (
-    EmptyInputParameters,
-    aload_parametrized_job_details,
-    create_container,
-    load_empty_job_details,
-    load_job_details,
-    load_parametrized_job_details,
-)
-from .ocean import EmptyJobDetails, JobDetails, ParametrizedJobDetails
-from .plugins import inject, register
+from importlib import import_module
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:  # pragma: no cover
+    from .executors import run_in_executor
+    from .helpers import (
+        EmptyInputParameters,
+        aload_job_details,
+        aload_parametrized_job_details,
+        create_container,
+        load_empty_job_details,
+        load_job_details,
+        load_parametrized_job_details,
+    )
+    from .ocean import EmptyJobDetails, JobDetails, ParametrizedJobDetails
+    from .plugins import inject, register
+    from .session import JobDetailsSession
+
+# Exports are imported on first access, so that importing the package does not
+# pull in pydantic-settings, dependency-injector and the loaders until used
+_EXPORTS = {
+    "JobDetails": ".ocean",
+    "ParametrizedJobDetails": ".ocean",
+    "EmptyJobDetails": ".ocean",
+    "EmptyInputParameters": ".helpers",
+    "load_job_details": ".helpers",
+    "load_empty_job_details": ".helpers",
+    "load_parametrized_job_details": ".helpers",
+    "aload_job_details": ".helpers",
+    "aload_parametrized_job_details": ".helpers",
+    "create_container": ".helpers",
+    "JobDetailsSession": ".session",
+    "run_in_executor": ".executors",
+    "register": ".plugins",
+    "inject": ".plugins",
+}
 
 __all__ = [
     "JobDetails",
@@ -18,9 +43,26 @@ __all__ = [
     "load_job_details",
     "load_empty_job_details",
     "load_parametrized_job_details",
+    "aload_job_details",
     "aload_parametrized_job_details",
     "create_container",
+    "JobDetailsSession",
     "run_in_executor",
     "register",
     "inject",
 ]
+
+
+def __getattr__(name: str) -> object:
+    try:
+        module = _EXPORTS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+
+    value = getattr(import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted([*globals(), *__all__])
@@ -0,0 +1,103 @@
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from contextlib import contextmanager
+from importlib import import_module
+from typing import TYPE_CHECKING, Dict, Iterator, List, Sequence
+
+if TYPE_CHECKING:  # pragma: no cover
+    from pydantic import JsonValue
+
+
+@contextmanager
+def _timed(timings: List[tuple[str, float]], phase: str) -> Iterator[None]:
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        timings.append((phase, time.perf_counter() - start))
+
+
+def profile_startup(config: Dict[str, JsonValue]) -> List[tuple[str, float]]:
+    """Time the import and each load phase of the job details from a config.
+
+    Returns:
+        List[tuple[str, float]]: Name and wall time in seconds of each phase.
+    """
+
+    timings: List[tuple[str, float]] = []
+
+    with _timed(timings, "import"):
+        helpers = import_module("oceanprotocol_job_details.helpers")
+        ocean = import_module("oceanprotocol_job_details.ocean")
+
+    # Accepts any input parameters, the algorithm's own type is unknown here
+    pydantic = import_module("pydantic")
+    parameters = pydantic.create_model(
+        "InputParameters",
+        __config__=pydantic.ConfigDict(extra="allow"),
+    )
+
+    with _timed(timings, "settings"):
+        container = helpers.create_container(config)
+
+    with _timed(timings, "files"):
+        container.files()
+
+    with _timed(timings, "job details"):
+        job_details = container.job_details_loader(input_type=None).load()
+
+    with _timed(timings, "ddos"):
+        for did in job_details.metadata:
+            job_details.metadata[did]
+
+    with _timed(timings, "input parameters"):
+        ocean.read_input_parameters(job_details.paths, parameters)
+
+    return timings
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m oceanprotocol_job_details",
+        description="OceanProtocol job details utilities",
+    )
+    parser.add_argument(
+        "--profile-startup",
+        action="store_true",
+        help="report the import and load phase timings for a job",
+    )
+    parser.add_argument("--base-dir", help="job data directory (BASE_DIR)")
+    parser.add_argument("--dids", help="JSON list of input DIDs (DIDS)")
+    parser.add_argument(
+        "--transformation-did",
+        help="algorithm DID (TRANSFORMATION_DID)",
+    )
+    args = parser.parse_args(argv)
+
+    if not args.profile_startup:
+        parser.print_help()
+        return 1
+
+    # Missing values are read from the environment by the settings
+    config: Dict[str, JsonValue] = {
+        key: value
+        for key, value in {
+            "base_dir": args.base_dir,
+            "dids": args.dids,
+            "transformation_did": args.transformation_did,
+        }.items()
+        if value is not None
+    }
+
+    timings = profile_startup(config)
+    for phase, took in timings:
+        print(f"{phase:<20} {took * 1000:10.2f} ms")
+    print(f"{'total':<20} {sum(took for _, took in timings) * 1000:10.2f} ms")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,123 @@
+import hashlib
+import marshal
+import os
+import sys
+import tempfile
+from dataclasses import dataclass, field
+from logging import getLogger
+from pathlib import Path
+from typing import TypeVar
+
+from pydantic import BaseModel
+
+from oceanprotocol_job_details.construct import construct
+
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
+_SUFFIX = ".ddo"
+
+# Version of the entries contents, part of their key
+_FORMAT = 2
+
+logger = getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class DDOCache:
+    """On-disk cache of validated DDOs, keyed by DID and DDO file size and mtime.
+
+    Entries store the validated DDO contents as marshal data, which loads without
+    any JSON parsing and is rebuilt into a DDO without validating it again. The
+    least recently used entries are evicted once the directory grows over
+    max_bytes.
+    """
+
+    directory: Path
+    """Directory holding the cache entries"""
+
+    max_bytes: int = 256 * 1024 * 1024
+    """Maximum total size of the cache entries"""
+
+    _total: int | None = field(default=None, init=False, repr=False, compare=False)
+    """Size of the entries, counted from a scan of the directory plus the entries
+    stored since. Entries stored by other processes are only counted by the next
+    scan, when evicting."""
+
+    def __post_init__(self) -> None:
+        assert self.max_bytes > 0, "Cache size must be positive"
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+    def key(self, did: str, path: Path) -> str:
+        """Key of the current contents of a DDO file, without reading it"""
+
+        stat = path.stat()
+        version = f"{sys.version_info[0]}.{sys.version_info[1]}"
+        raw = f"{did}\0{stat.st_size}\0{stat.st_mtime_ns}\0{version}\0{_FORMAT}"
+        return hashlib.sha256(raw.encode()).hexdigest()
+
+    def load(self, key: str, model: type[ModelT]) -> ModelT | None:
+        """Load a cached entry, or None if missing or unreadable"""
+
+        entry = self.directory / f"{key}{_SUFFIX}"
+        try:
+            data = marshal.loads(entry.read_bytes())
+            if not isinstance(data, dict):
+                raise ValueError(f"Invalid cache entry {entry}")
+            os.utime(entry)
+            # Stored after validating it, rebuilt as is
+            return construct(model, data)
+        except FileNotFoundError:
+            return None
+        except (EOFError, ValueError, TypeError):
+            entry.unlink(missing_ok=True)
+            return None
+
+    def store(self, key: str, ddo: BaseModel) -> None:
+        """Atomically store an entry and evict the old ones if over budget.
+
+        The cache is only an optimization, failing to write it (e.g. a full or
+        read-only directory) is logged and otherwise ignored.
+        """
+
+        data = marshal.dumps(ddo.model_dump())
+        temporary: str | None = None
+        try:
+            with tempfile.NamedTemporaryFile(
+                dir=self.directory, suffix=".tmp", delete=False
+            ) as f:
+                temporary = f.name
+                f.write(data)
+            os.replace(temporary, self.directory / f"{key}{_SUFFIX}")
+            temporary = None
+            if self._total is None:
+                self.evict()
+            else:
+                object.__setattr__(self, "_total", self._total + len(data))
+                if self._total > self.max_bytes:
+                    self.evict()
+        except OSError as error:
+            logger.warning("Could not store DDO cache entry %s: %s", key, error)
+        finally:
+            if temporary is not None:
+                Path(temporary).unlink(missing_ok=True)
+
+    def evict(self) -> None:
+        """Remove the least recently used entries until under max_bytes"""
+
+        with os.scandir(self.directory) as it:
+            entries = [
+                (entry.stat(), entry.path)
+                for entry in it
+                if entry.is_file() and entry.name.endswith(_SUFFIX)
+            ]
+
+        total = sum(stat.st_size for stat, _ in entries)
+        for stat, path in sorted(entries, key=lambda entry: entry[0].st_mtime_ns):
+            if total <= self.max_bytes:
+                break
+            try:
+                os.unlink(path)
+            except FileNotFoundError:
+                pass
+            total -= stat.st_size
+        object.__setattr__(self, "_total", total)
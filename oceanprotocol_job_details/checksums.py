@@ -0,0 +1,140 @@
+"""Checksums of the input files, hashed in parallel and cached on disk."""
+
+import hashlib
+import os
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, Iterable, List, Tuple
+
+import orjson
+
+from oceanprotocol_job_details.domain.derived import FileStamp, file_stamp
+from oceanprotocol_job_details.streaming import DEFAULT_CHUNK_SIZE
+
+DEFAULT_ALGORITHM = "sha256"
+
+
+def file_digest(
+    path: Path,
+    algorithm: str = DEFAULT_ALGORITHM,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> str:
+    """Hex digest of a file, read in chunks into a single reused buffer.
+
+    hashlib releases the GIL while hashing, so files hash in parallel threads.
+    """
+
+    digest = hashlib.new(algorithm)
+    buffer = bytearray(chunk_size)
+    view = memoryview(buffer)
+    with open(path, "rb", buffering=0) as f:
+        while size := f.readinto(buffer):
+            digest.update(view[:size])
+    return digest.hexdigest()
+
+
+def parse_checksum(checksum: str) -> Tuple[str, str]:
+    """Algorithm and hex digest of an "algorithm:hexdigest" checksum, sha256 if
+    not prefixed
+    """
+
+    algorithm, _, digest = checksum.rpartition(":")
+    return algorithm.lower() or DEFAULT_ALGORITHM, digest.lower()
+
+
+class DigestCache:
+    """Digests of files persisted as a JSON file, keyed by algorithm and path.
+
+    An entry is only used while the size and modification time of its file
+    are the same as when hashed.
+    """
+
+    def __init__(self, path: Path) -> None:
+        """
+        Args:
+            path (Path): JSON file holding the digests, created on save.
+        """
+
+        self.path = path
+        self._dirty = False
+        try:
+            self._entries: Dict[str, List[object]] = orjson.loads(path.read_bytes())
+        except (FileNotFoundError, orjson.JSONDecodeError):
+            self._entries = {}
+
+    @staticmethod
+    def _key(algorithm: str, path: Path) -> str:
+        return f"{algorithm}:{path.resolve()}"
+
+    def get(self, algorithm: str, path: Path, stamp: FileStamp | None) -> str | None:
+        entry = self._entries.get(self._key(algorithm, path))
+        if entry is None or stamp is None or entry[:2] != list(stamp):
+            return None
+        return str(entry[2])
+
+    def put(self, algorithm: str, path: Path, stamp: FileStamp, digest: str) -> None:
+        self._entries[self._key(algorithm, path)] = [*stamp, digest]
+        self._dirty = True
+
+    def save(self) -> None:
+        """Atomically write the digests, if any changed"""
+
+        if not self._dirty:
+            return
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with tempfile.NamedTemporaryFile(
+            dir=self.path.parent, suffix=".tmp", delete=False
+        ) as f:
+            f.write(orjson.dumps(self._entries))
+        os.replace(f.name, self.path)
+        self._dirty = False
+
+
+def digests(
+    files: Iterable[Tuple[Path, str]],
+    max_workers: int | None = None,
+    cache: DigestCache | None = None,
+) -> Dict[Tuple[Path, str], str]:
+    """Hash files in parallel in a thread pool, skipping the cached ones.
+
+    Args:
+        files (Iterable[Tuple[Path, str]]): Path and hashlib algorithm name of
+            each digest to compute.
+        max_workers (int | None, optional): Number of hashing threads.
+        cache (DigestCache | None, optional): Digests of unchanged files to
+            reuse, updated and saved with the new ones.
+
+    Returns:
+        Dict[Tuple[Path, str], str]: Hex digest of each path and algorithm.
+    """
+
+    results: Dict[Tuple[Path, str], str] = {}
+    pending: List[Tuple[Path, str, FileStamp | None]] = []
+
+    for path, algorithm in files:
+        # Stamped before hashing, a file changed meanwhile is hashed again later
+        stamp = file_stamp(path)
+        cached = cache.get(algorithm, path, stamp) if cache is not None else None
+        if cached is not None:
+            results[path, algorithm] = cached
+        else:
+            pending.append((path, algorithm, stamp))
+
+    if pending:
+        with ThreadPoolExecutor(max_workers, thread_name_prefix="checksum") as pool:
+            computed = pool.map(
+                file_digest,
+                [path for path, _, _ in pending],
+                [algorithm for _, algorithm, _ in pending],
+            )
+            for (path, algorithm, stamp), digest in zip(pending, computed):
+                results[path, algorithm] = digest
+                if cache is not None and stamp is not None:
+                    cache.put(algorithm, path, stamp, digest)
+
+    if cache is not None:
+        cache.save()
+
+    return results
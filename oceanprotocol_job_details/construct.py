@@ -0,0 +1,115 @@
+"""Rebuild of already validated model contents, without validating them again."""
+
+from functools import lru_cache
+from types import NoneType, UnionType
+from typing import (
+    Callable,
+    Dict,
+    List,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+    cast,
+    get_args,
+    get_origin,
+)
+
+from pydantic import BaseModel, TypeAdapter
+
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
+_Rebuild = Callable[[object], object]
+
+
+def _list(rebuild: _Rebuild) -> _Rebuild:
+    return lambda value: [rebuild(v) for v in cast(List[object], value)]
+
+
+def _dict(rebuild: _Rebuild) -> _Rebuild:
+    return lambda value: {
+        key: rebuild(v) for key, v in cast(Dict[str, object], value).items()
+    }
+
+
+def _rebuild(annotation: object) -> _Rebuild | None:
+    """Rebuild of the values of an annotation, None if they are kept as they are"""
+
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        return _builder(annotation)
+
+    origin = get_origin(annotation)
+    if origin is list:
+        (item,) = get_args(annotation)
+        rebuild = _rebuild(item)
+        return None if rebuild is None else _list(rebuild)
+
+    if origin is dict:
+        _, item = get_args(annotation)
+        rebuild = _rebuild(item)
+        return None if rebuild is None else _dict(rebuild)
+
+    if origin in (Union, UnionType):
+        args = [arg for arg in get_args(annotation) if arg is not NoneType]
+        rebuilds = [_rebuild(arg) for arg in args]
+        if all(rebuild is None for rebuild in rebuilds):
+            return None
+        if len(args) == 1:
+            # Optional, None is kept as it is
+            return rebuilds[0]
+
+        # Which member of the union a value is can not be told without validating
+        adapter = TypeAdapter(cast(Type[object], annotation))
+        return adapter.validate_python
+
+    return None
+
+
+@lru_cache(maxsize=None)
+def _builder(model: Type[BaseModel]) -> _Rebuild:
+    nested: Tuple[Tuple[str, _Rebuild], ...] | None = None
+    size = len(model.model_fields)
+    plain = (
+        not model.__private_attributes__ and model.model_config.get("extra") != "allow"
+    )
+    new = model.__new__
+    setattr = object.__setattr__
+
+    def build(value: object) -> object:
+        nonlocal nested
+        if nested is None:
+            # Planned on first use, so self-referencing models do not recurse forever
+            nested = tuple(
+                (name, rebuild)
+                for name, info in model.model_fields.items()
+                if (rebuild := _rebuild(info.annotation)) is not None
+            )
+
+        data = cast(Dict[str, object], value)
+        for name, rebuild in nested:
+            field = data.get(name)
+            if field is not None:
+                data[name] = rebuild(field)
+        if not plain or len(data) != size:
+            return model.model_construct(None, **data)
+
+        # What model_construct does for a dump holding every field
+        instance = new(model)
+        setattr(instance, "__dict__", data)
+        setattr(instance, "__pydantic_fields_set__", set(data))
+        setattr(instance, "__pydantic_extra__", None)
+        setattr(instance, "__pydantic_private__", None)
+        return instance
+
+    return build
+
+
+def construct(model: Type[ModelT], data: Dict[str, object]) -> ModelT:
+    """Rebuild a model, and its nested models, from contents it already validated.
+
+    Cheaper than model_validate, as no value is checked or coerced, so the data
+    must be a model_dump() of the same model (by field name, not by alias). The
+    data and its nested dicts are reused by the rebuilt models.
+    """
+
+    return cast(ModelT, _builder(model)(data))
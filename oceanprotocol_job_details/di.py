@@ -1,16 +1,104 @@
+from logging import Logger
 from typing import Generic, TypeVar
 
 from dependency_injector import containers, providers
-from pydantic import BaseModel
+from pydantic import BaseModel, Secret
 
+from oceanprotocol_job_details.cache import DDOCache
 from oceanprotocol_job_details.domain import DDOMetadata, Files, Paths
+from oceanprotocol_job_details.instrumentation import Instrumentation, PhaseStats
 from oceanprotocol_job_details.loaders import Loader
+from oceanprotocol_job_details.logs import JobLogging, LogPolicy, json_logging
 from oceanprotocol_job_details.ocean import JobDetails
 from oceanprotocol_job_details.plugins import inject
 
 InputParametersT = TypeVar("InputParametersT", bound=BaseModel | None)
 
 
+def _count_files(files: Files, stats: PhaseStats) -> Files:
+    stats.file_count = len(files) + sum(len(did_paths) for did_paths in files)
+    return files
+
+
+def _count_metadata(metadata: DDOMetadata, stats: PhaseStats) -> DDOMetadata:
+    stats.file_count = len(metadata)
+    return metadata
+
+
+def setup_logging(
+    enabled: bool,
+    logger: Logger,
+    paths: Paths,
+    file: str,
+    queue_size: int,
+    policy: LogPolicy,
+) -> JobLogging | None:
+    if not enabled:
+        return None
+    return json_logging(logger, paths.logs / file, queue_size, policy)
+
+
+def load_files(loader: Loader[Files], instrumentation: Instrumentation) -> Files:
+    with instrumentation.phase("files") as stats:
+        return _count_files(loader.load(), stats)
+
+
+async def aload_files(
+    loader: Loader[Files],
+    instrumentation: Instrumentation,
+) -> Files:
+    with instrumentation.phase("files") as stats:
+        return _count_files(await loader.aload(), stats)
+
+
+def load_metadata(
+    loader: Loader[DDOMetadata],
+    instrumentation: Instrumentation,
+) -> DDOMetadata:
+    with instrumentation.phase("metadata") as stats:
+        return _count_metadata(loader.load(), stats)
+
+
+async def aload_metadata(
+    loader: Loader[DDOMetadata],
+    instrumentation: Instrumentation,
+) -> DDOMetadata:
+    with instrumentation.phase("metadata") as stats:
+        return _count_metadata(await loader.aload(), stats)
+
+
+def inject_ddo_loader(
+    files: Files,
+    instrumentation: Instrumentation,
+    **kwargs: object,
+) -> Loader[DDOMetadata]:
+    return inject(
+        Loader[DDOMetadata],
+        "ddo",
+        files=files,
+        instrumentation=instrumentation,
+        **kwargs,
+    )
+
+
+def inject_job_details_loader(
+    files: Files,
+    secret: Secret[str] | None,
+    paths: Paths,
+    metadata: DDOMetadata,
+    **kwargs: object,
+) -> Loader[JobDetails[BaseModel]]:
+    return inject(
+        Loader[JobDetails[BaseModel]],
+        "jobdetails",
+        files,
+        secret,
+        paths,
+        metadata,
+        **kwargs,
+    )
+
+
 class Container(containers.DeclarativeContainer, Generic[InputParametersT]):
     config = providers.Configuration()
 
@@ -19,7 +107,31 @@ class Container(containers.DeclarativeContainer, Generic[InputParametersT]):
         base_dir=config.base_dir,
     )
 
-    files = providers.Factory(
+    instrumentation = providers.Singleton(
+        Instrumentation,
+        hooks=config.hooks,
+        logger=config.logger,
+    )
+
+    job_logging = providers.Singleton(
+        setup_logging,
+        enabled=config.log_json,
+        logger=config.logger,
+        paths=paths,
+        file=config.log_file,
+        queue_size=config.log_queue_size,
+        policy=config.log_policy,
+    )
+
+    ddo_cache = providers.Singleton(
+        lambda directory, max_bytes: (
+            DDOCache(directory, max_bytes) if directory is not None else None
+        ),
+        directory=config.ddo_cache_dir,
+        max_bytes=config.ddo_cache_max_bytes,
+    )
+
+    files_loader = providers.Factory(
         lambda dids, transformation_did, paths, logger: inject(
             Loader[Files],
             "files",
@@ -27,30 +139,71 @@ class Container(containers.DeclarativeContainer, Generic[InputParametersT]):
             logger,
             dids,
             transformation_did,
-        ).load(),
+        ),
         dids=config.dids,
         transformation_did=config.transformation_did,
         paths=paths,
         logger=config.logger,
     )
 
+    # Singletons, so that a single scan is shared by all the loaders of a job
+    files = providers.Singleton(
+        load_files,
+        loader=files_loader,
+        instrumentation=instrumentation,
+    )
+
     metadata = providers.Factory(
-        lambda files: inject(Loader[DDOMetadata], "ddo", files=files).load(),
+        lambda files, instrumentation, **kwargs: load_metadata(
+            inject_ddo_loader(files, instrumentation, **kwargs),
+            instrumentation,
+        ),
         files=files,
+        concurrency=config.concurrency,
+        fields=config.ddo_fields,
+        cache=ddo_cache,
+        executor=config.ddo_executor,
+        workers=config.ddo_workers,
+        strict=config.strict,
+        instrumentation=instrumentation,
     )
 
     job_details_loader = providers.Factory(
-        lambda files, secret, paths, metadata, **kwargs: inject(
-            Loader[JobDetails[InputParametersT]],
-            "jobdetails",
-            files,
-            secret,
-            paths,
-            metadata,
-            **kwargs,
-        ),
+        inject_job_details_loader,
         files=files,
         secret=config.secret,
         paths=paths,
         metadata=metadata,
+        strict=config.strict,
+    )
+
+    # Async counterparts, resolving to awaitables
+    afiles = providers.Singleton(
+        aload_files,
+        loader=files_loader,
+        instrumentation=instrumentation,
+    )
+
+    ametadata = providers.Factory(
+        lambda files, instrumentation, **kwargs: aload_metadata(
+            inject_ddo_loader(files, instrumentation, **kwargs),
+            instrumentation,
+        ),
+        files=afiles,
+        concurrency=config.concurrency,
+        fields=config.ddo_fields,
+        cache=ddo_cache,
+        executor=config.ddo_executor,
+        workers=config.ddo_workers,
+        strict=config.strict,
+        instrumentation=instrumentation,
+    )
+
+    ajob_details_loader = providers.Factory(
+        inject_job_details_loader,
+        files=afiles,
+        secret=config.secret,
+        paths=paths,
+        metadata=ametadata,
+        strict=config.strict,
     )
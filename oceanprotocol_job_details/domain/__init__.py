@@ -4,7 +4,18 @@ from oceanprotocol_job_details.domain.derived import (
     DDOMetadata,
     DIDPaths,
     Files,
+    InputFile,
     Paths,
 )
+from oceanprotocol_job_details.domain.metadata import LazyDDOMetadata
 
-__all__ = ["DDO", "DID", "DDOMetadata", "Paths", "DIDPaths", "Files"]
+__all__ = [
+    "DDO",
+    "DID",
+    "DDOMetadata",
+    "Paths",
+    "DIDPaths",
+    "Files",
+    "InputFile",
+    "LazyDDOMetadata",
+]
@@ -62,6 +62,7 @@ class Service(BaseModel):
     additionalInformation: Optional[str] = None
     name: Optional[str] = None
     description: Optional[str] = None
+    checksums: Optional[list[str]] = None
 
 
 class Event(BaseModel):
@@ -1,5 +1,7 @@
+from dataclasses import InitVar, field
+from fnmatch import fnmatchcase
 from pathlib import Path
-from typing import Dict, List, Sequence, TypeAlias
+from typing import List, Mapping, NamedTuple, Sequence, Tuple, TypeAlias
 
 from pydantic import ConfigDict, Field
 from pydantic.dataclasses import dataclass
@@ -8,58 +10,124 @@ from oceanprotocol_job_details.domain.ddo import DDO
 
 DID: TypeAlias = str
 
+FileStamp: TypeAlias = Tuple[int, int]
+"""Size and modification time of a file, to tell if it changed"""
 
-@dataclass(config=ConfigDict(frozen=True, arbitrary_types_allowed=True, extra="forbid"))
+
+def file_stamp(path: Path) -> FileStamp | None:
+    """Current stamp of a file, None if missing"""
+
+    try:
+        stat = path.stat()
+    except FileNotFoundError:
+        return None
+    return stat.st_size, stat.st_mtime_ns
+
+
+class InputFile(NamedTuple):
+    """Input file metadata, gathered once when loading"""
+
+    directory: Path
+    """Input directory of the DID, the same object for all its files"""
+
+    name: str
+    size: int
+    mtime_ns: int
+    order: int | None
+    """Numeric value of the file name (files are named 0..N), None if not numeric"""
+
+    @property
+    def path(self) -> Path:
+        return self.directory / self.name
+
+    @classmethod
+    def of(cls, path: Path) -> "InputFile":
+        """Metadata of a file, with no size nor modification time if missing"""
+
+        size, mtime_ns = file_stamp(path) or (0, 0)
+        order = int(path.name) if path.name.isdecimal() else None
+        return cls(path.parent, path.name, size, mtime_ns, order)
+
+
+@dataclass(
+    config=ConfigDict(frozen=True, arbitrary_types_allowed=True, extra="forbid"),
+    slots=True,
+)
 class DIDPaths:
     did: DID
     ddo: Path
 
-    input_files: List[Path] = Field(default_factory=list)
+    input_files: InitVar[Sequence[Path] | None] = None
+    """Paths of the input files, indexed in this order if the index is not given"""
 
-    def __post_init__(self) -> None:
-        if not self.ddo.exists():
-            raise FileNotFoundError(f"DDO {self.ddo} does not exist")
+    index: Tuple[InputFile, ...] = ()
+    """Metadata of the input files, in order"""
 
-    def __len__(self) -> int:
-        return len(self.input_files)
+    def __post_init__(self, input_files: Sequence[Path] | None) -> None:
+        if input_files and not self.index:
+            index = tuple(InputFile.of(path) for path in input_files)
+            object.__setattr__(self, "index", index)
 
+    def __len__(self) -> int:
+        return len(self.index)
 
-Files: TypeAlias = Sequence[DIDPaths]
+    @property
+    def total_bytes(self) -> int:
+        """Total size of the input files"""
+        return sum(file.size for file in self.index)
 
+    def largest_first(self) -> List[InputFile]:
+        """Input files sorted by decreasing size"""
+        return sorted(self.index, key=lambda file: file.size, reverse=True)
 
-@dataclass(config=ConfigDict(frozen=True, arbitrary_types_allowed=True, extra="forbid"))
-class Paths:
-    """Configuration class for the Ocean Protocol Job Details"""
+    def select(self, pattern: str) -> List[InputFile]:
+        """Input files whose name matches a glob pattern, e.g. "*.csv" """
+        return [file for file in self.index if fnmatchcase(file.name, pattern)]
 
-    base_dir: Path = Field(default_factory=lambda: Path("/data"))
 
-    @property
-    def data(self) -> Path:
-        return self.base_dir
+def _input_files(self: DIDPaths) -> List[Path]:
+    """Paths of the input files, built on each access from the index"""
+    return [file.path for file in self.index]
 
-    @property
-    def inputs(self) -> Path:
-        return self.data / "inputs"
 
-    @property
-    def ddos(self) -> Path:
-        return self.data / "ddos"
+# Set once the dataclass is built, as input_files is also its init argument
+setattr(DIDPaths, "input_files", property(_input_files))
 
-    @property
-    def outputs(self) -> Path:
-        return self.data / "outputs"
+Files: TypeAlias = Sequence[DIDPaths]
 
-    @property
-    def logs(self) -> Path:
-        return self.data / "logs"
 
-    @property
-    def algorithm(self) -> Path:
-        return self.data / "transformations" / "algorithm"
+@dataclass(
+    config=ConfigDict(frozen=True, arbitrary_types_allowed=True, extra="forbid"),
+    slots=True,
+)
+class Paths:
+    """Configuration class for the Ocean Protocol Job Details"""
 
-    @property
-    def algorithm_custom_parameters(self) -> Path:
-        return self.inputs / "algoCustomData.json"
+    base_dir: Path = Field(default_factory=lambda: Path("/data"))
 
+    # Derived paths, built once instead of on each access
+    data: Path = field(init=False, repr=False, compare=False)
+    inputs: Path = field(init=False, repr=False, compare=False)
+    ddos: Path = field(init=False, repr=False, compare=False)
+    outputs: Path = field(init=False, repr=False, compare=False)
+    logs: Path = field(init=False, repr=False, compare=False)
+    algorithm: Path = field(init=False, repr=False, compare=False)
+    algorithm_custom_parameters: Path = field(init=False, repr=False, compare=False)
 
-DDOMetadata: TypeAlias = Dict[DID, DDO]
+    def __post_init__(self) -> None:
+        derived = {
+            "data": self.base_dir,
+            "inputs": self.base_dir / "inputs",
+            "ddos": self.base_dir / "ddos",
+            "outputs": self.base_dir / "outputs",
+            "logs": self.base_dir / "logs",
+            "algorithm": self.base_dir / "transformations" / "algorithm",
+        }
+        derived["algorithm_custom_parameters"] = (
+            derived["inputs"] / "algoCustomData.json"
+        )
+        for name, path in derived.items():
+            object.__setattr__(self, name, path)
+
+
+DDOMetadata: TypeAlias = Mapping[DID, DDO]
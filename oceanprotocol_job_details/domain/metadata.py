@@ -0,0 +1,235 @@
+import asyncio
+import marshal
+from concurrent.futures import Executor
+from pathlib import Path
+from typing import Callable, Dict, Iterator, Mapping, Tuple, cast
+
+import aiofiles
+from pydantic import BaseModel
+
+from oceanprotocol_job_details.cache import DDOCache
+from oceanprotocol_job_details.construct import construct
+from oceanprotocol_job_details.domain.ddo import DDO
+from oceanprotocol_job_details.domain.derived import DID, FileStamp, file_stamp
+from oceanprotocol_job_details.executors import run_in_executor
+from oceanprotocol_job_details.instrumentation import Instrumentation, PhaseStats
+
+
+def parse_ddo(raw: bytes, strict: bool = False) -> DDO:
+    return DDO.model_validate_json(raw, strict=strict or None)
+
+
+def _dump_ddo(parse: Callable[[bytes], DDO], path: Path) -> Tuple[int, bytes]:
+    # Runs in the worker processes, the validated contents are shipped back as
+    # marshal data, cheaper to send and rebuild than the pickled models
+    raw = path.read_bytes()
+    return len(raw), marshal.dumps(parse(raw).model_dump())
+
+
+class LazyDDOMetadata(Mapping[DID, DDO]):
+    """Mapping of DIDs to their DDOs.
+
+    All the DIDs are known up front, but each DDO file is only read and
+    validated on first access, then memoized.
+    """
+
+    __slots__ = (
+        "_sources",
+        "_parse",
+        "_concurrency",
+        "_disk_cache",
+        "_instrumentation",
+        "_cache",
+        "_stamps",
+    )
+
+    def __init__(
+        self,
+        sources: Mapping[DID, Path],
+        parse: Callable[[bytes], DDO] = parse_ddo,
+        concurrency: int = 8,
+        disk_cache: DDOCache | None = None,
+        instrumentation: Instrumentation | None = None,
+    ) -> None:
+        """
+        Args:
+            sources (Mapping[DID, Path]): Path of the DDO file of each DID.
+            parse (Callable[[bytes], DDO], optional): Validates the raw DDO file.
+            concurrency (int, optional): Maximum DDOs read at once by aload_all.
+            disk_cache (DDOCache | None, optional): Persistent cache of full DDOs.
+            instrumentation (Instrumentation | None, optional): Measures each read.
+        """
+
+        self._sources = dict(sources)
+        self._parse = parse
+        self._concurrency = concurrency
+        self._disk_cache = disk_cache
+        self._instrumentation = instrumentation
+        self._cache: Dict[DID, DDO] = {}
+        self._stamps: Dict[DID, FileStamp | None] = {}
+
+    def _read(self, path: Path, stats: PhaseStats) -> DDO:
+        raw = path.read_bytes()
+        stats.bytes_read, stats.file_count = len(raw), 1
+        return self._parse(raw)
+
+    def _load(self, did: DID, path: Path) -> DDO:
+        instrumentation = self._instrumentation or Instrumentation()
+        self._stamps[did] = file_stamp(path)
+
+        with instrumentation.phase("ddo") as stats:
+            if self._disk_cache is None:
+                return self._read(path, stats)
+
+            key = self._disk_cache.key(did, path)
+            ddo = self._disk_cache.load(key, DDO)
+            if ddo is None:
+                ddo = self._read(path, stats)
+                self._disk_cache.store(key, ddo)
+            return ddo
+
+    def __getstate__(self) -> Dict[str, object]:
+        # The instrumentation (and its hooks) stays in the loading process
+        return {
+            slot: getattr(self, slot)
+            for slot in self.__slots__
+            if slot != "_instrumentation"
+        }
+
+    def __setstate__(self, state: Dict[str, object]) -> None:
+        for slot, value in state.items():
+            object.__setattr__(self, slot, value)
+        self._instrumentation = None
+
+    def __getitem__(self, did: DID) -> DDO:
+        try:
+            return self._cache[did]
+        except KeyError:
+            path = self._sources[did]
+
+        return self._cache.setdefault(did, self._load(did, path))
+
+    def __iter__(self) -> Iterator[DID]:
+        return iter(self._sources)
+
+    def __len__(self) -> int:
+        return len(self._sources)
+
+    def __contains__(self, did: object) -> bool:
+        return did in self._sources
+
+    def __repr__(self) -> str:
+        return (
+            f"{type(self).__name__}(dids={list(self._sources)}, "
+            f"loaded={list(self._cache)})"
+        )
+
+    def is_loaded(self, did: DID) -> bool:
+        """Whether the DDO of the given DID has already been read and validated"""
+        return did in self._cache
+
+    async def aget(self, did: DID) -> DDO:
+        """Get the DDO of the given DID without blocking the event loop"""
+
+        try:
+            return self._cache[did]
+        except KeyError:
+            path = self._sources[did]
+
+        if self._disk_cache is not None:
+            ddo = await run_in_executor(self._load, did, path)
+        else:
+            with (self._instrumentation or Instrumentation()).phase("ddo") as stats:
+                self._stamps[did] = file_stamp(path)
+                async with aiofiles.open(path, "rb") as f:
+                    raw = await f.read()
+                stats.bytes_read, stats.file_count = len(raw), 1
+                ddo = await run_in_executor(self._parse, raw)
+
+        return self._cache.setdefault(did, ddo)
+
+    async def aload_all(self) -> "LazyDDOMetadata":
+        """Read and validate every pending DDO concurrently, bounded by concurrency"""
+
+        semaphore = asyncio.Semaphore(self._concurrency)
+
+        async def load(did: DID) -> None:
+            async with semaphore:
+                await self.aget(did)
+
+        await asyncio.gather(*(load(did) for did in self if not self.is_loaded(did)))
+        return self
+
+    def refresh(self, sources: Mapping[DID, Path]) -> "LazyDDOMetadata":
+        """Mapping over the given DDO files, keeping the memoized DDOs whose file
+        did not change since it was read. Returns self if none changed.
+        """
+
+        sources = dict(sources)
+        kept = {
+            did: ddo
+            for did, ddo in self._cache.items()
+            if sources.get(did) == self._sources[did]
+            and file_stamp(sources[did]) == self._stamps.get(did)
+        }
+        if sources == self._sources and len(kept) == len(self._cache):
+            return self
+
+        refreshed = LazyDDOMetadata(
+            sources,
+            parse=self._parse,
+            concurrency=self._concurrency,
+            disk_cache=self._disk_cache,
+            instrumentation=self._instrumentation,
+        )
+        refreshed._cache.update(kept)
+        refreshed._stamps.update((did, self._stamps[did]) for did in kept)
+        return refreshed
+
+    def load_all_in(
+        self,
+        executor: Executor,
+        model: type[BaseModel] = DDO,
+    ) -> "LazyDDOMetadata":
+        """Read and validate every pending DDO in an executor, usually a process pool.
+
+        Args:
+            executor (Executor): Executor running the parse of each DDO file.
+            model (type[BaseModel], optional): Model returned by parse, used to
+                rebuild the DDOs from the contents validated by the workers,
+                without validating them again.
+        """
+
+        pending = {
+            did: path for did, path in self._sources.items() if did not in self._cache
+        }
+
+        with (self._instrumentation or Instrumentation()).phase("ddo") as stats:
+            keys: Dict[DID, str] = {}
+            if self._disk_cache is not None:
+                for did, path in list(pending.items()):
+                    keys[did] = self._disk_cache.key(did, path)
+                    cached = self._disk_cache.load(keys[did], DDO)
+                    if cached is not None:
+                        self._cache.setdefault(did, cached)
+                        del pending[did]
+
+            for did, path in pending.items():
+                self._stamps[did] = file_stamp(path)
+
+            results = executor.map(
+                _dump_ddo,
+                [self._parse] * len(pending),
+                pending.values(),
+                chunksize=max(1, len(pending) // 64),
+            )
+            for did, (size, data) in zip(pending, results):
+                # Validated by the worker, rebuilt as is
+                ddo = cast(DDO, construct(model, marshal.loads(data)))
+                stats.bytes_read += size
+                stats.file_count += 1
+                if self._disk_cache is not None:
+                    self._disk_cache.store(keys[did], ddo)
+                self._cache.setdefault(did, ddo)
+
+        return self
@@ -0,0 +1,108 @@
+# mypy: disable-error-code=explicit-any
+from copy import copy
+from dataclasses import dataclass
+from functools import lru_cache
+from types import GenericAlias, NoneType, UnionType
+from typing import (
+    Any,
+    Dict,
+    FrozenSet,
+    Iterable,
+    Tuple,
+    Union,
+    get_args,
+    get_origin,
+)
+
+from pydantic import BaseModel, ConfigDict, create_model
+
+_Tree = Dict[str, "_Tree"]
+
+
+def _build_tree(fields: Iterable[str]) -> _Tree:
+    tree: _Tree = {}
+    for field in fields:
+        node = tree
+        for part in field.split("."):
+            node = node.setdefault(part, {})
+    return tree
+
+
+def _project_annotation(annotation: Any, tree: _Tree, path: str) -> Any:
+    """Replace the BaseModel inside an annotation (X, list[X], X | None) by its projection"""
+
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        return _project(annotation, tree, f"{path}.")
+
+    origin = get_origin(annotation)
+    if origin is list:
+        (item,) = get_args(annotation)
+        return GenericAlias(list, (_project_annotation(item, tree, path),))
+    if origin in (Union, UnionType):
+        args = get_args(annotation)
+        if NoneType in args and len(args) == 2:
+            (inner,) = (arg for arg in args if arg is not NoneType)
+            return _project_annotation(inner, tree, path) | None
+
+    raise ValueError(f"DDO field {path} has no nested fields to project")
+
+
+def _project(model: type[BaseModel], tree: _Tree, prefix: str = "") -> type[BaseModel]:
+    fields: Dict[str, Any] = {}
+    by_alias = {info.alias: name for name, info in model.model_fields.items()}
+
+    for key, subtree in tree.items():
+        path = f"{prefix}{key}"
+        name = key if key in model.model_fields else by_alias.get(key)
+        if name is None:
+            raise ValueError(f"DDO has no field {path}")
+
+        info = copy(model.model_fields[name])
+        if subtree:
+            info.annotation = _project_annotation(info.annotation, subtree, path)
+        fields[name] = (info.annotation, info)
+
+    return create_model(
+        f"{model.__name__}Projection",
+        __config__=ConfigDict(populate_by_name=True, extra="ignore"),
+        **fields,
+    )
+
+
+@lru_cache(maxsize=None)
+def _cached_projection(
+    model: type[BaseModel],
+    fields: FrozenSet[str],
+) -> type[BaseModel]:
+    return _project(model, _build_tree(fields))
+
+
+def projection(model: type[BaseModel], fields: Iterable[str]) -> type[BaseModel]:
+    """Build a model validating only the given dotted field paths of another model.
+
+    The other fields are ignored when validating, so their subtrees never get
+    turned into models. Nested paths go through lists and optional fields, e.g.
+    ``"services.files"`` keeps only the ``files`` of every service.
+
+    Args:
+        model (type[BaseModel]): Model to project, e.g. DDO.
+        fields (Iterable[str]): Dotted paths (field names or aliases) to keep.
+
+    Returns:
+        type[BaseModel]: Projected model, memoized per model and set of fields.
+    """
+
+    return _cached_projection(model, frozenset(fields))
+
+
+@dataclass(frozen=True)
+class ProjectedParser:
+    """Picklable parser validating raw JSON with a projection of a model"""
+
+    model: type[BaseModel]
+    fields: Tuple[str, ...]
+    strict: bool = False
+
+    def __call__(self, raw: bytes) -> BaseModel:
+        model = projection(self.model, self.fields)
+        return model.model_validate_json(raw, strict=self.strict or None)
@@ -1 +1,50 @@
+from pathlib import Path
+from typing import Sequence
+
+
 class JobDetailsError(Exception): ...
+
+
+class MissingDDOError(JobDetailsError, FileNotFoundError):
+    """Some of the job DIDs have no DDO file"""
+
+    def __init__(self, dids: Sequence[str]) -> None:
+        super().__init__(f"Missing DDO for DIDs: {', '.join(dids)}")
+        self.dids = list(dids)
+
+
+class UnknownFormatError(JobDetailsError, ValueError):
+    """An input file is not in any of the supported tabular formats"""
+
+
+class ChecksumMismatchError(JobDetailsError):
+    """Some input files do not match their expected checksums"""
+
+    def __init__(self, paths: Sequence[Path]) -> None:
+        super().__init__(f"Checksum mismatch for: {', '.join(map(str, paths))}")
+        self.paths = list(paths)
+
+
+class ChecksumCountError(ChecksumMismatchError):
+    """The DDO of a DID lists a different number of checksums than its input files"""
+
+    def __init__(self, did: str, paths: Sequence[Path], checksums: int) -> None:
+        JobDetailsError.__init__(
+            self, f"DID {did} has {len(paths)} input files but {checksums} checksums"
+        )
+        self.did = did
+        self.paths = list(paths)
+
+
+class MissingChecksumsError(ChecksumMismatchError):
+    """The input files of a DID can not be verified, as no checksum is listed"""
+
+    def __init__(self, did: str, paths: Sequence[Path], projected: bool) -> None:
+        JobDetailsError.__init__(
+            self,
+            f"DDO of DID {did} was projected without its services"
+            if projected
+            else f"DDO of DID {did} lists no checksums for its input files",
+        )
+        self.did = did
+        self.paths = list(paths)
@@ -1,13 +1,38 @@
 # mypy: disable-error-code=explicit-any
 import asyncio
 import inspect
-from typing import Any, Callable, Coroutine, TypeGuard, TypeVar, overload
+import os
+import time
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import (
+    Any,
+    Callable,
+    Coroutine,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Literal,
+    TypeAlias,
+    TypeGuard,
+    TypeVar,
+    overload,
+)
+from weakref import WeakKeyDictionary
 
 from typing_extensions import ParamSpec
 
 P = ParamSpec("P")
 T = TypeVar("T")
 
+ExecutorKind: TypeAlias = Literal["thread", "process", "inline"]
+
+DEFAULT_EXECUTOR = "default"
+
 
 def is_coro_function(
     obj: Any,
@@ -19,6 +44,232 @@ def is_coro(obj: Any) -> TypeGuard[Coroutine[Any, Any, T]]:
     return inspect.iscoroutine(obj)
 
 
+@dataclass
+class ExecutorStats:
+    """Counters of the calls run by a named executor"""
+
+    submitted: int = 0
+    completed: int = 0
+    failed: int = 0
+    cancelled: int = 0
+
+    queued: int = 0
+    """Calls waiting for a free slot"""
+
+    running: int = 0
+    """Calls holding a slot, until their worker is done"""
+
+    max_queued: int = 0
+    """Highest number of calls waiting at once"""
+
+    wait_time: float = 0.0
+    """Total seconds spent waiting for a slot"""
+
+    run_time: float = 0.0
+    """Total seconds from getting a slot to the result"""
+
+    @property
+    def mean_latency(self) -> float:
+        """Mean seconds from submission to result of the finished calls"""
+
+        finished = self.completed + self.failed
+        return (self.wait_time + self.run_time) / finished if finished else 0.0
+
+
+class ManagedExecutor:
+    """Named executor running at most max_workers calls at once.
+
+    Calls over the limit wait for a slot without blocking the event loop. A
+    slot is only given back once the worker is done, even if the awaiting task
+    was cancelled, so the limit holds for the calls already started.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        kind: ExecutorKind = "thread",
+        max_workers: int | None = None,
+    ) -> None:
+        """
+        Args:
+            name (str): Name of the executor, also used for its threads.
+            kind (ExecutorKind, optional): Run the calls in a pool of threads or
+                processes, or inline in the event loop thread.
+            max_workers (int | None, optional): Maximum calls running at once,
+                as many as CPUs (plus 4 for threads, as asyncio does) if None.
+        """
+
+        cpus = os.cpu_count() or 1
+        if max_workers is None:
+            max_workers = min(32, cpus + 4) if kind == "thread" else cpus
+        assert max_workers > 0, "Workers must be positive"
+
+        self.name = name
+        self.kind = kind
+        self.max_workers = max_workers
+        self.stats = ExecutorStats()
+
+        self._executor: Executor | None = None
+        self._semaphores: WeakKeyDictionary[
+            asyncio.AbstractEventLoop, asyncio.Semaphore
+        ] = WeakKeyDictionary()
+
+    def __repr__(self) -> str:
+        return (
+            f"{type(self).__name__}(name={self.name!r}, kind={self.kind!r}, "
+            f"max_workers={self.max_workers})"
+        )
+
+    @property
+    def executor(self) -> Executor | None:
+        """Underlying pool, started on first use. None for inline executors"""
+
+        if self._executor is None and self.kind != "inline":
+            self._executor = (
+                ThreadPoolExecutor(self.max_workers, thread_name_prefix=self.name)
+                if self.kind == "thread"
+                else ProcessPoolExecutor(self.max_workers)
+            )
+        return self._executor
+
+    def shutdown(self, wait: bool = True) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=wait, cancel_futures=True)
+            self._executor = None
+
+    def _semaphore(self, loop: asyncio.AbstractEventLoop) -> asyncio.Semaphore:
+        # asyncio semaphores are bound to the first loop using them
+        semaphore = self._semaphores.get(loop)
+        if semaphore is None:
+            semaphore = self._semaphores[loop] = asyncio.Semaphore(self.max_workers)
+        return semaphore
+
+    async def run(self, fn: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        """Run fn(*args, **kwargs) once a slot is free. For process executors,
+        fn and its arguments must be picklable.
+        """
+
+        stats = self.stats
+        stats.submitted += 1
+
+        if self.kind == "inline":
+            start = time.perf_counter()
+            try:
+                result = fn(*args, **kwargs)
+            except BaseException:
+                stats.failed += 1
+                raise
+            finally:
+                stats.run_time += time.perf_counter() - start
+            stats.completed += 1
+            return result
+
+        loop = asyncio.get_running_loop()
+        semaphore = self._semaphore(loop)
+
+        stats.queued += 1
+        stats.max_queued = max(stats.max_queued, stats.queued)
+        start = time.perf_counter()
+        try:
+            await semaphore.acquire()
+        except asyncio.CancelledError:
+            stats.cancelled += 1
+            raise
+        finally:
+            stats.queued -= 1
+            stats.wait_time += time.perf_counter() - start
+
+        stats.running += 1
+        start = time.perf_counter()
+        try:
+            executor = self.executor
+            assert executor is not None
+            future = executor.submit(fn, *args, **kwargs)
+        except BaseException:
+            stats.running -= 1
+            semaphore.release()
+            raise
+
+        def release(_: Future[T]) -> None:
+            try:
+                loop.call_soon_threadsafe(self._release, semaphore)
+            except RuntimeError:  # The loop was closed before the worker was done
+                pass
+
+        future.add_done_callback(release)
+
+        try:
+            result = await asyncio.wrap_future(future)
+        except asyncio.CancelledError:
+            stats.cancelled += 1
+            raise
+        except BaseException:
+            stats.failed += 1
+            raise
+        finally:
+            stats.run_time += time.perf_counter() - start
+        stats.completed += 1
+        return result
+
+    def _release(self, semaphore: asyncio.Semaphore) -> None:
+        self.stats.running -= 1
+        semaphore.release()
+
+    async def map(self, fn: Callable[..., T], *iterables: Iterable[Any]) -> List[T]:
+        """Run fn over the iterables like map, returning the results in order"""
+
+        return list(
+            await asyncio.gather(*(self.run(fn, *args) for args in zip(*iterables)))
+        )
+
+
+_executors: Dict[str, ManagedExecutor] = {}
+
+_current: ContextVar[str] = ContextVar("executor", default=DEFAULT_EXECUTOR)
+
+
+def configure_executor(
+    name: str,
+    kind: ExecutorKind = "thread",
+    max_workers: int | None = None,
+) -> ManagedExecutor:
+    """Create or replace the named executor, shutting down the one it replaces.
+
+    The "default" executor, used unless told otherwise, is a thread pool.
+    """
+
+    executor = ManagedExecutor(name, kind, max_workers)
+    previous = _executors.pop(name, None)
+    if previous is not None:
+        previous.shutdown(wait=False)
+    _executors[name] = executor
+    return executor
+
+
+def get_executor(name: str | None = None) -> ManagedExecutor:
+    """The named executor, or the current one (see using_executor) if None"""
+
+    name = name or _current.get()
+    try:
+        return _executors[name]
+    except KeyError:
+        if name != DEFAULT_EXECUTOR:
+            raise KeyError(f"Executor {name!r} is not configured") from None
+        return configure_executor(DEFAULT_EXECUTOR)
+
+
+@contextmanager
+def using_executor(name: str) -> Iterator[ManagedExecutor]:
+    """Run the run_in_executor calls made within the block in the named executor"""
+
+    executor = get_executor(name)
+    token = _current.set(name)
+    try:
+        yield executor
+    finally:
+        _current.reset(token)
+
+
 @overload
 async def run_in_executor(
     obj: Coroutine[Any, Any, T],
@@ -52,8 +303,21 @@ async def run_in_executor(
     if is_coro(obj):
         return await obj
 
-    loop = asyncio.get_running_loop()
-    return await loop.run_in_executor(
-        None,
-        lambda: obj(*args, **kwargs),
-    )
+    return await get_executor().run(obj, *args, **kwargs)
+
+
+async def map_in_executor(
+    fn: Callable[..., T],
+    *iterables: Iterable[Any],
+    executor: str | None = None,
+) -> List[T]:
+    """Run fn over the iterables in the named (or current) executor, in order"""
+
+    return await get_executor(executor).map(fn, *iterables)
+
+
+@lru_cache(maxsize=None)
+def process_pool(max_workers: int | None = None) -> ProcessPoolExecutor:
+    """Process pool shared by the loaders, started on first use and kept alive"""
+
+    return ProcessPoolExecutor(max_workers)
@@ -1,9 +1,13 @@
-from typing import Dict, Type, TypeAlias, TypeVar
+import time
+from typing import Awaitable, Dict, Sequence, Type, TypeAlias, TypeVar, cast
 
 from pydantic import BaseModel, JsonValue
 
 from oceanprotocol_job_details.di import Container
 from oceanprotocol_job_details.exceptions import JobDetailsError
+from oceanprotocol_job_details.executors import run_in_executor
+from oceanprotocol_job_details.instrumentation import PhaseRecord, PhaseStats
+from oceanprotocol_job_details.loaders import Loader
 from oceanprotocol_job_details.ocean import (
     EmptyJobDetails,
     JobDetails,
@@ -15,75 +19,164 @@ InputParametersT = TypeVar("InputParametersT", bound=BaseModel)
 EmptyInputParameters: TypeAlias = BaseModel
 
 
-def create_container(config: Dict[str, JsonValue]) -> Container[InputParametersT]:
+def create_container(
+    config: Dict[str, JsonValue],
+    ddo_fields: Sequence[str] | None = None,
+) -> Container[InputParametersT]:
     """
-    Return a fully configured Container from a config dict.
+    Return a fully configured Container from a config dict. If given, ddo_fields
+    restricts the validated DDO contents to those dotted field paths.
     """
 
+    if ddo_fields is not None:
+        config = {**config, "ddo_fields": list(ddo_fields)}
+
+    start_ns, start = time.time_ns(), time.perf_counter()
     container = Container[InputParametersT]()
     settings = JobSettings.model_validate(config)
     container.config.from_pydantic(settings)
+    container.job_logging()
+
+    container.instrumentation().record(
+        PhaseRecord("settings", start_ns, time.perf_counter() - start)
+    )
     return container
 
 
+def load_from_container(
+    container: Container[InputParametersT],
+    input_type: Type[InputParametersT] | None,
+) -> JobDetails[InputParametersT]:
+    """
+    Load a JobDetails for a given input_type from an already configured
+    Container, timing it as the job_details phase.
+    """
+
+    loader = cast(
+        Loader[JobDetails[InputParametersT]],
+        container.job_details_loader(input_type=input_type),
+    )
+    with container.instrumentation().phase("job_details"):
+        return loader.load()
+
+
+async def _aload(
+    container: Container[InputParametersT],
+    input_type: Type[InputParametersT] | None,
+) -> JobDetails[InputParametersT]:
+    # The provider resolves to an awaitable, its dependencies being async
+    loader = await cast(
+        Awaitable[Loader[JobDetails[InputParametersT]]],
+        container.ajob_details_loader(input_type=input_type),
+    )
+    with container.instrumentation().phase("job_details"):
+        return await loader.aload()
+
+
+def _count_parameters(
+    job_details: JobDetails[InputParametersT],
+    stats: PhaseStats,
+) -> None:
+    path = job_details.paths.algorithm_custom_parameters
+    if path.exists():
+        stats.bytes_read, stats.file_count = path.stat().st_size, 1
+
+
 def load_job_details(
     input_type: Type[InputParametersT] | None = None,
     config: Dict[str, JsonValue] = {},
+    ddo_fields: Sequence[str] | None = None,
 ) -> JobDetails[InputParametersT]:
     """
     Load a ParametrizedJobDetails for a given input_type using the config.
     """
 
-    container: Container[InputParametersT] = create_container(config)
-    return container.job_details_loader(input_type=input_type).load()
+    container: Container[InputParametersT] = create_container(config, ddo_fields)
+    job_details = load_from_container(container, input_type)
+
+    container.instrumentation().log_summary()
+    return job_details
+
+
+async def aload_job_details(
+    input_type: Type[InputParametersT] | None = None,
+    config: Dict[str, JsonValue] = {},
+    ddo_fields: Sequence[str] | None = None,
+) -> JobDetails[InputParametersT]:
+    """
+    Load a JobDetails for a given input_type using the config, reading the
+    files and DDOs concurrently without blocking the event loop.
+    """
+
+    container = cast(
+        Container[InputParametersT],
+        await run_in_executor(create_container, config, ddo_fields),
+    )
+    job_details = await _aload(container, input_type)
+
+    container.instrumentation().log_summary()
+    return job_details
 
 
 def load_parametrized_job_details(
     input_type: Type[InputParametersT],
     config: Dict[str, JsonValue] = {},
+    ddo_fields: Sequence[str] | None = None,
 ) -> ParametrizedJobDetails[InputParametersT]:
     """
     Load a ParametrizedJobDetails for a given input_type using the config.
     """
 
-    container: Container[InputParametersT] = create_container(config)
-    job_details = container.job_details_loader(input_type=input_type).load()
+    container: Container[InputParametersT] = create_container(config, ddo_fields)
+    job_details = load_from_container(container, input_type)
 
-    result = job_details.read()
+    with container.instrumentation().phase("input_parameters") as stats:
+        result = job_details.read()
+        _count_parameters(job_details, stats)
 
     if isinstance(result, JobDetailsError):
         raise result
 
+    container.instrumentation().log_summary()
     return result
 
 
 async def aload_parametrized_job_details(
     input_type: Type[InputParametersT],
     config: Dict[str, JsonValue] = {},
+    ddo_fields: Sequence[str] | None = None,
 ) -> ParametrizedJobDetails[InputParametersT]:
     """
     Load a ParametrizedJobDetails for a given input_type using the config.
     """
 
-    container: Container[InputParametersT] = create_container(config)
-    job_details = container.job_details_loader(input_type=input_type).load()
+    container = cast(
+        Container[InputParametersT],
+        await run_in_executor(create_container, config, ddo_fields),
+    )
+    job_details = await _aload(container, input_type)
 
-    result = await job_details.aread()
+    with container.instrumentation().phase("input_parameters") as stats:
+        result = await job_details.aread()
+        _count_parameters(job_details, stats)
 
     if isinstance(result, JobDetailsError):
         raise result
 
+    container.instrumentation().log_summary()
     return result
 
 
 def load_empty_job_details(
     config: Dict[str, JsonValue] = {},
+    ddo_fields: Sequence[str] | None = None,
 ) -> EmptyJobDetails[EmptyInputParameters]:
     """
     Load a EmptyJobDetails using the config.
     """
 
-    container: Container[EmptyInputParameters] = create_container(config)
-    job_details = container.job_details_loader(input_type=None).load()
+    container: Container[EmptyInputParameters] = create_container(config, ddo_fields)
+    job_details = load_from_container(container, None)
 
-    return EmptyJobDetails.model_validate(job_details, from_attributes=True)
+    container.instrumentation().log_summary()
+    return EmptyJobDetails.model_construct(**job_details.shared_fields())
@@ -0,0 +1,114 @@
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from logging import Logger
+from typing import Callable, Dict, Iterator, List, Sequence, TypeAlias
+
+
+@dataclass(frozen=True)
+class PhaseRecord:
+    """Measurements of a load phase"""
+
+    phase: str
+    """Phase name: settings, files, metadata, job_details, ddo or input_parameters"""
+
+    start_ns: int
+    """Start time, as time.time_ns()"""
+
+    wall_time: float
+    """Duration in seconds"""
+
+    bytes_read: int = 0
+    """Bytes read from files"""
+
+    file_count: int = 0
+    """Number of files found or read"""
+
+
+PhaseHook: TypeAlias = Callable[[PhaseRecord], None]
+"""Callback receiving each finished phase"""
+
+
+@dataclass
+class PhaseStats:
+    """Counters filled in by a phase while it runs"""
+
+    bytes_read: int = 0
+    file_count: int = 0
+
+
+class Instrumentation:
+    """Measures the load phases of a job, notifying hooks of each one.
+
+    Phases can finish after the job details are loaded (e.g. the lazily read
+    DDOs), the hooks get them too, while the summary only covers the phases
+    finished by the time it is logged.
+    """
+
+    def __init__(
+        self,
+        hooks: Sequence[PhaseHook] = (),
+        logger: Logger | None = None,
+    ) -> None:
+        self.hooks = list(hooks)
+        self.logger = logger
+        self.records: List[PhaseRecord] = []
+
+    def record(self, record: PhaseRecord) -> None:
+        self.records.append(record)
+        for hook in self.hooks:
+            hook(record)
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[PhaseStats]:
+        """Measure the body as a phase, whose counters it can fill in"""
+
+        stats = PhaseStats()
+        start_ns = time.time_ns()
+        start = time.perf_counter()
+        try:
+            yield stats
+        finally:
+            self.record(
+                PhaseRecord(
+                    phase=name,
+                    start_ns=start_ns,
+                    wall_time=time.perf_counter() - start,
+                    bytes_read=stats.bytes_read,
+                    file_count=stats.file_count,
+                )
+            )
+
+    def summary(self) -> Dict[str, PhaseRecord]:
+        """Records aggregated by phase, in order of first appearance"""
+
+        totals: Dict[str, PhaseRecord] = {}
+        for record in self.records:
+            total = totals.get(record.phase)
+            totals[record.phase] = (
+                record
+                if total is None
+                else PhaseRecord(
+                    phase=record.phase,
+                    start_ns=total.start_ns,
+                    wall_time=total.wall_time + record.wall_time,
+                    bytes_read=total.bytes_read + record.bytes_read,
+                    file_count=total.file_count + record.file_count,
+                )
+            )
+        return totals
+
+    def log_summary(self) -> None:
+        if self.logger is None:
+            return
+
+        totals = self.summary().values()
+        self.logger.info(
+            "Job details loaded in %.2f ms: %s",
+            sum(total.wall_time for total in totals) * 1000,
+            ", ".join(
+                f"{total.phase} {total.wall_time * 1000:.2f} ms "
+                f"({total.file_count} files, {total.bytes_read} bytes)"
+                for total in totals
+            ),
+        )
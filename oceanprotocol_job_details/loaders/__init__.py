@@ -1,9 +1,23 @@
 from oceanprotocol_job_details.loaders.impl import (
+    CSVReader,
     DDOLoader,
     FilesLoader,
     JobDetailsLoader,
+    NumpyReader,
+    ParquetReader,
 )
 from oceanprotocol_job_details.loaders.input_loader import InputLoader
 from oceanprotocol_job_details.loaders.loader import Loader
+from oceanprotocol_job_details.loaders.table_reader import TableReader
 
-__all__ = ["DDOLoader", "FilesLoader", "JobDetailsLoader", "Loader", "InputLoader"]
+__all__ = [
+    "DDOLoader",
+    "FilesLoader",
+    "JobDetailsLoader",
+    "Loader",
+    "InputLoader",
+    "TableReader",
+    "CSVReader",
+    "NumpyReader",
+    "ParquetReader",
+]
@@ -1,5 +1,17 @@
 from oceanprotocol_job_details.loaders.impl.ddo import DDOLoader
 from oceanprotocol_job_details.loaders.impl.files import FilesLoader
 from oceanprotocol_job_details.loaders.impl.job_details import JobDetailsLoader
+from oceanprotocol_job_details.loaders.impl.tabular import (
+    CSVReader,
+    NumpyReader,
+    ParquetReader,
+)
 
-__all__ = ["DDOLoader", "FilesLoader", "JobDetailsLoader"]
+__all__ = [
+    "DDOLoader",
+    "FilesLoader",
+    "JobDetailsLoader",
+    "CSVReader",
+    "NumpyReader",
+    "ParquetReader",
+]
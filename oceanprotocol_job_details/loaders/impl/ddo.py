@@ -1,10 +1,22 @@
 from dataclasses import InitVar, dataclass, field
+from functools import partial
 from pathlib import Path
-from typing import List, Tuple, final
+from typing import Callable, Dict, Literal, Sequence, cast, final
 
 from typing_extensions import override
 
-from oceanprotocol_job_details.domain import DDO, DID, DDOMetadata, Files
+from oceanprotocol_job_details.cache import DDOCache
+from oceanprotocol_job_details.domain import (
+    DDO,
+    DID,
+    DDOMetadata,
+    Files,
+    LazyDDOMetadata,
+)
+from oceanprotocol_job_details.domain.metadata import parse_ddo
+from oceanprotocol_job_details.domain.projection import ProjectedParser, projection
+from oceanprotocol_job_details.executors import process_pool, run_in_executor
+from oceanprotocol_job_details.instrumentation import Instrumentation
 from oceanprotocol_job_details.loaders.loader import Loader
 from oceanprotocol_job_details.plugins import register
 
@@ -16,14 +28,64 @@ class DDOLoader(Loader[DDOMetadata]):
     files: InitVar[Files]
     """The files to load the DDOs from"""
 
-    _files: List[Tuple[DID, Path]] = field(init=False)
+    concurrency: int = 8
+    """Maximum number of DDOs read and validated at the same time by aload_all.
+    The DDOs stay lazy when loaded with aload, see LazyDDOMetadata"""
+
+    fields: Sequence[str] | None = None
+    """Dotted DDO field paths to validate, skipping the rest. All of them if None"""
+
+    cache: DDOCache | None = None
+    """Persistent cache of validated DDOs, not used for projected DDOs"""
+
+    instrumentation: Instrumentation | None = None
+    """Measures the read of each DDO as a "ddo" phase"""
+
+    executor: Literal["serial", "process"] = "serial"
+    """Validate each DDO lazily in this process, or all of them up front in a pool of processes"""
+
+    workers: int | None = None
+    """Number of worker processes, as many as CPUs if None"""
+
+    strict: bool = False
+    """Validate the DDOs without type coercion, bypassing the disk cache"""
+
+    _files: Dict[DID, Path] = field(init=False)
+
+    _parse: Callable[[bytes], DDO] = field(init=False, repr=False)
 
     def __post_init__(self, files: Files) -> None:
         assert files is not None and len(files) != 0, "Missing files"
-        object.__setattr__(self, "_files", [(f.did, f.ddo) for f in files])
+        assert self.concurrency > 0, "Concurrency must be positive"
+        object.__setattr__(self, "_files", {f.did: f.ddo for f in files})
+        object.__setattr__(self, "_parse", self._parser())
+
+    def _parser(self) -> Callable[[bytes], DDO]:
+        if self.fields is None:
+            return partial(parse_ddo, strict=True) if self.strict else parse_ddo
+
+        # Projected DDOs only expose the requested fields, with the same names
+        parser = ProjectedParser(DDO, tuple(self.fields), self.strict)
+        return cast(Callable[[bytes], DDO], parser)
 
     @override
     def load(self) -> DDOMetadata:
-        return {
-            did: DDO.model_validate_json(path.read_bytes()) for did, path in self._files
-        }
+        metadata = LazyDDOMetadata(
+            self._files,
+            parse=self._parse,
+            concurrency=self.concurrency,
+            disk_cache=self.cache if self.fields is None and not self.strict else None,
+            instrumentation=self.instrumentation,
+        )
+
+        if self.executor == "process":
+            model = DDO if self.fields is None else projection(DDO, self.fields)
+            metadata.load_all_in(process_pool(self.workers), model)
+
+        return metadata
+
+    @override
+    async def aload(self) -> DDOMetadata:
+        if self.executor == "process":
+            return await run_in_executor(self.load)
+        return self.load()
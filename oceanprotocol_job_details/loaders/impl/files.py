@@ -1,3 +1,4 @@
+import asyncio
 from dataclasses import dataclass, field
 from logging import Logger
 from pathlib import Path
@@ -5,9 +6,11 @@ from typing import Literal, final
 
 from typing_extensions import override
 
-from oceanprotocol_job_details.domain import DIDPaths, Files, Paths
+from oceanprotocol_job_details.domain import Files, Paths
+from oceanprotocol_job_details.executors import run_in_executor
 from oceanprotocol_job_details.loaders.loader import Loader
 from oceanprotocol_job_details.plugins import register
+from oceanprotocol_job_details.scan import Snapshot, scan
 
 
 @register("files")
@@ -38,11 +41,14 @@ class FilesLoader(Loader[Files]):
 
     @override
     def load(self) -> Files:
-        return [
-            DIDPaths(
-                did=did,
-                ddo=self.calculate_path(did, "ddo"),
-                input_files=list(self.calculate_path(did, "input").glob("*")),
+        return scan(self.paths, self.dids)
+
+    @override
+    async def aload(self) -> Files:
+        snapshot = await run_in_executor(Snapshot.take, self.paths)
+        snapshot.check(self.dids)
+        return list(
+            await asyncio.gather(
+                *(run_in_executor(snapshot.did_paths, did) for did in self.dids)
             )
-            for did in self.dids
-        ]
+        )
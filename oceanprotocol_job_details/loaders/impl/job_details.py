@@ -8,6 +8,7 @@ from oceanprotocol_job_details.domain import DDOMetadata, Files, Paths
 from oceanprotocol_job_details.loaders.loader import Loader
 from oceanprotocol_job_details.ocean import JobDetails
 from oceanprotocol_job_details.plugins import register
+from oceanprotocol_job_details.validators import warm_up
 
 InputParametersT = TypeVar("InputParametersT", bound=BaseModel)
 
@@ -21,13 +22,18 @@ class JobDetailsLoader(Loader[JobDetails[InputParametersT]], Generic[InputParame
     paths: Paths
     metadata: DDOMetadata
     input_type: Type[InputParametersT] | None = None
+    strict: bool = False
 
     @override
     def load(self) -> JobDetails[InputParametersT]:
-        return JobDetails[InputParametersT](
+        # Built now, so reading the input parameters does not pay for it
+        warm_up(self.input_type)
+
+        return JobDetails(
             files=self.files,
             secret=self.secret,
             metadata=self.metadata,
             paths=self.paths,
             input_type=self.input_type,
+            strict=self.strict,
         )
@@ -0,0 +1,90 @@
+import csv
+import importlib
+import math
+from dataclasses import dataclass
+from types import ModuleType
+from typing import Iterator, final
+
+from typing_extensions import override
+
+from oceanprotocol_job_details.loaders.table_reader import TableReader, batch_rows
+from oceanprotocol_job_details.plugins import register
+
+_SNIFF_BYTES = 64 * 1024
+
+
+def _require(module: str) -> ModuleType:
+    try:
+        return importlib.import_module(module)
+    except ImportError as error:
+        package = module.split(".")[0]
+        raise ImportError(
+            f"Reading this input needs {package}, install it with "
+            "`pip install oceanprotocol-job-details[tabular]`"
+        ) from error
+
+
+@register("csv")
+@final
+@dataclass(frozen=True)
+class CSVReader(TableReader):
+    """Streams a CSV file as pyarrow RecordBatches, parsed in parallel by columns"""
+
+    @override
+    def load(self) -> Iterator[object]:
+        pa_csv = _require("pyarrow.csv")
+
+        with open(self.path, newline="") as f:
+            sample = f.read(_SNIFF_BYTES)
+        try:
+            delimiter = csv.Sniffer().sniff(sample, delimiters=",;\t|").delimiter
+        except csv.Error:
+            delimiter = ","
+
+        with pa_csv.open_csv(
+            self.path,
+            read_options=pa_csv.ReadOptions(block_size=min(self.batch_bytes, 2**30)),
+            parse_options=pa_csv.ParseOptions(delimiter=delimiter),
+        ) as reader:
+            yield from reader
+
+
+@register("parquet")
+@final
+@dataclass(frozen=True)
+class ParquetReader(TableReader):
+    """Streams a Parquet file as pyarrow RecordBatches"""
+
+    @override
+    def load(self) -> Iterator[object]:
+        pq = _require("pyarrow.parquet")
+
+        with pq.ParquetFile(self.path) as f:
+            metadata = f.metadata
+            size = sum(
+                metadata.row_group(i).total_byte_size
+                for i in range(metadata.num_row_groups)
+            )
+            rows = batch_rows(size / max(metadata.num_rows, 1), self.batch_bytes)
+            yield from f.iter_batches(batch_size=rows)
+
+
+@register("npy")
+@final
+@dataclass(frozen=True)
+class NumpyReader(TableReader):
+    """Streams a .npy array as memory-mapped slices of rows, without copying"""
+
+    @override
+    def load(self) -> Iterator[object]:
+        np = _require("numpy")
+
+        array = np.load(self.path, mmap_mode="r")
+        if array.ndim == 0:
+            yield array
+            return
+
+        row_bytes = array.itemsize * math.prod(array.shape[1:])
+        rows = batch_rows(row_bytes, self.batch_bytes)
+        for start in range(0, len(array), rows):
+            yield array[start : start + rows]
@@ -1,6 +1,8 @@
 from abc import ABC, abstractmethod
 from typing import Generic, TypeVar
 
+from oceanprotocol_job_details.executors import run_in_executor
+
 T = TypeVar("T", covariant=True)
 
 
@@ -8,3 +10,7 @@ class Loader(ABC, Generic[T]):
     @abstractmethod
     def load(self) -> T:
         """Load an instance of the given type"""
+
+    async def aload(self) -> T:
+        """Load an instance of the given type without blocking the event loop"""
+        return await run_in_executor(self.load)
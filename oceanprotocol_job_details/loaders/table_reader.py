@@ -0,0 +1,34 @@
+from abc import abstractmethod
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Iterator
+
+from oceanprotocol_job_details.loaders.loader import Loader
+from oceanprotocol_job_details.streaming import DEFAULT_BATCH_BYTES
+
+
+def batch_rows(row_bytes: float, batch_bytes: int) -> int:
+    """Number of rows of row_bytes each fitting in a batch of batch_bytes"""
+
+    return max(1, int(batch_bytes // max(row_bytes, 1)))
+
+
+@dataclass(frozen=True)
+class TableReader(Loader[Iterator[object]]):
+    """Reads a tabular input file as a stream of batches of bounded size.
+
+    Implementations are registered for the format they read, e.g. "csv".
+    """
+
+    path: Path
+    """Input file to read"""
+
+    batch_bytes: int = DEFAULT_BATCH_BYTES
+    """Approximate maximum size of each batch"""
+
+    def __post_init__(self) -> None:
+        assert self.batch_bytes > 0, "Batch size must be positive"
+
+    @abstractmethod
+    def load(self) -> Iterator[object]:
+        """Iterate through the batches of the file"""
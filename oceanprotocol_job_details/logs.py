@@ -0,0 +1,278 @@
+"""Non-blocking JSON lines logging to the job logs directory."""
+
+import atexit
+import logging
+import queue
+import sys
+import threading
+import traceback
+from dataclasses import dataclass, field
+from logging.handlers import QueueHandler
+from pathlib import Path
+from typing import BinaryIO, Dict, List, Literal, Tuple, TypeAlias
+
+import orjson
+
+LogPolicy: TypeAlias = Literal["block", "drop"]
+
+DEFAULT_LOG_FILE = "job.jsonl"
+
+# Attributes of every LogRecord, the others were given as extra fields
+_RECORD_ATTRIBUTES = frozenset(
+    vars(logging.LogRecord("", logging.INFO, "", 0, "", None, None))
+) | {"message", "asctime", "taskName"}
+
+
+class JSONLinesFormatter(logging.Formatter):
+    """Formats each record as a JSON object with its time, level, logger and
+    message, the extra fields given to the log call and the exception, if any.
+    """
+
+    def to_json(self, record: logging.LogRecord) -> bytes:
+        entry: Dict[str, object] = {
+            "time": record.created,
+            "level": record.levelname,
+            "logger": record.name,
+            "message": getattr(record, "message", None) or record.getMessage(),
+        }
+        if record.exc_info and not record.exc_text:
+            record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            entry["exception"] = record.exc_text
+        if record.stack_info:
+            entry["stack"] = record.stack_info
+
+        extra = {
+            key: value
+            for key, value in vars(record).items()
+            if key not in _RECORD_ATTRIBUTES
+        }
+        try:
+            return orjson.dumps(
+                {**entry, **extra}, default=str, option=orjson.OPT_NON_STR_KEYS
+            )
+        except orjson.JSONEncodeError:
+            # e.g. integers beyond 64 bits, which default is not called for
+            return orjson.dumps(
+                {**entry, **{key: repr(value) for key, value in extra.items()}}
+            )
+
+    def format(self, record: logging.LogRecord) -> str:
+        return self.to_json(record).decode()
+
+
+_formatter = logging.Formatter()
+
+
+class BoundedQueueHandler(QueueHandler):
+    """QueueHandler of a bounded queue. Once full, logging either blocks until
+    there is room ("block") or drops the record ("drop"), counting it.
+    """
+
+    def __init__(
+        self,
+        records: "queue.Queue[logging.LogRecord | None]",
+        policy: LogPolicy,
+    ) -> None:
+        super().__init__(records)
+        self.records = records
+        self.policy = policy
+        self.dropped = 0
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # Only the message and the exception are resolved in the logging thread,
+        # in place like logging.Formatter does, the JSON is built by the listener
+        record.message = record.getMessage()
+        if record.exc_info and not record.exc_text:
+            record.exc_text = _formatter.formatException(record.exc_info)
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        if self.policy == "block":
+            self.records.put(record)
+            return
+
+        try:
+            self.records.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+
+class JSONLinesListener:
+    """Background thread appending the queued records to a file as JSON lines,
+    in batches of up to batch_size records. After a partial batch, it waits up
+    to flush_interval seconds for more records, rather than waking up (and
+    taking the GIL from the logging thread) for each one.
+    """
+
+    def __init__(
+        self,
+        records: "queue.Queue[logging.LogRecord | None]",
+        path: Path,
+        batch_size: int = 512,
+        flush_interval: float = 0.05,
+    ) -> None:
+        self.queue = records
+        self.path = path
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self._stopping = threading.Event()
+        self.formatter = JSONLinesFormatter()
+        self._thread: threading.Thread | None = None
+
+    def start(self) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        # Opened here, so failing to open it raises to the caller
+        file = open(self.path, "ab")
+        self._thread = threading.Thread(
+            target=self._run, args=(file,), name=f"logs-{self.path.name}", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Write the pending records and stop the thread"""
+
+        if self._thread is not None:
+            self._stopping.set()
+            self.queue.put(None)
+            self._thread.join()
+            self._thread = None
+
+    def _line(self, record: logging.LogRecord) -> bytes:
+        try:
+            return self.formatter.to_json(record) + b"\n"
+        except Exception:
+            entry = {
+                "time": record.created,
+                "level": record.levelname,
+                "logger": record.name,
+                "message": repr(record.msg),
+            }
+            return orjson.dumps(entry) + b"\n"
+
+    def _run(self, file: BinaryIO) -> None:
+        with file as f:
+            running = True
+            while running:
+                batch: List[logging.LogRecord] = []
+                record = self.queue.get()
+                while record is not None:
+                    batch.append(record)
+                    if len(batch) == self.batch_size:
+                        break
+                    try:
+                        record = self.queue.get_nowait()
+                    except queue.Empty:
+                        break
+                else:
+                    running = False
+
+                # The thread must outlive any record or write error, else the
+                # logging calls block once the queue is full
+                if batch:
+                    try:
+                        f.write(b"".join(map(self._line, batch)))
+                        f.flush()
+                    except OSError:
+                        traceback.print_exc(file=sys.stderr)
+                if running and len(batch) < self.batch_size:
+                    self._stopping.wait(self.flush_interval)
+
+
+@dataclass
+class JobLogging:
+    """JSON lines logging of a logger, see json_logging"""
+
+    logger: logging.Logger
+    handler: BoundedQueueHandler
+    listener: JSONLinesListener
+    closed: bool = field(default=False, init=False)
+
+    @property
+    def path(self) -> Path:
+        return self.listener.path
+
+    def close(self) -> None:
+        """Detach from the logger and write the pending records"""
+
+        with _lock:
+            if self.closed:
+                return
+
+            self.closed = True
+            key = (self.logger.name, self.path)
+            if _active.get(key) is self:
+                del _active[key]
+
+            self.logger.removeHandler(self.handler)
+            if self.handler.dropped:
+                self.listener.queue.put(
+                    self.logger.makeRecord(
+                        self.logger.name,
+                        logging.WARNING,
+                        __file__,
+                        0,
+                        "%d log records dropped, the log queue was full",
+                        (self.handler.dropped,),
+                        None,
+                    )
+                )
+            self.listener.stop()
+
+
+# Keyed by logger name and path, so the jobs of a logger each keep their file
+_active: Dict[Tuple[str, Path], JobLogging] = {}
+# Reentrant, as closing the previous logging of a path happens while holding it
+_lock = threading.RLock()
+
+
+def json_logging(
+    logger: logging.Logger,
+    path: Path,
+    queue_size: int = 10_000,
+    policy: LogPolicy = "block",
+) -> JobLogging:
+    """Send the records of logger to path as JSON lines, without blocking.
+
+    The records are put in a queue of queue_size records, written in batches by
+    a background thread, and flushed at exit. A logger writes once to each path,
+    the open logging of the same path is returned, or replaced if its queue_size
+    or policy differ. Other paths are added, so jobs loaded concurrently with the
+    same logger each keep their file, close it once the job is done.
+
+    Args:
+        logger (Logger): Logger whose records are written.
+        path (Path): JSON lines file, appended to.
+        queue_size (int, optional): Records waiting to be written at most.
+        policy (LogPolicy, optional): Once the queue is full, "block" the logging
+            thread until there is room, or "drop" the records.
+    """
+
+    with _lock:
+        previous = _active.get((logger.name, path))
+        if previous is not None:
+            if (
+                previous.listener.queue.maxsize == queue_size
+                and previous.handler.policy == policy
+            ):
+                return previous
+            previous.close()
+
+        records: queue.Queue[logging.LogRecord | None] = queue.Queue(queue_size)
+        handler = BoundedQueueHandler(records, policy)
+        listener = JSONLinesListener(records, path)
+        listener.start()
+        logger.addHandler(handler)
+
+        job_logging = JobLogging(logger, handler, listener)
+        _active[logger.name, path] = job_logging
+        return job_logging
+
+
+@atexit.register
+def close_json_logging() -> None:
+    """Write the pending records of every JSON lines logging"""
+
+    with _lock:
+        for job_logging in list(_active.values()):
+            job_logging.close()
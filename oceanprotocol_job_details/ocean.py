@@ -1,27 +1,109 @@
 from __future__ import annotations
 
+import sys
 from pathlib import Path
-from typing import Generic, Iterator, Tuple, Type, TypeVar, final
+from typing import (
+    Annotated,
+    AsyncIterator,
+    Dict,
+    Generic,
+    Iterator,
+    List,
+    Tuple,
+    Type,
+    TypedDict,
+    TypeVar,
+    final,
+)
+
+if sys.version_info >= (3, 11):
+    from typing import Self
+else:  # pragma: no cover
+    from typing_extensions import Self
 
 import aiofiles
-from pydantic import BaseModel, ConfigDict, Secret, ValidationError
-
-from oceanprotocol_job_details.domain import DDOMetadata, Files, Paths
-from oceanprotocol_job_details.exceptions import JobDetailsError
-from oceanprotocol_job_details.loaders.input_loader import InputLoader
+from pydantic import (
+    BaseModel,
+    ConfigDict,
+    PrivateAttr,
+    Secret,
+    SkipValidation,
+    ValidationError,
+)
+
+from oceanprotocol_job_details.checksums import (
+    DEFAULT_ALGORITHM,
+    DigestCache,
+    digests,
+    parse_checksum,
+)
+from oceanprotocol_job_details.domain import (
+    DDOMetadata,
+    DIDPaths,
+    Files,
+    LazyDDOMetadata,
+    Paths,
+)
+from oceanprotocol_job_details.domain.derived import FileStamp, file_stamp
+from oceanprotocol_job_details.exceptions import (
+    ChecksumCountError,
+    ChecksumMismatchError,
+    JobDetailsError,
+    MissingChecksumsError,
+)
+from oceanprotocol_job_details.executors import run_in_executor
+from oceanprotocol_job_details.outputs import (
+    DEFAULT_BUFFER_SIZE,
+    AsyncOutputWriter,
+    Compression,
+    OutputWriter,
+)
+from oceanprotocol_job_details.scan import Snapshot
+from oceanprotocol_job_details.streaming import (
+    DEFAULT_BATCH_BYTES,
+    DEFAULT_CHUNK_SIZE,
+    DEFAULT_PREFETCH_BYTES,
+    aiter_chunks,
+    aread_concurrently,
+    iter_chunks,
+    mapped,
+    prefetch,
+)
+from oceanprotocol_job_details.validators import input_validator
 
 InputParametersT = TypeVar("InputParametersT", bound=BaseModel)
 
 
+def _parse_input_parameters(
+    raw: bytes,
+    input_type: Type[InputParametersT],
+    strict: bool,
+) -> InputParametersT | JobDetailsError:
+    # Validated straight from the bytes, the JSON parser skips the surrounding
+    # whitespace, so neither decoding nor stripping copies the file contents
+    if not raw or raw.isspace():
+        return JobDetailsError("Algorithm custom input parameters is empty")
+
+    try:
+        assert issubclass(input_type, BaseModel)
+        return input_validator(input_type).validate_json(raw, strict=strict or None)
+    except ValidationError as error:
+        exception = JobDetailsError("Validation failed for input parameters")
+        exception.__cause__ = error
+        return exception
+
+
 def read_input_parameters(
     paths: Paths,
     input_type: Type[InputParametersT],
+    strict: bool = False,
 ) -> InputParametersT | JobDetailsError:
     """Read the input parameters from the paths and validate with the given type.
 
     Args:
         paths (Paths): Paths containing the algorithm custom parameters path.
         input_type (Type[InputParametersT]): Pydantic BaseModel to validate the input parameters data.
+        strict (bool, optional): Validate without type coercion, e.g. "true" is not a bool.
 
     Returns:
         Union[InputParametersT, JobDetailsError]: InputParametersT instance or JobDetailsError
@@ -30,29 +112,21 @@ def read_input_parameters(
     if not paths.algorithm_custom_parameters.exists():
         return JobDetailsError("Algorithm custom input file missing")
 
-    raw = paths.algorithm_custom_parameters.read_text().strip()
-
-    if not raw:
-        return JobDetailsError("Algorithm custom input parameters is empty")
-
-    try:
-        assert issubclass(input_type, BaseModel)
-        return input_type.model_validate_json(raw)
-    except ValidationError as error:
-        exception = JobDetailsError("Validation failed for input parameters")
-        exception.__cause__ = error
-        return exception
+    raw = paths.algorithm_custom_parameters.read_bytes()
+    return _parse_input_parameters(raw, input_type, strict)
 
 
 async def aread_input_parameters(
     paths: Paths,
     input_type: Type[InputParametersT],
+    strict: bool = False,
 ) -> InputParametersT | JobDetailsError:
     """Read the input parameters from the paths and validate with the given type.
 
     Args:
         paths (Paths): Paths containing the algorithm custom parameters path.
         input_type (Type[InputParametersT]): Pydantic BaseModel to validate the input parameters data.
+        strict (bool, optional): Validate without type coercion, e.g. "true" is not a bool.
 
     Returns:
         Union[InputParametersT, JobDetailsError]: InputParametersT instance or JobDetailsError
@@ -61,19 +135,24 @@ async def aread_input_parameters(
     if not paths.algorithm_custom_parameters.exists():
         return JobDetailsError("Algorithm custom input file missing")
 
-    async with aiofiles.open(paths.algorithm_custom_parameters, "r") as f:
-        raw = (await f.read()).strip()
+    async with aiofiles.open(paths.algorithm_custom_parameters, "rb") as f:
+        raw = await f.read()
 
-    if not raw:
-        return JobDetailsError("Algorithm custom input parameters is empty")
+    return _parse_input_parameters(raw, input_type, strict)
 
-    try:
-        assert issubclass(input_type, BaseModel)
-        return input_type.model_validate_json(raw)
-    except ValidationError as error:
-        exception = JobDetailsError("Validation failed for input parameters")
-        exception.__cause__ = error
-        return exception
+
+def _reuse(old: DIDPaths, new: DIDPaths) -> DIDPaths:
+    return old if new.ddo == old.ddo and new.index == old.index else new
+
+
+class SharedFields(TypedDict):
+    """Fields of _BaseJobDetails shared by every job type, see shared_fields"""
+
+    files: Files
+    metadata: DDOMetadata
+    paths: Paths
+    secret: Secret[str] | None
+    strict: bool
 
 
 class _BaseJobDetails(BaseModel, Generic[InputParametersT]):  # type: ignore[explicit-any]
@@ -82,8 +161,8 @@ class _BaseJobDetails(BaseModel, Generic[InputParametersT]):  # type: ignore[exp
     files: Files
     """The provider loaded DID and DDO files"""
 
-    metadata: DDOMetadata
-    """Dict with the DDO contents of each DID"""
+    metadata: Annotated[DDOMetadata, SkipValidation]
+    """Mapping with the DDO contents of each DID, lazily read on first access"""
 
     paths: Paths
     """Main used paths"""
@@ -94,12 +173,66 @@ class _BaseJobDetails(BaseModel, Generic[InputParametersT]):  # type: ignore[exp
     secret: Secret[str] | None = None
     """Secret loaded from environment"""
 
+    strict: bool = False
+    """Whether the input parameters are validated without type coercion"""
+
     model_config = ConfigDict(
         arbitrary_types_allowed=True,
         frozen=True,
         from_attributes=True,
     )
 
+    def shared_fields(self) -> SharedFields:
+        """
+        The already validated fields shared by every job type (all but the
+        input_type), by reference, to build another job type without
+        re-validating them.
+        """
+
+        return SharedFields(
+            files=self.files,
+            metadata=self.metadata,
+            paths=self.paths,
+            secret=self.secret,
+            strict=self.strict,
+        )
+
+    def refresh(self) -> Self:
+        """
+        Reload the job details after the files changed, keeping the DIDPaths of
+        the DIDs whose input files are unchanged (same names, sizes and
+        modification times) and the already read DDOs whose file is unchanged.
+        Returns self if nothing changed.
+
+        Raises:
+            MissingDDOError: If the DDO file of any DID is gone.
+        """
+
+        snapshot = Snapshot.take(self.paths)
+        snapshot.check([did_paths.did for did_paths in self.files])
+
+        files = [
+            _reuse(did_paths, snapshot.did_paths(did_paths.did))
+            for did_paths in self.files
+        ]
+        metadata = (
+            self.metadata.refresh({did_paths.did: did_paths.ddo for did_paths in files})
+            if isinstance(self.metadata, LazyDDOMetadata)
+            else self.metadata
+        )
+
+        if metadata is self.metadata and all(
+            new is old for new, old in zip(files, self.files)
+        ):
+            return self
+
+        return self.model_copy(update={"files": files, "metadata": metadata})
+
+    async def arefresh(self) -> Self:
+        """Reload the job details after the files changed, see refresh"""
+
+        return await run_in_executor(self.refresh)
+
     def inputs(self) -> Iterator[Tuple[str, Path]]:
         """
         Iterate through tuples containing the DID and the Path of each input file.
@@ -107,20 +240,230 @@ class _BaseJobDetails(BaseModel, Generic[InputParametersT]):  # type: ignore[exp
         """
 
         yield from (
-            (file.parent.name, file)
-            for files in self.files
-            for file in files.input_files
+            (files.did, file.path) for files in self.files for file in files.index
+        )
+
+    async def ainputs(
+        self,
+        concurrency: int = 8,
+        ordered: bool = True,
+    ) -> AsyncIterator[Tuple[str, Path, bytes]]:
+        """
+        Asynchronously iterate through tuples containing the DID, the Path and
+        the contents of each input file, with up to concurrency files read at
+        once. In inputs() order if ordered, otherwise as soon as each is read.
+        """
+
+        async for item in aread_concurrently(self.inputs(), concurrency, ordered):
+            yield item
+
+    def checksums(
+        self,
+        algorithm: str = DEFAULT_ALGORITHM,
+        max_workers: int | None = None,
+        cache: Path | None = None,
+        verify: bool = False,
+    ) -> Dict[Path, str]:
+        """
+        Hex digests of every input file with a hashlib algorithm (e.g. sha256 or
+        blake2b), hashed in parallel in max_workers threads.
+
+        Args:
+            algorithm (str, optional): hashlib algorithm name.
+            max_workers (int | None, optional): Number of hashing threads.
+            cache (Path | None, optional): JSON file persisting the digests, reused
+                for the files with the same size and modification time.
+            verify (bool, optional): Check the files against the checksums listed,
+                in order, by the services of their DDO.
+
+        Raises:
+            ChecksumMismatchError: If verifying and any file does not match.
+            ChecksumCountError: If verifying and a DDO lists checksums, but not
+                one for each input file of its DID.
+            MissingChecksumsError: If verifying and a DID has input files but its
+                DDO lists no checksums, or was projected without its services.
+        """
+
+        expected = self._expected_checksums() if verify else {}
+        inputs = [path for _, path in self.inputs()]
+
+        results = digests(
+            [(path, algorithm) for path in inputs]
+            + [
+                (path, expected_algorithm)
+                for path, (expected_algorithm, _) in expected.items()
+                if expected_algorithm != algorithm
+            ],
+            max_workers,
+            DigestCache(cache) if cache is not None else None,
+        )
+
+        mismatches = [
+            path
+            for path, (expected_algorithm, digest) in expected.items()
+            if results[path, expected_algorithm] != digest
+        ]
+        if mismatches:
+            raise ChecksumMismatchError(mismatches)
+
+        return {path: results[path, algorithm] for path in inputs}
+
+    async def achecksums(
+        self,
+        algorithm: str = DEFAULT_ALGORITHM,
+        max_workers: int | None = None,
+        cache: Path | None = None,
+        verify: bool = False,
+    ) -> Dict[Path, str]:
+        """Hex digests of every input file, without blocking the loop, see checksums"""
+
+        return await run_in_executor(
+            self.checksums, algorithm, max_workers, cache, verify
+        )
+
+    def _expected_checksums(self) -> Dict[Path, Tuple[str, str]]:
+        expected: Dict[Path, Tuple[str, str]] = {}
+        for did_paths in self.files:
+            paths = [file.path for file in did_paths.index]
+            ddo = self.metadata[did_paths.did]
+            # Projected DDOs may not have the services
+            services = getattr(ddo, "services", None)
+            checksums: List[str] = next(
+                (
+                    service.checksums
+                    for service in services or []
+                    if getattr(service, "checksums", None)
+                ),
+                [],
+            )
+            if paths and not checksums:
+                raise MissingChecksumsError(
+                    did_paths.did, paths, projected=services is None
+                )
+            if len(checksums) != len(paths):
+                raise ChecksumCountError(did_paths.did, paths, len(checksums))
+            for file, checksum in zip(did_paths.index, checksums):
+                expected[file.path] = parse_checksum(checksum)
+        return expected
+
+    def input_chunks(
+        self,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> Iterator[Tuple[str, Path, bytes]]:
+        """
+        Iterate through the contents of each input file in chunks of at most
+        chunk_size bytes, as tuples containing the DID, the Path and the chunk.
+        Keeps memory usage constant regardless of the input files size.
+        """
+
+        for did, path in self.inputs():
+            for chunk in iter_chunks(path, chunk_size):
+                yield did, path, chunk
+
+    async def ainput_chunks(
+        self,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> AsyncIterator[Tuple[str, Path, bytes]]:
+        """
+        Asynchronously iterate through the contents of each input file in chunks
+        of at most chunk_size bytes, as tuples containing the DID, the Path and
+        the chunk.
+        """
+
+        for did, path in self.inputs():
+            async for chunk in aiter_chunks(path, chunk_size):
+                yield did, path, chunk
+
+    def input_batches(
+        self,
+        batch_bytes: int = DEFAULT_BATCH_BYTES,
+        as_numpy: bool = False,
+    ) -> Iterator[Tuple[str, Path, object]]:
+        """
+        Iterate through tuples containing the DID, the Path and each batch of
+        about batch_bytes of the tabular input files (CSV, Parquet or .npy,
+        detected from their contents), as pyarrow RecordBatches or NumPy arrays.
+        If as_numpy, RecordBatches are given as dicts of NumPy column arrays.
+        Needs the "tabular" extra.
+        """
+
+        # Imported on use, the loaders import this module
+        from oceanprotocol_job_details.tabular import iter_batches, to_numpy
+
+        for did, path in self.inputs():
+            for batch in iter_batches(path, batch_bytes):
+                yield did, path, to_numpy(batch) if as_numpy else batch
+
+    def mapped_inputs(self) -> Iterator[Tuple[str, Path, memoryview]]:
+        """
+        Iterate through tuples containing the DID, the Path and a read-only
+        memory-mapped view of each input file, without copying it into memory.
+        Each view is released when the next one is requested, slices of it (or
+        arrays over it) keep its file mapped while they are alive.
+        """
+
+        for did, path in self.inputs():
+            with mapped(path) as view:
+                yield did, path, view
+
+    def prefetch_inputs(
+        self,
+        depth: int = 4,
+        max_bytes: int = DEFAULT_PREFETCH_BYTES,
+        chunk_size: int | None = None,
+    ) -> Iterator[Tuple[str, Path, bytes]]:
+        """
+        Iterate through tuples containing the DID, the Path and the contents of
+        each input file (or chunks of chunk_size bytes), in inputs() order, while
+        up to depth files are read ahead in background threads. At most max_bytes
+        of read ahead data are held at once. Hides slow storage latency behind
+        the processing of the previous files.
+        """
+
+        yield from prefetch(self.inputs(), depth, max_bytes, chunk_size)
+
+    def open_output(
+        self,
+        name: str | Path,
+        compression: Compression | None = None,
+        buffer_size: int = DEFAULT_BUFFER_SIZE,
+        background: bool = True,
+    ) -> OutputWriter:
+        """
+        Buffered writer of the given file of the outputs directory, which only
+        shows up at its path once closed, optionally compressed with gzip or
+        zstd. With background, the writes overlap with the computation in a
+        separate thread. Use it as a context manager.
+        """
+
+        return OutputWriter(
+            self.paths.outputs / name, compression, buffer_size, background
         )
 
+    def aopen_output(
+        self,
+        name: str | Path,
+        compression: Compression | None = None,
+        buffer_size: int = DEFAULT_BUFFER_SIZE,
+    ) -> AsyncOutputWriter:
+        """Writer of an outputs file not blocking the event loop, see open_output"""
+
+        return AsyncOutputWriter(self.paths.outputs / name, compression, buffer_size)
+
 
 class JobDetails(_BaseJobDetails[InputParametersT]):  # type: ignore[explicit-any]
     """Class holding the OceanProtocol job details."""
 
     async def aread(
         self,
+        strict: bool | None = None,
     ) -> ParametrizedJobDetails[InputParametersT] | JobDetailsError:
         """Read the input parameters and get a ParametrizedJobDetails instance.
 
+        Args:
+            strict (bool | None, optional): Validate without type coercion, as
+                set by the strict setting if None.
+
         Returns:
             Union[ParametrizedJobDetails[InputParametersT], JobDetailsError]: Success if the input_type is set.
         """
@@ -128,21 +471,31 @@ class JobDetails(_BaseJobDetails[InputParametersT]):  # type: ignore[explicit-an
         if self.input_type is None:
             return JobDetailsError("JobDetails has no input parameters")
 
-        result = await aread_input_parameters(self.paths, self.input_type)
+        strict = self.strict if strict is None else strict
+        stamp = file_stamp(self.paths.algorithm_custom_parameters)
+        result = await aread_input_parameters(self.paths, self.input_type, strict)
 
         if isinstance(result, JobDetailsError):
             return result
 
-        return ParametrizedJobDetails(
-            input_parameters=result,
-            **self.model_dump(exclude={"input_type"}),
+        fields = self.shared_fields()
+        fields["strict"] = strict
+        job_details: ParametrizedJobDetails[InputParametersT] = (
+            ParametrizedJobDetails.model_construct(input_parameters=result, **fields)
         )
+        job_details._parameters_stamp = stamp
+        return job_details
 
     def read(
         self,
+        strict: bool | None = None,
     ) -> ParametrizedJobDetails[InputParametersT] | JobDetailsError:
         """Read the input parameters and get a ParametrizedJobDetails instance.
 
+        Args:
+            strict (bool | None, optional): Validate without type coercion, as
+                set by the strict setting if None.
+
         Returns:
             Union[ParametrizedJobDetails[InputParametersT], JobDetailsError]: Success if the input_type is set.
         """
@@ -150,15 +503,20 @@ class JobDetails(_BaseJobDetails[InputParametersT]):  # type: ignore[explicit-an
         if self.input_type is None:
             return JobDetailsError("JobDetails has no input parameters")
 
-        result = read_input_parameters(self.paths, self.input_type)
+        strict = self.strict if strict is None else strict
+        stamp = file_stamp(self.paths.algorithm_custom_parameters)
+        result = read_input_parameters(self.paths, self.input_type, strict)
 
         if isinstance(result, JobDetailsError):
             return result
 
-        return ParametrizedJobDetails(
-            input_parameters=result,
-            **self.model_dump(exclude={"input_type"}),
+        fields = self.shared_fields()
+        fields["strict"] = strict
+        job_details: ParametrizedJobDetails[InputParametersT] = (
+            ParametrizedJobDetails.model_construct(input_parameters=result, **fields)
         )
+        job_details._parameters_stamp = stamp
+        return job_details
 
 
 @final
@@ -167,6 +525,35 @@ class ParametrizedJobDetails(_BaseJobDetails[InputParametersT]):  # type: ignore
 
     input_parameters: InputParametersT
 
+    _parameters_stamp: FileStamp | None = PrivateAttr(default=None)
+    """Stamp of the input parameters file when read"""
+
+    def refresh(self) -> Self:
+        """
+        Reload the job details after the files changed, see JobDetails.refresh,
+        reading the input parameters again only if their file changed.
+
+        Raises:
+            MissingDDOError: If the DDO file of any DID is gone.
+            JobDetailsError: If the changed input parameters are not valid.
+        """
+
+        refreshed = super().refresh()
+
+        stamp = file_stamp(self.paths.algorithm_custom_parameters)
+        if stamp == self._parameters_stamp:
+            return refreshed
+
+        result = read_input_parameters(
+            self.paths, type(self.input_parameters), self.strict
+        )
+        if isinstance(result, JobDetailsError):
+            raise result
+
+        job_details = refreshed.model_copy(update={"input_parameters": result})
+        job_details._parameters_stamp = stamp
+        return job_details
+
 
 @final
 class EmptyJobDetails(_BaseJobDetails[InputParametersT]):  # type: ignore[explicit-any]
@@ -0,0 +1,287 @@
+"""Buffered writers of the job output files."""
+
+import asyncio
+import gzip
+import importlib
+import os
+import queue
+import secrets
+import tempfile
+import threading
+from pathlib import Path
+from types import TracebackType
+from typing import BinaryIO, List, Literal, Tuple, TypeAlias, cast
+
+from oceanprotocol_job_details.executors import run_in_executor
+
+DEFAULT_BUFFER_SIZE = 1024 * 1024
+
+Compression: TypeAlias = Literal["gzip", "zstd"]
+
+
+def _create_temporary(path: Path) -> Tuple[int, Path]:
+    """Create a hidden file next to path, with the mode open() would give it"""
+
+    for _ in range(tempfile.TMP_MAX):
+        temporary = path.with_name(f".{path.name}.{secrets.token_hex(4)}.tmp")
+        try:
+            # Unlike mkstemp (0o600), the kernel applies the umask to 0o666
+            fd = os.open(temporary, os.O_CREAT | os.O_EXCL | os.O_WRONLY, 0o666)
+        except FileExistsError:
+            continue
+        return fd, temporary
+
+    raise FileExistsError(f"No temporary file name available for {path}")
+
+
+def _compressed(raw: BinaryIO, name: str, compression: Compression | None) -> BinaryIO:
+    if compression is None:
+        return raw
+
+    if compression == "gzip":
+        return cast(BinaryIO, gzip.GzipFile(filename=name, mode="wb", fileobj=raw))
+
+    try:
+        zstandard = importlib.import_module("zstandard")
+    except ImportError as error:
+        raise ImportError(
+            "zstd compression needs zstandard, install it with "
+            "`pip install oceanprotocol-job-details[zstd]`"
+        ) from error
+    return zstandard.ZstdCompressor().stream_writer(raw, closefd=False)  # type: ignore[no-any-return]
+
+
+class OutputWriter:
+    """Buffered binary writer of an output file.
+
+    Writes are gathered into buffers of buffer_size bytes, compressed and
+    written to a hidden temporary file next to the target, which is renamed to
+    it on close, so the file never appears half written. With background, the
+    full buffers are written by a separate thread, overlapping the writes with
+    the computation, while at most max_pending buffers wait to be written.
+
+    Example:
+        with OutputWriter(paths.outputs / "results.csv.gz", "gzip") as writer:
+            writer.write(b"...")
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        compression: Compression | None = None,
+        buffer_size: int = DEFAULT_BUFFER_SIZE,
+        background: bool = True,
+        max_pending: int = 4,
+        fsync: bool = False,
+    ) -> None:
+        """
+        Args:
+            path (Path): File to write, its directory is created if missing.
+            compression (Compression | None, optional): Compress with gzip or zstd.
+            buffer_size (int, optional): Bytes gathered before each write.
+            background (bool, optional): Write in a background thread.
+            max_pending (int, optional): Buffers waiting for the background thread
+                before write blocks.
+            fsync (bool, optional): Flush the file to disk before renaming it.
+        """
+
+        assert buffer_size > 0, "Buffer size must be positive"
+        assert max_pending > 0, "Pending buffers must be positive"
+
+        self.path = path
+        self.buffer_size = buffer_size
+        self.fsync = fsync
+        self.closed = False
+
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, self._temporary = _create_temporary(path)
+        self._raw: BinaryIO = os.fdopen(fd, "wb")
+        try:
+            self._stream = _compressed(self._raw, path.name, compression)
+        except BaseException:
+            self._discard()
+            raise
+
+        self._buffer = bytearray()
+        self._error: BaseException | None = None
+        self._queue: queue.Queue[bytes | None] | None = None
+        self._thread: threading.Thread | None = None
+        if background:
+            self._queue = queue.Queue(max_pending)
+            self._thread = threading.Thread(
+                target=self._run, name=f"output-{path.name}", daemon=True
+            )
+            self._thread.start()
+
+    def __enter__(self) -> "OutputWriter":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        if exc is None:
+            self.close()
+        else:
+            self.abort()
+
+    def _run(self) -> None:
+        assert self._queue is not None
+        while (data := self._queue.get()) is not None:
+            if self._error is None:
+                try:
+                    self._stream.write(data)
+                except BaseException as error:
+                    self._error = error
+
+    def _raise(self) -> None:
+        if self._error is not None:
+            raise self._error
+
+    def _append(self, data: bytes | bytearray | memoryview | str) -> int:
+        if self.closed:
+            raise ValueError("Write to a closed OutputWriter")
+        self._raise()
+
+        if isinstance(data, str):
+            data = data.encode()
+        self._buffer += data
+        return len(data)
+
+    @property
+    def full(self) -> bool:
+        """Whether the buffer is due to be written"""
+        return len(self._buffer) >= self.buffer_size
+
+    def write(self, data: bytes | bytearray | memoryview | str) -> int:
+        """Buffer data, str being encoded as UTF-8, returning its size"""
+
+        size = self._append(data)
+        if self.full:
+            self.flush()
+        return size
+
+    def writelines(self, lines: List[bytes] | List[str]) -> None:
+        for line in lines:
+            self.write(line)
+
+    def _take(self) -> bytes:
+        data, self._buffer = bytes(self._buffer), bytearray()
+        return data
+
+    def _put(self, data: bytes) -> None:
+        if self._queue is None:
+            self._stream.write(data)
+        else:
+            self._queue.put(data)
+        self._raise()
+
+    def flush(self) -> None:
+        """Hand the buffered data to be written, blocking if max_pending are waiting"""
+
+        if self._buffer:
+            self._put(self._take())
+
+    def _drain(self) -> None:
+        if self._queue is not None and self._thread is not None:
+            self._queue.put(None)
+            self._thread.join()
+            self._queue = self._thread = None
+
+    def _discard(self) -> None:
+        self._raw.close()
+        self._temporary.unlink(missing_ok=True)
+
+    def close(self) -> None:
+        """Write the remaining data and rename the file to its path"""
+
+        if self.closed:
+            return
+
+        try:
+            self.flush()
+            self._drain()
+            self._raise()
+            if self._stream is not self._raw:
+                self._stream.close()
+            self._raw.flush()
+            if self.fsync:
+                os.fsync(self._raw.fileno())
+            self._raw.close()
+            os.replace(self._temporary, self.path)
+        except BaseException:
+            self.abort()
+            raise
+        self.closed = True
+
+    def abort(self) -> None:
+        """Discard the file, leaving any previous one at its path untouched"""
+
+        if self.closed:
+            return
+
+        self.closed = True
+        self._buffer = bytearray()
+        self._drain()
+        self._discard()
+
+
+class AsyncOutputWriter:
+    """OutputWriter not blocking the event loop, see OutputWriter.
+
+    Example:
+        async with AsyncOutputWriter(paths.outputs / "results.jsonl") as writer:
+            await writer.write(b"...")
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        compression: Compression | None = None,
+        buffer_size: int = DEFAULT_BUFFER_SIZE,
+        max_pending: int = 4,
+        fsync: bool = False,
+    ) -> None:
+        # Always written in the background, the loop only hands over the buffers
+        self._writer = OutputWriter(
+            path, compression, buffer_size, True, max_pending, fsync
+        )
+        self._lock = asyncio.Lock()
+
+    @property
+    def path(self) -> Path:
+        return self._writer.path
+
+    async def __aenter__(self) -> "AsyncOutputWriter":
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        if exc is None:
+            await self.close()
+        else:
+            await self.abort()
+
+    async def write(self, data: bytes | bytearray | memoryview | str) -> int:
+        """Buffer data, only leaving the loop to hand over a full buffer"""
+
+        size = self._writer._append(data)
+        if self._writer.full:
+            # Taken in the loop thread, and handed over in order
+            buffer = self._writer._take()
+            async with self._lock:
+                await run_in_executor(self._writer._put, buffer)
+        return size
+
+    async def close(self) -> None:
+        async with self._lock:
+            await run_in_executor(self._writer.close)
+
+    async def abort(self) -> None:
+        await run_in_executor(self._writer.abort)
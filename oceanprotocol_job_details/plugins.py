@@ -6,6 +6,10 @@ T = TypeVar("T")
 class PluginRegistry(Generic[T]):
     _registry: dict[type[T], dict[str, list[type[T]]]] = {}
 
+    # Resolved plugin of each (interface, supported), filled on first get and
+    # forgotten for the pairs a register call changes
+    _resolved: dict[tuple[type[T], str], type[T]] = {}
+
     @classmethod
     def register(
         cls,
@@ -24,14 +28,22 @@ class PluginRegistry(Generic[T]):
         iface_registry = cls._registry.setdefault(interface, {})
         for sup in supported:
             iface_registry.setdefault(sup, []).append(plugin)
+            cls._resolved.pop((interface, sup), None)
 
         return plugin
 
     @classmethod
     def get(cls, interface: type[T], sup: str = "") -> type[T]:
+        try:
+            return cls._resolved[interface, sup]
+        except KeyError:
+            pass
+
         plugins = cls._registry.get(interface, {}).get(sup, [])
         assert plugins, f"Class {interface} has no plugin supporting {sup}"
-        return plugins[-1]
+
+        plugin = cls._resolved[interface, sup] = plugins[-1]
+        return plugin
 
     @classmethod
     def get_instance(cls, interface: type[T], sup: str = "", *args, **kwargs) -> T:
@@ -0,0 +1,110 @@
+import os
+from dataclasses import dataclass
+from pathlib import Path
+from typing import FrozenSet, List, Sequence, Tuple
+
+from oceanprotocol_job_details.domain import DID, DIDPaths, InputFile, Paths
+from oceanprotocol_job_details.exceptions import MissingDDOError
+
+
+def _order(name: str) -> int | None:
+    return int(name) if name.isdecimal() else None
+
+
+def list_names(directory: Path, dirs: bool = False) -> FrozenSet[str]:
+    """Names of the files (or directories) of a directory, in one os.scandir pass.
+
+    Hidden entries are listed too, as Path.glob("*") does, and a missing
+    directory has no entries.
+    """
+
+    try:
+        with os.scandir(directory) as it:
+            return frozenset(
+                entry.name
+                for entry in it
+                if (entry.is_dir() if dirs else entry.is_file())
+            )
+    except FileNotFoundError:
+        return frozenset()
+
+
+def index_inputs(directory: Path) -> Tuple[InputFile, ...]:
+    """Index the input files of a directory in a single os.scandir pass.
+
+    Files are sorted numerically by name (0, 1, 2, ..., 10), followed by the
+    non numeric ones in name order. Hidden files are indexed like any other,
+    while subdirectories are skipped. A missing directory has no input files.
+    """
+
+    files: List[InputFile] = []
+    try:
+        with os.scandir(directory) as it:
+            for entry in it:
+                if not entry.is_file():
+                    continue
+                stat = entry.stat()
+                files.append(
+                    InputFile(
+                        directory=directory,
+                        name=entry.name,
+                        size=stat.st_size,
+                        mtime_ns=stat.st_mtime_ns,
+                        order=_order(entry.name),
+                    )
+                )
+    except FileNotFoundError:
+        pass
+
+    files.sort(key=lambda file: (file.order is None, file.order or 0, file.name))
+    return tuple(files)
+
+
+@dataclass(frozen=True)
+class Snapshot:
+    """Listing of the ddos and inputs directories, taken once per load"""
+
+    paths: Paths
+
+    ddos: FrozenSet[str]
+    """Names of the DDO files"""
+
+    inputs: FrozenSet[str]
+    """Names of the input directories, one per DID with input files"""
+
+    @classmethod
+    def take(cls, paths: Paths) -> "Snapshot":
+        return cls(
+            paths=paths,
+            ddos=list_names(paths.ddos),
+            inputs=list_names(paths.inputs, dirs=True),
+        )
+
+    def check(self, dids: Sequence[DID]) -> None:
+        """Raise a MissingDDOError listing every DID without a DDO file"""
+
+        missing = [did for did in dids if did not in self.ddos]
+        if missing:
+            raise MissingDDOError(missing)
+
+    def did_paths(self, did: DID) -> DIDPaths:
+        """Paths of a DID, only listing its input directory if it exists"""
+
+        index = index_inputs(self.paths.inputs / did) if did in self.inputs else ()
+        return DIDPaths(
+            did=did,
+            ddo=self.paths.ddos / did,
+            index=index,
+        )
+
+
+def scan(paths: Paths, dids: Sequence[DID]) -> List[DIDPaths]:
+    """Build the paths of every DID from a single listing of the data directories.
+
+    Raises:
+        MissingDDOError: If any of the DIDs has no DDO file.
+    """
+
+    snapshot = Snapshot.take(paths)
+    snapshot.check(dids)
+    return [snapshot.did_paths(did) for did in dids]
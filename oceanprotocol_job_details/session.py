@@ -0,0 +1,192 @@
+import threading
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from pathlib import Path
+from types import TracebackType
+from typing import (
+    Callable,
+    Dict,
+    Generic,
+    Iterable,
+    List,
+    Literal,
+    Sequence,
+    Type,
+    TypeAlias,
+    TypeVar,
+    cast,
+)
+
+from pydantic import BaseModel, JsonValue
+
+from oceanprotocol_job_details.di import Container
+from oceanprotocol_job_details.helpers import load_from_container
+from oceanprotocol_job_details.instrumentation import PhaseRecord
+from oceanprotocol_job_details.ocean import JobDetails
+from oceanprotocol_job_details.settings import JobSettings
+from oceanprotocol_job_details.validators import warm_up
+
+InputParametersT = TypeVar("InputParametersT", bound=BaseModel)
+
+LoadMode: TypeAlias = Literal["serial", "thread", "process"]
+
+
+class JobDetailsSession(Generic[InputParametersT]):
+    """Load the details of many jobs in a long-lived process.
+
+    The settings are validated once and copied for each job directory, and
+    each thread reuses its own configured container, so loading a job only
+    costs its file I/O. Use as a context manager to shut down the worker pool.
+
+    Example:
+        with JobDetailsSession(InputParameters, {"transformation_did": "..."}) as s:
+            for job_details in s.load_many(base_dirs, executor="thread"):
+                ...
+    """
+
+    def __init__(
+        self,
+        input_type: Type[InputParametersT] | None = None,
+        config: Dict[str, JsonValue] = {},
+        ddo_fields: Sequence[str] | None = None,
+        max_workers: int | None = None,
+    ) -> None:
+        """
+        Args:
+            input_type (Type[InputParametersT] | None, optional): Algorithm's
+                custom input type.
+            config (Dict[str, JsonValue], optional): Settings shared by every job,
+                the base_dir is given per job.
+            ddo_fields (Sequence[str] | None, optional): DDO fields to validate.
+            max_workers (int | None, optional): Size of the thread or process
+                pool used by load_many.
+        """
+
+        if ddo_fields is not None:
+            config = {**config, "ddo_fields": list(ddo_fields)}
+
+        self.input_type = input_type
+        self.config = config
+        self.max_workers = max_workers
+
+        self._settings: JobSettings | None = None
+        self._settings_lock = threading.Lock()
+        self._local = threading.local()
+        self._pools: Dict[LoadMode, Executor] = {}
+
+        warm_up(input_type)
+
+    def __enter__(self) -> "JobDetailsSession[InputParametersT]":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Shut down the worker pools"""
+
+        for pool in self._pools.values():
+            pool.shutdown()
+        self._pools.clear()
+
+    def settings(self, base_dir: Path) -> JobSettings:
+        """Settings of a job directory, only fully validated for the first one"""
+
+        with self._settings_lock:
+            if self._settings is None:
+                self._settings = JobSettings.model_validate(
+                    {**self.config, "base_dir": str(base_dir)}
+                )
+                return self._settings
+
+        return self._settings.with_base_dir(base_dir)
+
+    def _container(self) -> Container[InputParametersT]:
+        container: Container[InputParametersT] | None = getattr(
+            self._local, "container", None
+        )
+        if container is None:
+            container = self._local.container = Container[InputParametersT]()
+        return container
+
+    def load(self, base_dir: Path | str) -> JobDetails[InputParametersT]:
+        """Load the JobDetails of a job directory"""
+
+        start_ns, start = time.time_ns(), time.perf_counter()
+        settings = self.settings(Path(base_dir))
+
+        container = self._container()
+        container.reset_singletons()
+        container.config.from_pydantic(settings)
+        container.job_logging()
+        container.instrumentation().record(
+            PhaseRecord("settings", start_ns, time.perf_counter() - start)
+        )
+
+        job_details = load_from_container(container, self.input_type)
+        container.instrumentation().log_summary()
+        return job_details
+
+    def _pool(self, executor: LoadMode) -> Executor:
+        pool = self._pools.get(executor)
+        if pool is None:
+            if executor == "thread":
+                pool = ThreadPoolExecutor(self.max_workers, "job-details")
+            else:
+                pool = ProcessPoolExecutor(
+                    self.max_workers,
+                    initializer=_init_worker,
+                    initargs=(self.input_type, self.config),
+                )
+            self._pools[executor] = pool
+        return pool
+
+    def load_many(
+        self,
+        base_dirs: Iterable[Path | str],
+        executor: LoadMode = "serial",
+    ) -> List[JobDetails[InputParametersT]]:
+        """Load the JobDetails of many job directories, in order.
+
+        Args:
+            base_dirs (Iterable[Path | str]): Job directories.
+            executor (LoadMode, optional): Load one after another ("serial"),
+                or in parallel in a pool of threads ("thread") or processes
+                ("process"), each process keeping its own session.
+
+        Returns:
+            List[JobDetails[InputParametersT]]: JobDetails of each directory.
+        """
+
+        if executor == "serial":
+            return [self.load(base_dir) for base_dir in base_dirs]
+
+        if executor == "thread":
+            return list(self._pool(executor).map(self.load, base_dirs))
+
+        # Each worker process keeps a session of the same input type
+        load = cast(
+            Callable[[Path | str], JobDetails[InputParametersT]], _load_in_worker
+        )
+        return list(self._pool(executor).map(load, base_dirs))
+
+
+_worker_session: JobDetailsSession[BaseModel] | None = None
+
+
+def _init_worker(
+    input_type: Type[BaseModel] | None,
+    config: Dict[str, JsonValue],
+) -> None:
+    global _worker_session
+    _worker_session = JobDetailsSession(input_type, config)
+
+
+def _load_in_worker(base_dir: Path | str) -> JobDetails[BaseModel]:
+    assert _worker_session is not None, "Worker session not initialized"
+    return _worker_session.load(base_dir)
@@ -1,6 +1,7 @@
 import sys
 from logging import Logger, getLogger
 from pathlib import Path
+from typing import Literal
 
 if sys.version_info >= (3, 11):
     from typing import Self
@@ -8,9 +9,13 @@ else:  # pragma: no cover
     from typing_extensions import Self
 
 import orjson
-from pydantic import Field, Secret, field_validator, model_validator
+from pydantic import Field, PrivateAttr, Secret, field_validator, model_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
+from oceanprotocol_job_details.instrumentation import PhaseHook
+from oceanprotocol_job_details.logs import DEFAULT_LOG_FILE, LogPolicy
+from oceanprotocol_job_details.scan import list_names
+
 
 class JobSettings(BaseSettings):
     base_dir: Path = Field(alias="BASE_DIR")
@@ -18,6 +23,27 @@ class JobSettings(BaseSettings):
     transformation_did: str = Field(alias="TRANSFORMATION_DID")
     secret: Secret[str] | None = Field(default=None, alias="SECRET")
     logger: Logger = Field(default_factory=lambda: getLogger(__name__))
+    hooks: list[PhaseHook] = Field(default_factory=list)
+    concurrency: int = Field(default=8, alias="CONCURRENCY", gt=0)
+    ddo_fields: list[str] | None = Field(default=None, alias="DDO_FIELDS")
+    ddo_cache_dir: Path | None = Field(default=None, alias="DDO_CACHE_DIR")
+    ddo_cache_max_bytes: int = Field(
+        default=256 * 1024 * 1024,
+        alias="DDO_CACHE_MAX_BYTES",
+        gt=0,
+    )
+    ddo_executor: Literal["serial", "process"] = Field(
+        default="serial",
+        alias="DDO_EXECUTOR",
+    )
+    ddo_workers: int | None = Field(default=None, alias="DDO_WORKERS", gt=0)
+    strict: bool = Field(default=False, alias="STRICT")
+    log_json: bool = Field(default=False, alias="LOG_JSON")
+    log_file: str = Field(default=DEFAULT_LOG_FILE, alias="LOG_FILE")
+    log_queue_size: int = Field(default=10_000, alias="LOG_QUEUE_SIZE", gt=0)
+    log_policy: LogPolicy = Field(default="block", alias="LOG_POLICY")
+
+    _detected_dids: bool = PrivateAttr(default=False)
 
     model_config = SettingsConfigDict(
         extra="forbid",
@@ -25,9 +51,9 @@ class JobSettings(BaseSettings):
         arbitrary_types_allowed=True,
     )
 
-    @field_validator("dids", mode="before")
+    @field_validator("dids", "ddo_fields", mode="before")
     @classmethod
-    def split_dids(cls, v: list[str] | str) -> list[str]:
+    def split_dids(cls, v: list[str] | str | None) -> list[str] | None:
         if isinstance(v, str):
             data = orjson.loads(v)
             assert isinstance(data, list)
@@ -37,7 +63,19 @@ class JobSettings(BaseSettings):
     @model_validator(mode="after")
     def validate_dids(self) -> Self:
         if len(self.dids) == 0:
-            self.dids.extend(
-                [f.name for f in (self.base_dir / "ddos").glob("*") if f.is_file()]
-            )
+            self.dids.extend(sorted(list_names(self.base_dir / "ddos")))
+            self._detected_dids = True
         return self
+
+    def with_base_dir(self, base_dir: Path) -> Self:
+        """Copy of the settings for another job directory, without re-validating.
+
+        The DIDs are detected again from the new directory unless given.
+        """
+
+        dids = (
+            sorted(list_names(base_dir / "ddos"))
+            if self._detected_dids
+            else list(self.dids)
+        )
+        return self.model_copy(update={"base_dir": base_dir, "dids": dids})
@@ -0,0 +1,193 @@
+import asyncio
+import mmap
+import os
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager
+from pathlib import Path
+from typing import AsyncIterator, Deque, Iterable, Iterator, Set, Tuple
+
+import aiofiles
+
+DEFAULT_CHUNK_SIZE = 1024 * 1024
+DEFAULT_PREFETCH_BYTES = 256 * 1024 * 1024
+DEFAULT_BATCH_BYTES = 64 * 1024 * 1024
+
+
+def iter_chunks(path: Path, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[bytes]:
+    """Read a file in chunks of at most chunk_size bytes"""
+
+    assert chunk_size > 0, "Chunk size must be positive"
+    with open(path, "rb", buffering=0) as f:
+        while chunk := f.read(chunk_size):
+            yield chunk
+
+
+async def aiter_chunks(
+    path: Path,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> AsyncIterator[bytes]:
+    """Read a file in chunks of at most chunk_size bytes without blocking the loop"""
+
+    assert chunk_size > 0, "Chunk size must be positive"
+    async with aiofiles.open(path, "rb") as f:
+        while chunk := await f.read(chunk_size):
+            yield chunk
+
+
+@contextmanager
+def mapped(path: Path) -> Iterator[memoryview]:
+    """Memory-map a file read-only, as a memoryview.
+
+    No data is copied into memory until it is accessed, and the OS can drop
+    the pages again when under pressure. The mapping is closed when the context
+    exits, unless views derived from the yielded one (slices, NumPy arrays...)
+    are still alive, which keep it open until they are garbage collected.
+    """
+
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            # Empty files cannot be mapped
+            yield memoryview(b"")
+            return
+
+        m = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+    view = memoryview(m)
+    try:
+        yield view
+    finally:
+        view.release()
+        try:
+            m.close()
+        except BufferError:
+            # Still exported, closed once the last derived view is released
+            pass
+
+
+def _read_range(path: Path, offset: int, size: int) -> bytes:
+    with open(path, "rb", buffering=0) as f:
+        f.seek(offset)
+        return f.read(size)
+
+
+def _ranges(
+    inputs: Iterable[Tuple[str, Path]],
+    chunk_size: int | None,
+) -> Iterator[Tuple[str, Path, int, int]]:
+    for did, path in inputs:
+        size = path.stat().st_size
+        step = chunk_size or size or 1
+        for offset in range(0, max(size, 1), step):
+            yield did, path, offset, min(step, size - offset)
+
+
+def prefetch(
+    inputs: Iterable[Tuple[str, Path]],
+    depth: int = 4,
+    max_bytes: int = DEFAULT_PREFETCH_BYTES,
+    chunk_size: int | None = None,
+) -> Iterator[Tuple[str, Path, bytes]]:
+    """Read the input files ahead of the consumer in a thread pool.
+
+    Up to depth reads run in the background while the consumer processes the
+    current item, holding at most max_bytes of not yet consumed data (a single
+    item larger than that is still read, on its own).
+
+    Args:
+        inputs (Iterable[Tuple[str, Path]]): DID and Path of each file to read.
+        depth (int, optional): Maximum number of reads ahead of the consumer.
+        max_bytes (int, optional): Memory budget of the reads ahead.
+        chunk_size (int | None, optional): Read files in chunks of at most this
+            many bytes instead of whole.
+
+    Yields:
+        Tuple[str, Path, bytes]: DID, Path and contents (or chunk) of each file,
+            in order.
+    """
+
+    assert depth > 0, "Depth must be positive"
+    assert max_bytes > 0, "Memory budget must be positive"
+    assert chunk_size is None or chunk_size > 0, "Chunk size must be positive"
+
+    pending: Deque[Tuple[str, Path, int, Future[bytes]]] = deque()
+    buffered = 0
+    pool = ThreadPoolExecutor(max_workers=depth, thread_name_prefix="prefetch")
+
+    try:
+        for did, path, offset, size in _ranges(inputs, chunk_size):
+            while pending and (len(pending) >= depth or buffered + size > max_bytes):
+                done_did, done_path, done_size, future = pending.popleft()
+                buffered -= done_size
+                yield done_did, done_path, future.result()
+
+            pending.append(
+                (did, path, size, pool.submit(_read_range, path, offset, size))
+            )
+            buffered += size
+
+        while pending:
+            done_did, done_path, _, future = pending.popleft()
+            yield done_did, done_path, future.result()
+    finally:
+        pool.shutdown(wait=True, cancel_futures=True)
+
+
+async def _aread(did: str, path: Path) -> Tuple[str, Path, bytes]:
+    async with aiofiles.open(path, "rb") as f:
+        return did, path, await f.read()
+
+
+async def aread_concurrently(
+    inputs: Iterable[Tuple[str, Path]],
+    concurrency: int = 8,
+    ordered: bool = True,
+) -> AsyncIterator[Tuple[str, Path, bytes]]:
+    """Read the input files with up to concurrency reads running at once.
+
+    Args:
+        inputs (Iterable[Tuple[str, Path]]): DID and Path of each file to read.
+        concurrency (int, optional): Maximum number of files being read, or read
+            and not yet consumed, at once.
+        ordered (bool, optional): Yield the files in the order of inputs, or as
+            soon as each read finishes.
+
+    Yields:
+        Tuple[str, Path, bytes]: DID, Path and contents of each file.
+    """
+
+    assert concurrency > 0, "Concurrency must be positive"
+
+    window: Deque[asyncio.Task[Tuple[str, Path, bytes]]] = deque()
+    running: Set[asyncio.Task[Tuple[str, Path, bytes]]] = set()
+
+    try:
+        for did, path in inputs:
+            task = asyncio.create_task(_aread(did, path))
+            if ordered:
+                window.append(task)
+                if len(window) >= concurrency:
+                    yield await window.popleft()
+                continue
+
+            running.add(task)
+            if len(running) >= concurrency:
+                done, running = await asyncio.wait(
+                    running, return_when=asyncio.FIRST_COMPLETED
+                )
+                for finished in done:
+                    yield finished.result()
+
+        while window:
+            yield await window.popleft()
+
+        while running:
+            done, running = await asyncio.wait(
+                running, return_when=asyncio.FIRST_COMPLETED
+            )
+            for finished in done:
+                yield finished.result()
+    finally:
+        # The consumer stopped early or a read failed
+        for task in (*window, *running):
+            task.cancel()
@@ -0,0 +1,119 @@
+"""Tabular reads of the input files, as batches of bounded size.
+
+The readers of each format are TableReader loaders registered for it, so new
+formats can be plugged in with register. The CSV and Parquet readers need
+pyarrow and the NumPy one needs numpy, installed with the "tabular" extra.
+"""
+
+from pathlib import Path
+from typing import Dict, Iterator, List, Protocol, Sequence, runtime_checkable
+
+from oceanprotocol_job_details.exceptions import UnknownFormatError
+from oceanprotocol_job_details.loaders import TableReader
+from oceanprotocol_job_details.plugins import inject
+from oceanprotocol_job_details.streaming import DEFAULT_BATCH_BYTES
+
+PARQUET_MAGIC = b"PAR1"
+NPY_MAGIC = b"\x93NUMPY"
+
+_SNIFF_BYTES = 4096
+
+_SUFFIXES = {
+    ".csv": "csv",
+    ".tsv": "csv",
+    ".parquet": "parquet",
+    ".npy": "npy",
+}
+
+
+class _Column(Protocol):
+    def to_numpy(self, zero_copy_only: bool = ...) -> object: ...
+
+
+class _Schema(Protocol):
+    @property
+    def names(self) -> List[str]: ...
+
+
+@runtime_checkable
+class _RecordBatch(Protocol):
+    """What to_numpy reads of a pyarrow RecordBatch, without importing pyarrow"""
+
+    @property
+    def columns(self) -> Sequence[_Column]: ...
+
+    @property
+    def schema(self) -> _Schema: ...
+
+
+def sniff_format(path: Path) -> str:
+    """Detect the format of an input file from its first bytes.
+
+    Input files are usually named 0..N without extension, so the contents
+    decide: the Parquet and NumPy magic numbers, or text, read as CSV. The
+    extension is only used for files that are neither, e.g. empty ones.
+
+    Raises:
+        UnknownFormatError: If the file is binary in an unknown format.
+    """
+
+    with open(path, "rb") as f:
+        head = f.read(_SNIFF_BYTES)
+
+    if head.startswith(PARQUET_MAGIC):
+        return "parquet"
+    if head.startswith(NPY_MAGIC):
+        return "npy"
+
+    if head and b"\0" not in head:
+        try:
+            head.decode("utf-8")
+            return "csv"
+        except UnicodeDecodeError as error:
+            # Only the last character may be cut by the sniffed length
+            if len(head) == _SNIFF_BYTES and error.start >= len(head) - 3:
+                return "csv"
+
+    try:
+        return _SUFFIXES[path.suffix.lower()]
+    except KeyError:
+        raise UnknownFormatError(f"Unknown format of input file {path}") from None
+
+
+def iter_batches(
+    path: Path,
+    batch_bytes: int = DEFAULT_BATCH_BYTES,
+    format: str | None = None,
+) -> Iterator[object]:
+    """Iterate through the batches of a tabular file, of about batch_bytes each.
+
+    Args:
+        path (Path): File to read.
+        batch_bytes (int, optional): Approximate maximum size of each batch.
+        format (str | None, optional): Format of the file, sniffed if None.
+
+    Returns:
+        Iterator[object]: pyarrow RecordBatches for CSV and Parquet files, NumPy
+            arrays for .npy files.
+    """
+
+    reader = inject(
+        TableReader,  # type: ignore[type-abstract]
+        format or sniff_format(path),
+        path,
+        batch_bytes,
+    )
+    return reader.load()
+
+
+def to_numpy(batch: object) -> object:
+    """NumPy arrays of a batch, as a dict of column arrays for RecordBatches"""
+
+    if not isinstance(batch, _RecordBatch):
+        return batch
+
+    arrays: Dict[str, object] = {
+        name: column.to_numpy(zero_copy_only=False)
+        for name, column in zip(batch.schema.names, batch.columns)
+    }
+    return arrays
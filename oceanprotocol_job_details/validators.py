@@ -0,0 +1,40 @@
+"""Validators of the input parameters types, built once per type."""
+
+from functools import lru_cache
+from typing import Type, TypeVar, cast
+
+from pydantic import BaseModel, TypeAdapter
+
+InputParametersT = TypeVar("InputParametersT", bound=BaseModel)
+
+
+@lru_cache(maxsize=128)
+def _adapter(input_type: Type[BaseModel]) -> TypeAdapter[BaseModel]:
+    adapter = TypeAdapter(input_type)
+    # Models with defer_build (or forward references) only build their schema
+    # on first validation, build it now instead. If it cannot be built yet, the
+    # validation raises as it would have
+    adapter.rebuild(raise_errors=False)
+    return adapter
+
+
+def input_validator(
+    input_type: Type[InputParametersT],
+) -> TypeAdapter[InputParametersT]:
+    """TypeAdapter of an input parameters type, with its schema already built.
+
+    Cached per type, so the workers validating many parameter files against
+    the same type only build it once.
+    """
+
+    return cast(TypeAdapter[InputParametersT], _adapter(input_type))
+
+
+def warm_up(*input_types: Type[BaseModel] | None) -> None:
+    """Build the validators of the given input parameters types ahead of their
+    first use, skipping None
+    """
+
+    for input_type in input_types:
+        if input_type is not None:
+            input_validator(input_type)
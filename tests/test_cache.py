@@ -0,0 +1,108 @@
+import errno
+import os
+import shutil
+from unittest.mock import MagicMock, patch
+
+from oceanprotocol_job_details.cache import DDOCache
+from oceanprotocol_job_details.domain import DDO, LazyDDOMetadata
+from oceanprotocol_job_details.domain.metadata import parse_ddo
+from oceanprotocol_job_details.helpers import load_job_details
+from tests.data import CustomParameters
+
+
+class TestDDOCache:
+    def test_hit_skips_parsing(self, tmp_path, job_details):
+        did, path = job_details.files[0].did, job_details.files[0].ddo
+        cache = DDOCache(tmp_path / "cache")
+
+        first = LazyDDOMetadata({did: path}, disk_cache=cache)[did]
+
+        parse = MagicMock(side_effect=parse_ddo)
+        second = LazyDDOMetadata({did: path}, parse=parse, disk_cache=cache)[did]
+
+        parse.assert_not_called()
+        assert isinstance(second, DDO)
+        assert second == first
+
+    def test_hit_is_not_validated_again(self, tmp_path, job_details):
+        cache = DDOCache(tmp_path)
+        ddo = job_details.metadata[job_details.files[0].did]
+        cache.store("key", ddo)
+
+        with patch.object(DDO, "model_validate") as validate:
+            cached = cache.load("key", DDO)
+
+        validate.assert_not_called()
+        assert cached == ddo
+
+    def test_store_scans_once_under_budget(self, tmp_path, job_details):
+        ddo = job_details.metadata[job_details.files[0].did]
+        cache = DDOCache(tmp_path)
+
+        with patch(
+            "oceanprotocol_job_details.cache.os.scandir", wraps=os.scandir
+        ) as scandir:
+            for i in range(10):
+                cache.store(str(i), ddo)
+
+        assert scandir.call_count == 1
+        assert len(list(tmp_path.iterdir())) == 10
+
+    def test_key_changes_with_file(self, tmp_path, job_details):
+        path = tmp_path / "ddo"
+        shutil.copy(job_details.files[0].ddo, path)
+        cache = DDOCache(tmp_path / "cache")
+
+        key = cache.key("did", path)
+        assert cache.key("did", path) == key
+        assert cache.key("other", path) != key
+
+        os.utime(path, ns=(0, 0))
+        assert cache.key("did", path) != key
+
+    def test_corrupt_entry_is_a_miss(self, tmp_path, job_details):
+        cache = DDOCache(tmp_path)
+        (tmp_path / "key.ddo").write_bytes(b"corrupt")
+
+        assert cache.load("key", DDO) is None
+        assert not (tmp_path / "key.ddo").exists()
+
+    def test_store_failure_is_ignored(self, tmp_path, job_details, caplog):
+        did, path = job_details.files[0].did, job_details.files[0].ddo
+        cache = DDOCache(tmp_path / "cache")
+
+        with patch(
+            "oceanprotocol_job_details.cache.os.replace",
+            side_effect=OSError(errno.ENOSPC, "No space left on device"),
+        ):
+            ddo = LazyDDOMetadata({did: path}, disk_cache=cache)[did]
+
+        assert isinstance(ddo, DDO)
+        assert list((tmp_path / "cache").iterdir()) == []
+        assert "Could not store DDO cache entry" in caplog.text
+
+    def test_evicts_least_recently_used(self, tmp_path, job_details):
+        ddo = job_details.metadata[job_details.files[0].did]
+        cache = DDOCache(tmp_path, max_bytes=1)
+
+        cache.store("old", ddo)
+        cache.store("new", ddo)
+
+        assert list(tmp_path.iterdir()) == []
+
+        cache = DDOCache(tmp_path)
+        cache.store("old", ddo)
+        os.utime(tmp_path / "old.ddo", ns=(0, 0))
+        cache.store("new", ddo)
+        size = (tmp_path / "new.ddo").stat().st_size
+
+        DDOCache(tmp_path, max_bytes=size).evict()
+        assert [p.name for p in tmp_path.iterdir()] == ["new.ddo"]
+
+    def test_configured_through_settings(self, tmp_path, config):
+        config.update({"ddo_cache_dir": str(tmp_path)})
+        job_details = load_job_details(CustomParameters, config)
+
+        for did in job_details.metadata:
+            assert isinstance(job_details.metadata[did], DDO)
+        assert len(list(tmp_path.glob("*.ddo"))) == 1
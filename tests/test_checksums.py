@@ -0,0 +1,137 @@
+import hashlib
+import shutil
+from unittest.mock import patch
+
+import orjson
+import pytest
+
+from oceanprotocol_job_details.checksums import (
+    DigestCache,
+    digests,
+    file_digest,
+    parse_checksum,
+)
+from oceanprotocol_job_details.exceptions import (
+    ChecksumCountError,
+    ChecksumMismatchError,
+    MissingChecksumsError,
+)
+from oceanprotocol_job_details.helpers import load_job_details
+
+
+class TestDigests:
+    def test_file_digest(self, tmp_path):
+        path = tmp_path / "0"
+        path.write_bytes(b"x" * 1000)
+
+        assert (
+            file_digest(path, chunk_size=7) == hashlib.sha256(b"x" * 1000).hexdigest()
+        )
+        assert file_digest(path, "blake2b") == hashlib.blake2b(b"x" * 1000).hexdigest()
+
+    def test_parse_checksum(self):
+        assert parse_checksum("SHA256:ABC") == ("sha256", "abc")
+        assert parse_checksum("abc") == ("sha256", "abc")
+
+    def test_cache_skips_unchanged_files(self, tmp_path):
+        files = [tmp_path / str(i) for i in range(4)]
+        for path in files:
+            path.write_bytes(path.name.encode())
+        cache_path = tmp_path / "cache" / "digests.json"
+
+        first = digests(
+            [(path, "sha256") for path in files], 2, DigestCache(cache_path)
+        )
+        assert cache_path.exists()
+
+        files[0].write_bytes(b"changed")
+        with patch(
+            "oceanprotocol_job_details.checksums.file_digest", wraps=file_digest
+        ) as hashed:
+            second = digests(
+                [(path, "sha256") for path in files], 2, DigestCache(cache_path)
+            )
+
+        hashed.assert_called_once()
+        assert second[files[0], "sha256"] == hashlib.sha256(b"changed").hexdigest()
+        assert {k: v for k, v in second.items() if k[0] != files[0]} == {
+            k: v for k, v in first.items() if k[0] != files[0]
+        }
+
+    def test_corrupt_cache_is_ignored(self, tmp_path):
+        cache_path = tmp_path / "digests.json"
+        cache_path.write_bytes(b"not json")
+        path = tmp_path / "0"
+        path.write_bytes(b"data")
+
+        assert digests([(path, "sha256")], cache=DigestCache(cache_path))
+
+
+class TestJobDetailsChecksums:
+    @pytest.fixture
+    def data_config(self, config, tmp_path):
+        shutil.copytree("./_data", tmp_path / "data")
+        config.update({"base_dir": str(tmp_path / "data")})
+        yield config
+
+    def add_checksums(self, job_details, checksums):
+        ddo_path = job_details.files[0].ddo
+        ddo = orjson.loads(ddo_path.read_bytes())
+        ddo["services"][0]["checksums"] = checksums
+        ddo_path.write_bytes(orjson.dumps(ddo))
+
+    def test_checksums(self, job_details):
+        ((_, path),) = job_details.inputs()
+        digest = hashlib.sha256(path.read_bytes()).hexdigest()
+
+        assert job_details.checksums() == {path: digest}
+
+    def test_verify(self, data_config):
+        job_details = load_job_details(None, data_config)
+        ((_, path),) = job_details.inputs()
+        digest = hashlib.blake2b(path.read_bytes()).hexdigest()
+        self.add_checksums(job_details, [f"blake2b:{digest}"])
+
+        checksums = load_job_details(None, data_config).checksums(verify=True)
+        assert checksums[path] == hashlib.sha256(path.read_bytes()).hexdigest()
+
+    def test_verify_mismatch(self, data_config):
+        job_details = load_job_details(None, data_config)
+        self.add_checksums(job_details, ["sha256:" + "0" * 64])
+
+        with pytest.raises(ChecksumMismatchError) as error:
+            load_job_details(None, data_config).checksums(verify=True)
+
+        assert error.value.paths == [path for _, path in job_details.inputs()]
+
+    def test_verify_count_mismatch(self, data_config):
+        job_details = load_job_details(None, data_config)
+        self.add_checksums(job_details, ["sha256:" + "0" * 64] * 2)
+
+        with pytest.raises(ChecksumCountError, match="1 input files but 2 checksums"):
+            load_job_details(None, data_config).checksums(verify=True)
+
+    def test_verify_without_checksums(self, job_details):
+        with pytest.raises(MissingChecksumsError, match="lists no checksums") as error:
+            job_details.checksums(verify=True)
+
+        assert error.value.paths == [path for _, path in job_details.inputs()]
+
+    def test_verify_projected(self, data_config):
+        job_details = load_job_details(None, data_config)
+        ((_, path),) = job_details.inputs()
+        digest = hashlib.sha256(path.read_bytes()).hexdigest()
+        self.add_checksums(job_details, [f"sha256:{digest}"])
+
+        projected = load_job_details(None, data_config, ddo_fields=["metadata.name"])
+        with pytest.raises(MissingChecksumsError, match="without its services"):
+            projected.checksums(verify=True)
+
+        fields = ["metadata.name", "services.checksums"]
+        projected = load_job_details(None, data_config, ddo_fields=fields)
+        assert projected.checksums(verify=True) == {path: digest}
+
+    async def test_achecksums(self, job_details, tmp_path):
+        cache = tmp_path / "digests.json"
+        assert await job_details.achecksums(cache=cache) == job_details.checksums()
+        assert cache.exists()
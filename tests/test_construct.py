@@ -0,0 +1,55 @@
+from typing import Dict, List, Optional, Union
+
+from pydantic import BaseModel, Field, PrivateAttr
+
+from oceanprotocol_job_details.construct import construct
+
+
+class Leaf(BaseModel):
+    value: int
+    alias: str = Field(default="", alias="@alias")
+
+
+class Node(BaseModel):
+    leaf: Leaf
+    leaves: List[Leaf]
+    by_name: Dict[str, Leaf]
+    optional: Optional[Leaf] = None
+    either: Union[Leaf, int] = 0
+    children: List["Node"] = []
+
+
+class Private(BaseModel):
+    value: int
+    _state: int = PrivateAttr(default=1)
+
+
+class TestConstruct:
+    def test_same_as_validated(self):
+        node = Node.model_validate(
+            {
+                "leaf": {"value": 1, "@alias": "a"},
+                "leaves": [{"value": 2}],
+                "by_name": {"x": {"value": 3}},
+                "either": {"value": 4},
+                "children": [{"leaf": {"value": 5}, "leaves": [], "by_name": {}}],
+            }
+        )
+
+        built = construct(Node, node.model_dump())
+
+        assert built == node
+        assert isinstance(built.either, Leaf)
+        assert isinstance(built.children[0].leaf, Leaf)
+
+    def test_missing_fields_get_defaults(self):
+        built = construct(Node, {"leaf": {"value": 1}, "leaves": [], "by_name": {}})
+
+        assert built.optional is None and built.children == []
+        assert built.leaf.alias == ""
+        assert built.model_fields_set == {"leaf", "leaves", "by_name"}
+
+    def test_private_attributes(self):
+        built = construct(Private, {"value": 1})
+
+        assert built.value == 1 and built._state == 1
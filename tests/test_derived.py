@@ -1,22 +1,41 @@
 from pathlib import Path
-from unittest.mock import patch
 
-import pytest
-
-from oceanprotocol_job_details.domain.derived import DIDPaths, Paths
+from oceanprotocol_job_details.domain.derived import DIDPaths, InputFile, Paths
 
 
 class TestDerived:
-    @patch("pathlib.Path.exists", return_value=False)
-    def test_did_paths_throws(self, mock_exists):
-        with pytest.raises(FileNotFoundError):
-            DIDPaths("", Path())
-
-    @patch("pathlib.Path.exists", return_value=True)
-    def test_did_paths_length(self, mock_exists):
-        paths = DIDPaths("", Path(), input_files=[Path("")] * 67)
+    def test_did_paths_length(self):
+        directory = Path("inputs")
+        index = tuple(InputFile(directory, str(i), 1, 0, i) for i in range(67))
+        paths = DIDPaths("", Path(), index=index)
 
         assert len(paths) == 67
+        assert paths.input_files[66] == directory / "66"
+        assert all(file.directory is directory for file in paths.index)
+
+    def test_did_paths_from_input_files(self, tmp_path):
+        (tmp_path / "0").write_bytes(b"input")
+        input_files = [tmp_path / "0", tmp_path / "1"]
+        paths = DIDPaths("", Path(), input_files=input_files)
+
+        assert len(paths) == 2
+        assert paths.input_files == input_files
+        assert paths.index == (
+            InputFile(tmp_path, "0", 5, paths.index[0].mtime_ns, 0),
+            InputFile(tmp_path, "1", 0, 0, 1),
+        )
+        assert "input_files" not in DIDPaths.__slots__
+
+    def test_did_paths_index_queries(self):
+        index = tuple(
+            InputFile(Path(), name, size, 0, None)
+            for name, size in [("0", 5), ("1.csv", 20), ("2.csv", 10)]
+        )
+        paths = DIDPaths("", Path(), index=index)
+
+        assert paths.total_bytes == 35
+        assert [file.name for file in paths.largest_first()] == ["1.csv", "2.csv", "0"]
+        assert [file.name for file in paths.select("*.csv")] == ["1.csv", "2.csv"]
 
     def test_paths(self):
         base = Path("/data")
@@ -31,3 +50,10 @@ class TestDerived:
             paths.algorithm_custom_parameters == base / "inputs" / "algoCustomData.json"
         )
         assert paths.algorithm == base / "transformations" / "algorithm"
+
+    def test_paths_are_built_once(self):
+        paths = Paths(Path("/data"))
+
+        assert paths.inputs is paths.inputs
+        assert paths == Paths(Path("/data"))
+        assert not hasattr(paths, "__dict__")
@@ -3,7 +3,12 @@ import time
 
 import pytest
 
-from oceanprotocol_job_details.executors import run_in_executor
+from oceanprotocol_job_details.executors import (
+    configure_executor,
+    map_in_executor,
+    run_in_executor,
+    using_executor,
+)
 
 
 def sync_add(x: int, y: int) -> int:
@@ -82,3 +87,85 @@ async def test_exception_propagates_from_async() -> None:
 
     with pytest.raises(RuntimeError, match="async error"):
         await run_in_executor(boom)
+
+
+@pytest.fixture
+def executor():
+    executor = configure_executor("test", max_workers=2)
+    yield executor
+    executor.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_using_executor_routes_calls(executor) -> None:
+    with using_executor("test") as current:
+        assert current is executor
+        assert await run_in_executor(sync_add, 1, 2) == 3
+
+    assert executor.stats.submitted == executor.stats.completed == 1
+
+
+@pytest.mark.asyncio
+async def test_unknown_executor() -> None:
+    with pytest.raises(KeyError, match="not configured"):
+        with using_executor("missing"):
+            pass
+
+
+@pytest.mark.asyncio
+async def test_bounded_workers(executor) -> None:
+    running: list[int] = []
+    peak: list[int] = []
+
+    def work(i: int) -> int:
+        running.append(i)
+        peak.append(len(running))
+        time.sleep(0.02)
+        running.remove(i)
+        return i
+
+    results = await map_in_executor(work, range(6), executor="test")
+
+    assert results == list(range(6))
+    assert max(peak) <= 2
+    assert executor.stats.max_queued >= 4
+    assert executor.stats.queued == executor.stats.running == 0
+    assert executor.stats.mean_latency > 0
+
+
+@pytest.mark.asyncio
+async def test_cancelled_call_keeps_slot_until_done(executor) -> None:
+    task = asyncio.create_task(executor.run(time.sleep, 0.05))
+    await asyncio.sleep(0.01)
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+
+    assert executor.stats.cancelled == 1
+    assert executor.stats.running == 1
+    await asyncio.sleep(0.08)
+    assert executor.stats.running == 0
+
+
+@pytest.mark.asyncio
+async def test_failed_calls_are_counted(executor) -> None:
+    with pytest.raises(ZeroDivisionError):
+        await executor.run(divmod, 1, 0)
+    assert executor.stats.failed == 1
+
+
+@pytest.mark.asyncio
+async def test_inline_executor() -> None:
+    executor = configure_executor("inline", "inline")
+    assert executor.executor is None
+    assert await executor.map(sync_add, [1, 2], [3, 4]) == [4, 6]
+    assert executor.stats.completed == 2
+
+
+@pytest.mark.asyncio
+async def test_process_executor() -> None:
+    executor = configure_executor("processes", "process", max_workers=1)
+    try:
+        assert await executor.map(sync_add, [1, 2], [3, 4]) == [4, 6]
+    finally:
+        executor.shutdown()
@@ -1,3 +1,12 @@
+import shutil
+
+import pytest
+
+from oceanprotocol_job_details.domain.derived import DIDPaths
+from oceanprotocol_job_details.helpers import load_job_details
+from oceanprotocol_job_details.streaming import aread_concurrently, mapped, prefetch
+
+
 class TestFiles:
     def test_files_detection(self, job_details):
         """Verifies file structure detection logic."""
@@ -13,3 +22,125 @@ class TestFiles:
         did, path = files[0]
         assert isinstance(did, str)
         assert path.is_file()
+
+    def test_inputs_of_did_paths_from_input_files(self, job_details):
+        (files,) = job_details.files
+        paths = DIDPaths(files.did, files.ddo, input_files=files.input_files)
+        rebuilt = job_details.model_copy(update={"files": [paths]})
+
+        assert list(rebuilt.inputs()) == list(job_details.inputs())
+
+    def test_input_chunks(self, job_details):
+        """Tests the chunks of each input file rebuild its contents."""
+        ((did, path),) = job_details.inputs()
+        chunks = list(job_details.input_chunks(chunk_size=100))
+
+        assert len(chunks) > 1
+        assert all(len(chunk) <= 100 for _, _, chunk in chunks)
+        assert {(d, p) for d, p, _ in chunks} == {(did, path)}
+        assert b"".join(chunk for _, _, chunk in chunks) == path.read_bytes()
+
+    async def test_ainput_chunks(self, job_details):
+        ((_, path),) = job_details.inputs()
+        chunks = [chunk async for _, _, chunk in job_details.ainput_chunks(100)]
+
+        assert b"".join(chunks) == path.read_bytes()
+
+    def test_mapped_inputs(self, job_details):
+        ((did, path),) = job_details.inputs()
+        ((mapped_did, mapped_path, view),) = [
+            (d, p, bytes(v)) for d, p, v in job_details.mapped_inputs()
+        ]
+
+        assert (mapped_did, mapped_path) == (did, path)
+        assert view == path.read_bytes()
+
+    def test_mapped_slices_outlive_iteration(self, config, tmp_path):
+        shutil.copytree("./_data", tmp_path / "data")
+        (next((tmp_path / "data" / "inputs").glob("*/0")).parent / "1").write_bytes(
+            b"second input"
+        )
+        config.update({"base_dir": str(tmp_path / "data")})
+        job_details = load_job_details(None, config)
+
+        heads = [view[:4] for _, _, view in job_details.mapped_inputs()]
+
+        assert len(heads) == 2
+        assert [bytes(head) for head in heads] == [
+            path.read_bytes()[:4] for _, path in job_details.inputs()
+        ]
+
+    def test_mapped_empty_file(self, tmp_path):
+        path = tmp_path / "0"
+        path.touch()
+
+        with mapped(path) as view:
+            assert len(view) == 0
+
+    def test_prefetch_inputs(self, job_details):
+        ((did, path),) = job_details.inputs()
+
+        assert list(job_details.prefetch_inputs()) == [(did, path, path.read_bytes())]
+
+    def test_prefetch_order_and_chunks(self, tmp_path):
+        inputs = []
+        for i in range(10):
+            path = tmp_path / str(i)
+            path.write_bytes(bytes([i]) * (i * 10))
+            inputs.append((f"did{i % 3}", path))
+
+        whole = list(prefetch(inputs, depth=3, max_bytes=25))
+        assert [(did, path) for did, path, _ in whole] == inputs
+        assert [data for _, _, data in whole] == [p.read_bytes() for _, p in inputs]
+
+        chunks = list(prefetch(inputs, depth=2, chunk_size=7))
+        assert all(len(data) <= 7 for _, _, data in chunks)
+        for did, path in inputs:
+            data = b"".join(d for cd, cp, d in chunks if (cd, cp) == (did, path))
+            assert data == path.read_bytes()
+
+    def test_prefetch_stops_early(self, tmp_path):
+        inputs = [(str(i), tmp_path / str(i)) for i in range(5)]
+        for _, path in inputs:
+            path.write_bytes(b"data")
+
+        reader = prefetch(inputs, depth=2)
+        assert next(reader) == ("0", inputs[0][1], b"data")
+        reader.close()
+
+    async def test_ainputs(self, job_details):
+        ((did, path),) = job_details.inputs()
+
+        items = [item async for item in job_details.ainputs()]
+        assert items == [(did, path, path.read_bytes())]
+
+    async def test_aread_concurrently(self, tmp_path):
+        inputs = []
+        for i in range(10):
+            path = tmp_path / str(i)
+            path.write_bytes(bytes([i]) * i)
+            inputs.append((f"did{i % 3}", path))
+
+        ordered = [item async for item in aread_concurrently(inputs, concurrency=3)]
+        assert [(did, path) for did, path, _ in ordered] == inputs
+        assert [data for _, _, data in ordered] == [p.read_bytes() for _, p in inputs]
+
+        unordered = [
+            item
+            async for item in aread_concurrently(inputs, concurrency=3, ordered=False)
+        ]
+        assert sorted(unordered) == sorted(ordered)
+
+    async def test_aread_concurrently_stops_early(self, tmp_path):
+        inputs = [(str(i), tmp_path / str(i)) for i in range(5)]
+        for _, path in inputs:
+            path.write_bytes(b"data")
+
+        reader = aread_concurrently(inputs, concurrency=2)
+        assert await anext(reader) == ("0", inputs[0][1], b"data")
+        await reader.aclose()
+
+    async def test_aread_concurrently_missing_file(self, tmp_path):
+        with pytest.raises(FileNotFoundError):
+            async for _ in aread_concurrently([("did", tmp_path / "missing")]):
+                pass
@@ -0,0 +1,62 @@
+import logging
+
+from oceanprotocol_job_details.helpers import (
+    load_job_details,
+    load_parametrized_job_details,
+)
+from oceanprotocol_job_details.instrumentation import Instrumentation
+from tests.data import CustomParameters
+
+
+class TestInstrumentation:
+    def test_hooks_receive_every_phase(self, config):
+        records = []
+        config.update({"hooks": [records.append]})
+
+        job_details = load_parametrized_job_details(CustomParameters, config)
+
+        assert [record.phase for record in records] == [
+            "settings",
+            "files",
+            "metadata",
+            "job_details",
+            "input_parameters",
+        ]
+        files = records[1]
+        assert files.file_count == 2
+        assert all(record.wall_time >= 0 for record in records)
+
+        parameters = records[-1]
+        assert parameters.file_count == 1
+        assert parameters.bytes_read == (
+            job_details.paths.algorithm_custom_parameters.stat().st_size
+        )
+
+    def test_lazy_ddo_phase(self, config):
+        records = []
+        config.update({"hooks": [records.append]})
+        job_details = load_job_details(CustomParameters, config)
+        did_paths = job_details.files[0]
+
+        job_details.metadata[did_paths.did]
+
+        ddo = records[-1]
+        assert ddo.phase == "ddo"
+        assert ddo.file_count == 1
+        assert ddo.bytes_read == did_paths.ddo.stat().st_size
+
+    def test_summary_is_logged(self, config, caplog):
+        with caplog.at_level(logging.INFO):
+            load_job_details(CustomParameters, config)
+
+        assert "Job details loaded in" in caplog.text
+        assert "files" in caplog.text
+
+    def test_summary_aggregates_phases(self):
+        instrumentation = Instrumentation()
+        for size in [1, 2]:
+            with instrumentation.phase("ddo") as stats:
+                stats.bytes_read, stats.file_count = size, 1
+
+        (total,) = instrumentation.summary().values()
+        assert (total.bytes_read, total.file_count) == (3, 2)
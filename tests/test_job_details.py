@@ -1,12 +1,16 @@
+import os
+import shutil
 from unittest.mock import patch
 
 import pytest
 
 from oceanprotocol_job_details import ParametrizedJobDetails
-from oceanprotocol_job_details.exceptions import JobDetailsError
+from oceanprotocol_job_details.exceptions import JobDetailsError, MissingDDOError
 from oceanprotocol_job_details.helpers import (
+    aload_job_details,
     aload_parametrized_job_details,
     load_empty_job_details,
+    load_job_details,
     load_parametrized_job_details,
 )
 from oceanprotocol_job_details.ocean import EmptyJobDetails
@@ -23,6 +27,22 @@ class TestJobDetails:
         assert isinstance(result, ParametrizedJobDetails)
         assert result.input_parameters == mock_params
 
+    @patch("oceanprotocol_job_details.ocean.read_input_parameters")
+    def test_read_reuses_validated_fields(self, mock_read_func, job_details):
+        mock_read_func.return_value = CustomParameters(example="test", isTrue=True)
+
+        result = job_details.read()
+        assert result.files is job_details.files
+        assert result.metadata is job_details.metadata
+        assert result.paths is job_details.paths
+        assert result.secret is job_details.secret
+        assert result.input_type is None
+
+    def test_shared_fields_cover_all_but_input_type(self, job_details):
+        assert set(job_details.shared_fields()) == set(
+            type(job_details).model_fields
+        ) - {"input_type"}
+
     @patch("oceanprotocol_job_details.ocean.read_input_parameters")
     def test_read_failure_propagation(self, mock_read_func, job_details):
         cause = RuntimeError("asd")
@@ -85,6 +105,20 @@ class TestJobDetailsLoaders:
     def test_load_empty_job_details(self, config):
         job_details = load_empty_job_details(config)
         assert isinstance(job_details, EmptyJobDetails)
+        assert job_details.input_type is None
+        assert len(job_details.files) == len(job_details.metadata) == 1
+
+    @pytest.mark.asyncio
+    async def test_aload_job_details_matches_sync(self, config, job_details):
+        async_job_details = await aload_job_details(CustomParameters, config)
+        assert async_job_details == job_details
+
+    @pytest.mark.asyncio
+    async def test_aload_job_details_bounded_concurrency(self, config, job_details):
+        config.update({"concurrency": 1})
+        async_job_details = await aload_job_details(CustomParameters, config)
+        metadata = await async_job_details.metadata.aload_all()
+        assert metadata == job_details.metadata
 
     @pytest.mark.asyncio
     async def test_aload_parametrized_job_details_success(self, config):
@@ -101,3 +135,92 @@ class TestJobDetailsLoaders:
     ):
         with pytest.raises(JobDetailsError):
             _ = await aload_parametrized_job_details(CustomParameters, config)
+
+
+class TestRefresh:
+    @pytest.fixture
+    def data_config(self, config, tmp_path):
+        shutil.copytree("./_data", tmp_path / "data")
+        config.update({"base_dir": str(tmp_path / "data")})
+        yield config
+
+    def test_unchanged_returns_self(self, data_config):
+        job_details = load_job_details(CustomParameters, data_config)
+        job_details.metadata[job_details.files[0].did]
+        assert job_details.refresh() is job_details
+
+    def test_reuses_unchanged_ddos_and_did_paths(self, data_config):
+        job_details = load_job_details(CustomParameters, data_config)
+        did_paths = job_details.files[0]
+        ddo = job_details.metadata[did_paths.did]
+
+        (did_paths.input_files[0].parent / "1").write_bytes(b"new input")
+        refreshed = job_details.refresh()
+
+        assert refreshed is not job_details
+        assert [file.name for file in refreshed.files[0].index] == ["0", "1"]
+        assert refreshed.metadata[did_paths.did] is ddo
+
+    def test_rereads_changed_ddo(self, data_config):
+        job_details = load_job_details(CustomParameters, data_config)
+        did_paths = job_details.files[0]
+        ddo = job_details.metadata[did_paths.did]
+
+        stat = did_paths.ddo.stat()
+        os.utime(did_paths.ddo, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1))
+        refreshed = job_details.refresh()
+
+        assert refreshed.files[0] is did_paths
+        assert not refreshed.metadata.is_loaded(did_paths.did)
+        assert refreshed.metadata[did_paths.did] == ddo
+        assert job_details.metadata[did_paths.did] is ddo
+
+    def test_missing_ddo(self, data_config):
+        job_details = load_job_details(CustomParameters, data_config)
+        job_details.files[0].ddo.unlink()
+
+        with pytest.raises(MissingDDOError):
+            job_details.refresh()
+
+    def test_rereads_changed_input_parameters(self, data_config):
+        job_details = load_parametrized_job_details(CustomParameters, data_config)
+        assert job_details.refresh() is job_details
+
+        job_details.paths.algorithm_custom_parameters.write_text(
+            '{"example": "changed", "isTrue": false}'
+        )
+        refreshed = job_details.refresh()
+
+        assert refreshed.input_parameters.example == "changed"
+        assert refreshed.files is job_details.files
+        assert refreshed.refresh() is refreshed
+
+    @pytest.mark.asyncio
+    async def test_arefresh(self, data_config):
+        job_details = await aload_job_details(CustomParameters, data_config)
+        assert await job_details.arefresh() is job_details
+
+
+class TestStrict:
+    def test_strict_input_parameters(self, config):
+        # The sample parameters have "isTrue": "true", only valid when coerced
+        assert load_parametrized_job_details(CustomParameters, config).input_parameters
+
+        config.update({"strict": True})
+        with pytest.raises(JobDetailsError, match="Validation failed"):
+            load_parametrized_job_details(CustomParameters, config)
+
+    def test_strict_ddos(self, config, job_details):
+        config.update({"strict": True})
+        strict = load_job_details(CustomParameters, config)
+
+        did = job_details.files[0].did
+        assert strict.metadata[did] == job_details.metadata[did]
+
+    def test_strict_is_read_default(self, config):
+        config.update({"strict": True})
+        job_details = load_job_details(CustomParameters, config)
+
+        assert job_details.strict
+        assert isinstance(job_details.read(), JobDetailsError)
+        assert job_details.read(strict=False).input_parameters
@@ -0,0 +1,183 @@
+import logging
+import queue
+import shutil
+from concurrent.futures import ThreadPoolExecutor
+
+import orjson
+import pytest
+
+from oceanprotocol_job_details.helpers import load_job_details
+from oceanprotocol_job_details.logs import (
+    BoundedQueueHandler,
+    close_json_logging,
+    json_logging,
+)
+from tests.data import CustomParameters
+
+
+def queue_handlers(logger):
+    return [h for h in logger.handlers if isinstance(h, BoundedQueueHandler)]
+
+
+def read_lines(path):
+    return [orjson.loads(line) for line in path.read_bytes().splitlines()]
+
+
+@pytest.fixture
+def logger(request):
+    logger = logging.getLogger(f"tests.logs.{request.node.name}")
+    logger.setLevel(logging.DEBUG)
+    logger.propagate = False
+    yield logger
+    close_json_logging()
+
+
+class TestJSONLogging:
+    def test_records_as_json_lines(self, logger, tmp_path):
+        path = tmp_path / "logs" / "job.jsonl"
+        job_logging = json_logging(logger, path)
+
+        logger.info("step %d", 1, extra={"did": "did:op:0"})
+        try:
+            raise ValueError("boom")
+        except ValueError:
+            logger.exception("failed")
+        job_logging.close()
+
+        first, second = read_lines(path)
+        assert first["message"] == "step 1"
+        assert first["level"] == "INFO"
+        assert first["logger"] == logger.name
+        assert first["did"] == "did:op:0"
+        assert second["message"] == "failed"
+        assert "ValueError: boom" in second["exception"]
+        assert queue_handlers(logger) == []
+
+    def test_same_path_is_reused(self, logger, tmp_path):
+        path = tmp_path / "job.jsonl"
+        assert json_logging(logger, path) is json_logging(logger, path)
+        assert len(queue_handlers(logger)) == 1
+
+    def test_other_path_is_added(self, logger, tmp_path):
+        first = json_logging(logger, tmp_path / "first.jsonl")
+        second = json_logging(logger, tmp_path / "second.jsonl")
+        logger.info("both")
+        first.close()
+        logger.info("second")
+        second.close()
+
+        assert queue_handlers(logger) == []
+        assert [r["message"] for r in read_lines(first.path)] == ["both"]
+        assert [r["message"] for r in read_lines(second.path)] == ["both", "second"]
+
+    def test_other_policy_replaces(self, logger, tmp_path):
+        path = tmp_path / "job.jsonl"
+        first = json_logging(logger, path)
+        second = json_logging(logger, path, policy="drop")
+
+        assert first.closed and not second.closed
+        assert queue_handlers(logger) == [second.handler]
+
+    def test_closed_is_not_reused(self, logger, tmp_path):
+        path = tmp_path / "job.jsonl"
+        first = json_logging(logger, path)
+        first.close()
+        second = json_logging(logger, path)
+
+        assert second is not first and not second.closed
+        assert queue_handlers(logger) == [second.handler]
+
+    def test_concurrent_jobs_keep_their_file(self, logger, tmp_path):
+        paths = [tmp_path / str(i) / "job.jsonl" for i in range(8)]
+        with ThreadPoolExecutor(8) as pool:
+            loggings = list(pool.map(lambda path: json_logging(logger, path), paths))
+
+        assert not any(job_logging.closed for job_logging in loggings)
+        assert len(queue_handlers(logger)) == len(paths)
+        logger.info("all")
+        close_json_logging()
+
+        assert queue_handlers(logger) == []
+        for path in paths:
+            assert [r["message"] for r in read_lines(path)] == ["all"]
+
+    def test_close_at_exit_flushes(self, logger, tmp_path):
+        path = tmp_path / "job.jsonl"
+        json_logging(logger, path)
+        for i in range(1000):
+            logger.debug("%d", i)
+        close_json_logging()
+
+        assert [r["message"] for r in read_lines(path)] == [str(i) for i in range(1000)]
+
+    def test_unserializable_records(self, logger, tmp_path):
+        class Unprintable:
+            def __str__(self):
+                raise RuntimeError
+
+            def __repr__(self):
+                raise RuntimeError
+
+        path = tmp_path / "job.jsonl"
+        job_logging = json_logging(logger, path, queue_size=2)
+
+        logger.info("big", extra={"n": 2**70})
+        logger.info("keys", extra={"d": {1: "a"}})
+        logger.info("unprintable", extra={"o": Unprintable()})
+        # With the thread gone, these would block on the full queue
+        for i in range(10):
+            logger.info("%d", i)
+        job_logging.close()
+
+        big, keys, unprintable, *rest = read_lines(path)
+        assert big["n"] == repr(2**70)
+        assert keys["d"] == {"1": "a"}
+        assert unprintable["message"] == "'unprintable'"
+        assert [r["message"] for r in rest] == [str(i) for i in range(10)]
+
+    def test_unwritable_path(self, logger, tmp_path):
+        with pytest.raises(IsADirectoryError):
+            json_logging(logger, tmp_path)
+        assert queue_handlers(logger) == []
+
+    def test_drop_policy(self):
+        records = queue.Queue(1)
+        handler = BoundedQueueHandler(records, "drop")
+        record = logging.makeLogRecord({"msg": "x"})
+
+        handler.emit(record)
+        handler.emit(record)
+
+        assert records.qsize() == 1
+        assert handler.dropped == 1
+
+    def test_dropped_count_is_logged(self, logger, tmp_path):
+        job_logging = json_logging(logger, tmp_path / "job.jsonl", policy="drop")
+        job_logging.handler.dropped = 3
+        job_logging.close()
+
+        (record,) = read_lines(job_logging.path)
+        assert record["level"] == "WARNING"
+        assert record["message"].startswith("3 log records dropped")
+
+
+class TestJobSettingsLogging:
+    def test_log_json(self, config, logger, tmp_path):
+        shutil.copytree("./_data", tmp_path / "data")
+        config.update(
+            {
+                "base_dir": str(tmp_path / "data"),
+                "logger": logger,
+                "log_json": True,
+                "log_file": "algorithm.jsonl",
+            }
+        )
+
+        job_details = load_job_details(CustomParameters, config)
+        close_json_logging()
+
+        records = read_lines(job_details.paths.logs / "algorithm.jsonl")
+        assert records[-1]["message"].startswith("Job details loaded")
+
+    def test_disabled_by_default(self, job_details):
+        assert not (job_details.paths.logs / "job.jsonl").exists()
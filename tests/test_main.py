@@ -0,0 +1,44 @@
+import subprocess
+import sys
+
+import pytest
+
+import oceanprotocol_job_details
+from oceanprotocol_job_details.__main__ import main
+
+
+class TestLazyExports:
+    def test_import_is_lazy(self):
+        heavy = ["dependency_injector", "pydantic_settings", "aiofiles"]
+        code = (
+            "import sys, oceanprotocol_job_details; "
+            f"print([m for m in {heavy} if m in sys.modules])"
+        )
+        output = subprocess.check_output([sys.executable, "-c", code], text=True)
+        assert output.strip() == "[]"
+
+    @pytest.mark.parametrize("name", oceanprotocol_job_details.__all__)
+    def test_exports_resolve(self, name):
+        assert getattr(oceanprotocol_job_details, name) is not None
+        assert name in dir(oceanprotocol_job_details)
+
+    def test_unknown_export(self):
+        with pytest.raises(AttributeError):
+            oceanprotocol_job_details.unknown
+
+
+class TestProfileStartup:
+    def test_reports_phases(self, config, capsys):
+        args = ["--profile-startup", "--base-dir", config["base_dir"]]
+        args += ["--dids", config["dids"]]
+        args += ["--transformation-did", config["transformation_did"]]
+
+        assert main(args) == 0
+
+        output = capsys.readouterr().out
+        for phase in ["import", "settings", "files", "ddos", "total"]:
+            assert phase in output
+
+    def test_help_without_mode(self, capsys):
+        assert main([]) == 1
+        assert "--profile-startup" in capsys.readouterr().out
@@ -0,0 +1,81 @@
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from oceanprotocol_job_details.domain import DDO, LazyDDOMetadata
+from oceanprotocol_job_details.domain.metadata import parse_ddo
+from oceanprotocol_job_details.helpers import load_job_details
+from oceanprotocol_job_details.instrumentation import Instrumentation
+from tests.data import CustomParameters
+
+
+class TestLazyDDOMetadata:
+    def test_knows_dids_without_loading(self, job_details):
+        metadata = job_details.metadata
+        assert isinstance(metadata, LazyDDOMetadata)
+
+        did = job_details.files[0].did
+        assert list(metadata) == [did]
+        assert did in metadata
+        assert len(metadata) == 1
+        assert not metadata.is_loaded(did)
+
+    def test_loads_on_first_access_and_memoizes(self, job_details):
+        did, path = job_details.files[0].did, job_details.files[0].ddo
+        parse = MagicMock(side_effect=parse_ddo)
+        metadata = LazyDDOMetadata({did: path}, parse=parse)
+
+        ddo = metadata[did]
+        assert isinstance(ddo, DDO)
+        assert metadata.is_loaded(did)
+        assert metadata[did] is ddo
+        parse.assert_called_once()
+
+    def test_unknown_did(self, job_details):
+        with pytest.raises(KeyError):
+            job_details.metadata["unknown"]
+
+    @pytest.mark.asyncio
+    async def test_aload_all(self, job_details):
+        metadata = job_details.metadata
+        assert await metadata.aload_all() is metadata
+        assert all(metadata.is_loaded(did) for did in metadata)
+        assert metadata[job_details.files[0].did].id.startswith("did:op:")
+
+    @pytest.mark.asyncio
+    async def test_aget_memoizes(self, job_details):
+        did = job_details.files[0].did
+        ddo = await job_details.metadata.aget(did)
+        assert job_details.metadata[did] is ddo
+
+    def test_load_all_in_process_pool_matches_serial(self, config, job_details):
+        config.update({"ddo_executor": "process", "ddo_workers": 2})
+        process_job_details = load_job_details(CustomParameters, config)
+
+        did = job_details.files[0].did
+        assert process_job_details.metadata.is_loaded(did)
+        assert process_job_details.metadata[did] == job_details.metadata[did]
+
+    def test_load_all_in_does_not_validate_again(self, job_details):
+        did, path = job_details.files[0].did, job_details.files[0].ddo
+        metadata = LazyDDOMetadata({did: path})
+
+        with ThreadPoolExecutor() as executor:
+            with patch.object(DDO, "model_validate") as validate:
+                metadata.load_all_in(executor)
+
+        validate.assert_not_called()
+        assert metadata[did] == job_details.metadata[did]
+
+    def test_load_all_in_executor_records_phase(self, job_details):
+        did, path = job_details.files[0].did, job_details.files[0].ddo
+        instrumentation = Instrumentation()
+        metadata = LazyDDOMetadata({did: path}, instrumentation=instrumentation)
+
+        with ThreadPoolExecutor() as executor:
+            assert metadata.load_all_in(executor) is metadata
+
+        (stats,) = instrumentation.summary().values()
+        assert stats.file_count == 1
+        assert stats.bytes_read == path.stat().st_size
@@ -23,10 +23,10 @@ class TestReadInputParameters:
         assert "missing" in str(error)
 
     @patch("pathlib.Path.exists", return_value=True)
-    @patch("pathlib.Path.read_text", return_value="")
+    @patch("pathlib.Path.read_bytes", return_value=b"")
     def test_empty_file_returns_failure(self, mock_read, mock_exists):
         mock_paths = MagicMock()
-        mock_paths.algorithm_custom_parameters.read_text.return_value = ""
+        mock_paths.algorithm_custom_parameters.read_bytes.return_value = b""
 
         error = read_input_parameters(mock_paths, CustomParameters)
         assert isinstance(error, JobDetailsError)
@@ -35,19 +35,48 @@ class TestReadInputParameters:
     def test_invalid_json_returns_validation_error(self):
         mock_paths = MagicMock()
         mock_paths.algorithm_custom_parameters.exists.return_value = True
-        mock_paths.algorithm_custom_parameters.read_text.return_value = (
-            '{"name": "test"}'
+        mock_paths.algorithm_custom_parameters.read_bytes.return_value = (
+            b'{"name": "test"}'
         )
 
         error = read_input_parameters(mock_paths, CustomParameters)
         assert isinstance(error, JobDetailsError)
         assert isinstance(error.__cause__, ValidationError)
 
+    def test_whitespace_only_file_returns_failure(self):
+        mock_paths = MagicMock()
+        mock_paths.algorithm_custom_parameters.read_bytes.return_value = b" \n\t "
+
+        error = read_input_parameters(mock_paths, CustomParameters)
+        assert isinstance(error, JobDetailsError)
+        assert "empty" in str(error)
+
+    def test_surrounding_whitespace_is_ignored(self):
+        mock_paths = MagicMock()
+        mock_paths.algorithm_custom_parameters.read_bytes.return_value = (
+            b'\n  {"example": "data", "isTrue": true}  \n'
+        )
+
+        result = read_input_parameters(mock_paths, CustomParameters)
+        assert isinstance(result, CustomParameters)
+
+    def test_strict_disables_coercion(self):
+        mock_paths = MagicMock()
+        mock_paths.algorithm_custom_parameters.read_bytes.return_value = (
+            b'{"example": "data", "isTrue": "true"}'
+        )
+
+        assert read_input_parameters(mock_paths, CustomParameters).isTrue
+
+        error = read_input_parameters(mock_paths, CustomParameters, strict=True)
+        assert isinstance(error, JobDetailsError)
+        assert isinstance(error.__cause__, ValidationError)
+
     def test_valid_input_returns_success(self):
         mock_paths = MagicMock()
         mock_paths.algorithm_custom_parameters.exists.return_value = True
-        mock_paths.algorithm_custom_parameters.read_text.return_value = (
-            '{"example": "data", "isTrue": true}'
+        mock_paths.algorithm_custom_parameters.read_bytes.return_value = (
+            b'{"example": "data", "isTrue": true}'
         )
 
         result = read_input_parameters(mock_paths, CustomParameters)
@@ -72,7 +101,7 @@ class TestAReadInputParameters:
     @patch("aiofiles.open")
     async def test_empty_file_returns_failure(self, mock_open, mock_exists):
         mock_file = AsyncMock()
-        mock_file.read.return_value = ""
+        mock_file.read.return_value = b""
 
         mock_open.return_value.__aenter__.return_value = mock_file
 
@@ -86,7 +115,7 @@ class TestAReadInputParameters:
     @patch("aiofiles.open")
     async def test_invalid_json_returns_validation_error(self, mock_open):
         mock_file = AsyncMock()
-        mock_file.read.return_value = '{"foo": "bar"}'
+        mock_file.read.return_value = b'{"foo": "bar"}'
 
         mock_open.return_value.__aenter__.return_value = mock_file
 
@@ -100,7 +129,7 @@ class TestAReadInputParameters:
     @patch("aiofiles.open")
     async def test_valid_input_returns_success(self, mock_open):
         mock_file = AsyncMock()
-        mock_file.read.return_value = '{"example": "data", "isTrue": true}'
+        mock_file.read.return_value = b'{"example": "data", "isTrue": true}'
 
         mock_open.return_value.__aenter__.return_value = mock_file
 
@@ -113,15 +142,15 @@ class TestAReadInputParameters:
 
     def test_stringified_dict_custom_parameters_logic(job_details):
         """
-        Instead of tempfiles, we mock the 'read_text' to return stringified JSON
+        Instead of tempfiles, we mock the 'read_bytes' to return stringified JSON
         to verify Pydantic/logic handles it.
         """
         mock_paths = MagicMock()
         mock_paths.algorithm_custom_parameters.exists.return_value = True
         # Mimicking the complex stringified format from your previous test
-        mock_paths.algorithm_custom_parameters.read_text.return_value = json.dumps(
+        mock_paths.algorithm_custom_parameters.read_bytes.return_value = json.dumps(
             {"example": "data", "isTrue": True}
-        )
+        ).encode()
 
         result = read_input_parameters(mock_paths, CustomParameters)
         assert isinstance(result, CustomParameters)
@@ -0,0 +1,136 @@
+import gzip
+import shutil
+from importlib.util import find_spec
+from unittest.mock import patch
+
+import pytest
+
+from oceanprotocol_job_details.helpers import load_job_details
+from oceanprotocol_job_details.outputs import AsyncOutputWriter, OutputWriter
+from tests.data import CustomParameters
+
+
+class TestOutputWriter:
+    @pytest.mark.parametrize("background", [True, False])
+    def test_renamed_on_close(self, tmp_path, background):
+        path = tmp_path / "out" / "results.txt"
+
+        with OutputWriter(path, buffer_size=4, background=background) as writer:
+            writer.write(b"abc")
+            writer.write("défg")
+            writer.writelines(["h", "i"])
+            assert not path.exists()
+
+        assert path.read_text() == "abcdéfghi"
+        assert list(path.parent.iterdir()) == [path]
+
+    def test_mode_of_open(self, tmp_path):
+        with open(tmp_path / "expected.txt", "wb"):
+            pass
+        with OutputWriter(tmp_path / "results.txt") as writer:
+            writer.write(b"abc")
+
+        expected = (tmp_path / "expected.txt").stat().st_mode
+        assert (tmp_path / "results.txt").stat().st_mode == expected
+
+    def test_temporary_name_taken(self, tmp_path):
+        taken = tmp_path / ".results.txt.taken.tmp"
+        taken.write_text("other")
+
+        with patch(
+            "oceanprotocol_job_details.outputs.secrets.token_hex",
+            side_effect=["taken", "free"],
+        ):
+            with OutputWriter(tmp_path / "results.txt") as writer:
+                writer.write(b"abc")
+
+        assert taken.read_text() == "other"
+        assert (tmp_path / "results.txt").read_text() == "abc"
+
+    def test_failure_keeps_previous_file(self, tmp_path):
+        path = tmp_path / "results.txt"
+        path.write_text("previous")
+
+        with pytest.raises(RuntimeError):
+            with OutputWriter(path, buffer_size=1) as writer:
+                writer.write(b"partial")
+                raise RuntimeError
+
+        assert path.read_text() == "previous"
+        assert list(tmp_path.iterdir()) == [path]
+
+    def test_write_after_close(self, tmp_path):
+        writer = OutputWriter(tmp_path / "results.txt")
+        writer.close()
+        writer.close()
+
+        with pytest.raises(ValueError):
+            writer.write(b"late")
+
+    def test_background_error_is_raised(self, tmp_path):
+        writer = OutputWriter(tmp_path / "results.txt", buffer_size=1)
+        writer._raw.close()
+
+        with pytest.raises(ValueError):
+            writer.write(b"a")
+            writer.close()
+        assert not (tmp_path / "results.txt").exists()
+
+    def test_gzip(self, tmp_path):
+        path = tmp_path / "results.txt.gz"
+
+        with OutputWriter(path, "gzip", buffer_size=16) as writer:
+            for i in range(100):
+                writer.write(f"{i}\n")
+
+        assert gzip.decompress(path.read_bytes()).decode() == "".join(
+            f"{i}\n" for i in range(100)
+        )
+
+    @pytest.mark.skipif(find_spec("zstandard") is not None, reason="zstandard found")
+    def test_zstd_without_zstandard(self, tmp_path):
+        with pytest.raises(ImportError, match=r"\[zstd\]"):
+            OutputWriter(tmp_path / "results.zst", "zstd")
+        assert list(tmp_path.iterdir()) == []
+
+    @pytest.mark.skipif(find_spec("zstandard") is None, reason="zstandard missing")
+    def test_zstd(self, tmp_path):
+        import zstandard
+
+        path = tmp_path / "results.zst"
+        with OutputWriter(path, "zstd") as writer:
+            writer.write(b"x" * 1000)
+
+        reader = zstandard.ZstdDecompressor().stream_reader(path.read_bytes())
+        assert reader.read() == b"x" * 1000
+
+    async def test_async(self, tmp_path):
+        path = tmp_path / "results.txt"
+
+        async with AsyncOutputWriter(path, buffer_size=3) as writer:
+            for i in range(10):
+                await writer.write(str(i))
+            assert not path.exists()
+
+        assert path.read_text() == "0123456789"
+
+
+class TestJobDetailsOutputs:
+    @pytest.fixture
+    def job_details(self, config, tmp_path):
+        shutil.copytree("./_data", tmp_path / "data")
+        config.update({"base_dir": str(tmp_path / "data")})
+        yield load_job_details(CustomParameters, config)
+
+    def test_open_output(self, job_details):
+        with job_details.open_output("nested/results.gz", "gzip") as writer:
+            writer.write(b"done")
+
+        path = job_details.paths.outputs / "nested" / "results.gz"
+        assert gzip.decompress(path.read_bytes()) == b"done"
+
+    async def test_aopen_output(self, job_details):
+        async with job_details.aopen_output("results.txt") as writer:
+            await writer.write(b"done")
+
+        assert (job_details.paths.outputs / "results.txt").read_bytes() == b"done"
@@ -0,0 +1,49 @@
+import pytest
+
+from oceanprotocol_job_details.plugins import PluginRegistry, inject, register
+
+
+class Interface:
+    pass
+
+
+class TestPluginRegistry:
+    def test_resolution_is_memoized(self):
+        @register("memo")
+        class Plugin(Interface):
+            pass
+
+        assert isinstance(inject(Interface, "memo"), Plugin)
+        assert PluginRegistry._resolved[Interface, "memo"] is Plugin
+
+    def test_register_invalidates_resolution(self):
+        @register("override")
+        class First(Interface):
+            pass
+
+        assert PluginRegistry.get(Interface, "override") is First
+
+        @register("override")
+        class Second(Interface):
+            pass
+
+        assert PluginRegistry.get(Interface, "override") is Second
+
+    def test_register_keeps_other_resolutions(self):
+        @register("kept")
+        class Kept(Interface):
+            pass
+
+        assert PluginRegistry.get(Interface, "kept") is Kept
+
+        @register("later")
+        class Later(Interface):
+            pass
+
+        assert PluginRegistry._resolved[Interface, "kept"] is Kept
+        assert (Interface, "later") not in PluginRegistry._resolved
+        assert PluginRegistry.get(Interface, "later") is Later
+
+    def test_unsupported(self):
+        with pytest.raises(AssertionError, match="no plugin supporting"):
+            PluginRegistry.get(Interface, "unsupported")
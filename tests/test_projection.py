@@ -0,0 +1,61 @@
+import pytest
+
+from oceanprotocol_job_details.domain import DDO
+from oceanprotocol_job_details.domain.projection import projection
+from oceanprotocol_job_details.helpers import load_job_details
+from tests.data import CustomParameters
+
+
+class TestProjection:
+    def test_keeps_only_requested_fields(self):
+        model = projection(DDO, ["metadata.name", "services"])
+
+        assert set(model.model_fields) == {"metadata", "services"}
+        metadata = model.model_fields["metadata"].annotation
+        assert set(metadata.model_fields) == {"name"}
+
+    def test_nested_through_lists_and_optionals(self):
+        model = projection(DDO, ["services.files", "metadata.algorithm.language"])
+
+        services = model.model_fields["services"].annotation.__args__[0]
+        assert set(services.model_fields) == {"files"}
+
+    def test_aliases(self):
+        model = projection(DDO, ["@context"])
+        assert set(model.model_fields) == {"context"}
+
+    def test_unknown_field(self):
+        with pytest.raises(ValueError, match="metadata.unknown"):
+            projection(DDO, ["metadata.unknown"])
+
+    def test_leaf_field_has_no_nested_fields(self):
+        with pytest.raises(ValueError, match="id"):
+            projection(DDO, ["id.value"])
+
+    def test_memoized(self):
+        assert projection(DDO, ["id", "nft.name"]) is projection(
+            DDO, ["nft.name", "id"]
+        )
+
+    def test_projected_job_details(self, config, job_details):
+        projected = load_job_details(
+            CustomParameters,
+            config,
+            ddo_fields=["metadata.name", "services.files"],
+        )
+
+        did = job_details.files[0].did
+        ddo, full = projected.metadata[did], job_details.metadata[did]
+        assert ddo.metadata.name == full.metadata.name
+        assert ddo.services[0].files == full.services[0].files
+        assert not hasattr(ddo, "nft")
+
+    def test_projected_job_details_in_process_pool(self, config, job_details):
+        fields = ["metadata.name", "services.files"]
+        projected = load_job_details(CustomParameters, config, ddo_fields=fields)
+
+        config.update({"ddo_executor": "process", "ddo_workers": 2})
+        pooled = load_job_details(CustomParameters, config, ddo_fields=fields)
+
+        did = job_details.files[0].did
+        assert pooled.metadata[did] == projected.metadata[did]
@@ -0,0 +1,74 @@
+import pytest
+
+from oceanprotocol_job_details.domain import Paths
+from oceanprotocol_job_details.exceptions import MissingDDOError
+from oceanprotocol_job_details.helpers import load_job_details
+from oceanprotocol_job_details.scan import index_inputs, list_names, scan
+
+
+class TestIndexInputs:
+    def test_numeric_order_and_metadata(self, tmp_path):
+        for name in ["10", "2", "b.csv", "0", "a.csv", "1"]:
+            (tmp_path / name).write_bytes(b"x" * len(name))
+        (tmp_path / ".hidden").touch()
+        (tmp_path / "3").mkdir()
+
+        index = index_inputs(tmp_path)
+
+        assert [file.name for file in index] == [
+            "0",
+            "1",
+            "2",
+            "10",
+            ".hidden",
+            "a.csv",
+            "b.csv",
+        ]
+        assert [file.order for file in index] == [0, 1, 2, 10, None, None, None]
+        assert index[3].size == 2
+        assert index[0].mtime_ns == (tmp_path / "0").stat().st_mtime_ns
+
+    def test_missing_directory(self, tmp_path):
+        assert index_inputs(tmp_path / "missing") == ()
+
+    def test_same_entries_as_glob_but_directories(self, tmp_path):
+        for name in [".hidden", "0", "data.csv"]:
+            (tmp_path / name).touch()
+        (tmp_path / "nested").mkdir()
+
+        globbed = {path.name for path in tmp_path.glob("*") if path.is_file()}
+        assert {file.name for file in index_inputs(tmp_path)} == globbed
+        assert list_names(tmp_path) == globbed
+        assert list_names(tmp_path, dirs=True) == {"nested"}
+
+
+class TestScan:
+    def test_reports_every_missing_ddo(self, tmp_path):
+        (tmp_path / "ddos").mkdir()
+        (tmp_path / "ddos" / "present").touch()
+
+        with pytest.raises(MissingDDOError) as error:
+            scan(Paths(tmp_path), ["missing1", "present", "missing2"])
+
+        assert error.value.dids == ["missing1", "missing2"]
+        assert isinstance(error.value, FileNotFoundError)
+
+    def test_builds_did_paths(self, tmp_path):
+        for did in ["a", "b"]:
+            (tmp_path / "ddos").mkdir(exist_ok=True)
+            (tmp_path / "ddos" / did).touch()
+        (tmp_path / "inputs" / "a").mkdir(parents=True)
+        (tmp_path / "inputs" / "a" / "0").write_bytes(b"data")
+
+        a, b = scan(Paths(tmp_path), ["a", "b"])
+
+        assert a.ddo == tmp_path / "ddos" / "a"
+        assert a.input_files == [tmp_path / "inputs" / "a" / "0"]
+        assert a.total_bytes == 4
+        assert b.input_files == [] and b.index == ()
+
+    def test_missing_ddo_through_loader(self, config):
+        config.update({"dids": ["missing"]})
+
+        with pytest.raises(MissingDDOError):
+            load_job_details(None, config)
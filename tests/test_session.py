@@ -0,0 +1,67 @@
+import shutil
+
+import pytest
+
+from oceanprotocol_job_details import JobDetailsSession
+from oceanprotocol_job_details.exceptions import JobDetailsError
+from oceanprotocol_job_details.helpers import load_job_details
+from tests.data import CustomParameters
+
+DID = "17feb697190d9f5912e064307006c06019c766d35e4e3f239ebb69fb71096e42"
+
+
+@pytest.fixture(scope="function")
+def base_dirs(tmp_path):
+    base_dirs = []
+    for i in range(3):
+        base_dir = tmp_path / f"job{i}"
+        shutil.copytree("./_data", base_dir)
+        base_dirs.append(base_dir)
+    yield base_dirs
+
+
+@pytest.fixture(scope="function")
+def session(config):
+    config = {key: value for key, value in config.items() if key != "base_dir"}
+    with JobDetailsSession(CustomParameters, config, max_workers=2) as session:
+        yield session
+
+
+class TestJobDetailsSession:
+    def test_load_matches_load_job_details(self, session, base_dirs, config):
+        for base_dir in base_dirs:
+            expected = load_job_details(
+                CustomParameters, {**config, "base_dir": str(base_dir)}
+            )
+            assert session.load(base_dir) == expected
+
+    @pytest.mark.parametrize("executor", ["serial", "thread", "process"])
+    def test_load_many(self, session, base_dirs, executor):
+        results = session.load_many(base_dirs, executor=executor)
+
+        assert [job.paths.base_dir for job in results] == base_dirs
+        assert results == [session.load(base_dir) for base_dir in base_dirs]
+        assert all(job.metadata[DID] == results[0].metadata[DID] for job in results)
+
+    def test_reuses_container_per_thread(self, session, base_dirs):
+        session.load(base_dirs[0])
+        container = session._container()
+        session.load(base_dirs[1])
+        assert session._container() is container
+
+    def test_detects_dids_per_directory(self, base_dirs):
+        (base_dirs[1] / "ddos" / DID).rename(base_dirs[1] / "ddos" / "other")
+
+        with JobDetailsSession(config={"transformation_did": "1234"}) as session:
+            first, second = session.load_many(base_dirs[:2])
+
+        assert list(first.metadata) == [DID]
+        assert list(second.metadata) == ["other"]
+
+    def test_strict_setting(self, base_dirs, config):
+        config = {key: value for key, value in config.items() if key != "base_dir"}
+        with JobDetailsSession(CustomParameters, {**config, "strict": True}) as session:
+            job_details = session.load(base_dirs[0])
+
+        assert job_details.strict
+        assert isinstance(job_details.read(), JobDetailsError)
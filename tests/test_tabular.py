@@ -0,0 +1,117 @@
+from importlib.util import find_spec
+from types import SimpleNamespace
+
+import pytest
+
+from oceanprotocol_job_details.exceptions import UnknownFormatError
+from oceanprotocol_job_details.loaders import TableReader
+from oceanprotocol_job_details.loaders.table_reader import batch_rows
+from oceanprotocol_job_details.plugins import register
+from oceanprotocol_job_details.tabular import iter_batches, sniff_format, to_numpy
+
+
+class TestSniffFormat:
+    @pytest.mark.parametrize(
+        "contents, expected",
+        [
+            (b"PAR1\x15\x04", "parquet"),
+            (b"\x93NUMPY\x01\x00", "npy"),
+            (b"a,b\n1,2\n", "csv"),
+            ("ä;ö\n1;2\n".encode(), "csv"),
+        ],
+    )
+    def test_from_contents(self, tmp_path, contents, expected):
+        path = tmp_path / "0"
+        path.write_bytes(contents)
+        assert sniff_format(path) == expected
+
+    def test_text_cut_mid_character(self, tmp_path):
+        path = tmp_path / "0"
+        path.write_bytes(b"a" * 4095 + "é".encode())
+        assert sniff_format(path) == "csv"
+
+    def test_from_suffix(self, tmp_path):
+        path = tmp_path / "empty.parquet"
+        path.touch()
+        assert sniff_format(path) == "parquet"
+
+    def test_unknown_binary(self, tmp_path):
+        path = tmp_path / "0"
+        path.write_bytes(b"\x00\x01\x02\xff")
+        with pytest.raises(UnknownFormatError):
+            sniff_format(path)
+
+
+class TestTableReaders:
+    def test_batch_rows(self):
+        assert batch_rows(100, 1000) == 10
+        assert batch_rows(2000, 1000) == 1
+        assert batch_rows(0, 1000) == 1000
+
+    def test_custom_format_plugin(self, tmp_path):
+        @register("lines")
+        class LinesReader(TableReader):
+            def load(self):
+                yield from self.path.read_text().splitlines()
+
+        path = tmp_path / "0"
+        path.write_text("a\nb\n")
+        assert list(iter_batches(path, format="lines")) == ["a", "b"]
+
+    def test_to_numpy(self):
+        column = SimpleNamespace(to_numpy=lambda zero_copy_only: [1, 2])
+        schema = SimpleNamespace(names=["a"])
+        batch = SimpleNamespace(columns=[column], schema=schema)
+
+        assert to_numpy(batch) == {"a": [1, 2]}
+        assert to_numpy(["a", "b"]) == ["a", "b"]
+
+    def test_csv(self, tmp_path):
+        pa = pytest.importorskip("pyarrow")
+
+        path = tmp_path / "0"
+        path.write_text("a;b\n" + "".join(f"{i};{i * 2}\n" for i in range(1000)))
+
+        batches = list(iter_batches(path, batch_bytes=1024))
+        assert len(batches) > 1
+        table = pa.Table.from_batches(batches)
+        assert table.column("b").to_pylist() == [i * 2 for i in range(1000)]
+
+    def test_parquet(self, tmp_path):
+        pa = pytest.importorskip("pyarrow")
+        pq = pytest.importorskip("pyarrow.parquet")
+
+        path = tmp_path / "0"
+        pq.write_table(pa.table({"a": list(range(10_000))}), path)
+
+        batches = list(iter_batches(path, batch_bytes=8 * 1000))
+        assert len(batches) > 1
+        assert sum(batch.num_rows for batch in batches) == 10_000
+
+    def test_npy(self, tmp_path):
+        np = pytest.importorskip("numpy")
+
+        path = tmp_path / "0"
+        array = np.arange(3000, dtype=np.int64).reshape(1000, 3)
+        with open(path, "wb") as f:
+            np.save(f, array)
+
+        batches = list(iter_batches(path, batch_bytes=24 * 100))
+        assert [len(batch) for batch in batches] == [100] * 10
+        assert (np.concatenate(batches) == array).all()
+
+    @pytest.mark.skipif(find_spec("pyarrow") is not None, reason="pyarrow installed")
+    def test_missing_optional_dependency(self, tmp_path):
+        path = tmp_path / "0"
+        path.write_text("a,b\n1,2\n")
+
+        with pytest.raises(ImportError, match=r"\[tabular\]"):
+            list(iter_batches(path))
+
+    def test_input_batches_as_numpy(self, job_details):
+        pytest.importorskip("pyarrow")
+
+        ((did, path),) = job_details.inputs()
+        for batch_did, batch_path, batch in job_details.input_batches(as_numpy=True):
+            assert (batch_did, batch_path) == (did, path)
+            assert isinstance(batch, dict)
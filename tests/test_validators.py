@@ -0,0 +1,53 @@
+from unittest.mock import patch
+
+import pytest
+from pydantic import BaseModel, ConfigDict, ValidationError
+
+from oceanprotocol_job_details.helpers import load_job_details
+from oceanprotocol_job_details.validators import input_validator, warm_up
+from tests.data import CustomParameters
+
+
+class Deferred(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    example: str
+
+
+class TestInputValidator:
+    def test_cached_per_type(self):
+        assert input_validator(CustomParameters) is input_validator(CustomParameters)
+
+    def test_validate_json(self):
+        raw = b'{"example": "x", "isTrue": "true"}'
+        parameters = input_validator(CustomParameters).validate_json(raw)
+
+        assert parameters == CustomParameters(example="x", isTrue=True)
+        with pytest.raises(ValidationError):
+            input_validator(CustomParameters).validate_json(raw, strict=True)
+
+    def test_warm_up_builds_deferred_schema(self):
+        warm_up(None, Deferred)
+
+        assert not Deferred.__pydantic_complete__
+        assert input_validator(Deferred).core_schema["type"] != "mock"
+
+    def test_job_details_read(self, job_details):
+        with patch(
+            "oceanprotocol_job_details.ocean.input_validator", wraps=input_validator
+        ) as validator:
+            parameters = job_details.read().input_parameters
+
+        validator.assert_called_once_with(CustomParameters)
+        assert isinstance(parameters, CustomParameters)
+
+    def test_warmed_up_by_the_loader(self, config):
+        class Loaded(Deferred):
+            pass
+
+        with patch(
+            "oceanprotocol_job_details.validators.TypeAdapter.rebuild"
+        ) as rebuild:
+            load_job_details(Loaded, config)
+
+        rebuild.assert_called_once()